@@ -0,0 +1,107 @@
+"""Shared fixtures: a KeepClient backed by an in-memory fake of Google Keep."""
+
+import copy
+import time
+
+import gkeepapi
+import gpsoauth
+import pytest
+
+from wlater_mcp.keep_client import KeepClient
+
+
+WORDS = "milk eggs bread groceries meeting project alpha beta gamma dentist call plan trip packing shoes".split()
+
+
+class FakeKeepServer:
+    """Minimal stand-in for the Keep changes endpoint.
+
+    Every node write gets its own version and responses are paged, so a
+    sync spans several requests like it does against Google.
+    """
+
+    def __init__(self, page_size: int = 7, latency: float = 0.0):
+        self.page_size = page_size
+        self.latency = latency
+        self.version = 0
+        # node id -> (version, raw node)
+        self.nodes = {}
+        self.labels = {}
+
+    def seed(self, n_notes: int = 20, n_lists: int = 3) -> None:
+        """Create notes, lists and labels on the server."""
+        keep = gkeepapi.Keep()
+        work = keep.createLabel("Work")
+        home = keep.createLabel("Home")
+        for i in range(n_notes):
+            note = keep.createNote(f"Note {i} {WORDS[i % len(WORDS)]}", " ".join(WORDS[i % 5:i % 5 + 8]))
+            if i % 3 == 0:
+                note.labels.add(work)
+        for j in range(n_lists):
+            lst = keep.createList(f"List {j}", [(WORDS[(j + k) % len(WORDS)], k % 2 == 0) for k in range(5)])
+            lst.labels.add(home)
+
+        for note in keep.all():
+            for raw in [note.save()] + [child.save() for child in note.children]:
+                self._store(raw)
+        for label in keep.labels():
+            self.labels[label.id] = label.save()
+
+    def _store(self, raw: dict) -> None:
+        self.version += 1
+        raw = copy.deepcopy(raw)
+        raw.setdefault("serverId", "s" + raw["id"])
+        raw["baseVersion"] = self.version
+        self.nodes[raw["id"]] = (self.version, raw)
+
+    def rename_notes(self, note_ids, title: str) -> None:
+        """Change the title of notes on the server, as another device would."""
+        for note_id in note_ids:
+            raw = copy.deepcopy(self.nodes[note_id][1])
+            raw["title"] = title
+            self._store(raw)
+
+    def changes(self, target_version=None, nodes=None, labels=None):
+        if self.latency:
+            time.sleep(self.latency)
+        for raw in nodes or []:
+            self._store(raw)
+        if labels:
+            for label in labels:
+                self.labels[label["mainId"]] = copy.deepcopy(label)
+
+        since = int(target_version or 0)
+        newer = sorted((version, node_id) for node_id, (version, _) in self.nodes.items() if version > since)
+        page = newer[:self.page_size]
+        response = {
+            "toVersion": str(page[-1][0] if page else max(since, self.version)),
+            "truncated": len(newer) > self.page_size,
+            "nodes": [copy.deepcopy(self.nodes[node_id][1]) for _, node_id in page]
+        }
+        if since == 0:
+            response["userInfo"] = {"labels": copy.deepcopy(list(self.labels.values()))}
+        return response
+
+
+@pytest.fixture
+def keep_server(monkeypatch, tmp_path):
+    """Fake Google Keep server; state files go to a temporary home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+    server = FakeKeepServer()
+    monkeypatch.setattr(gkeepapi.KeepAPI, "changes", lambda self, **kwargs: server.changes(**kwargs))
+    monkeypatch.setattr(
+        gpsoauth, "perform_oauth",
+        lambda *args, **kwargs: {"Auth": "token", "Expiry": str(int(time.time()) + 3600)}
+    )
+    return server
+
+
+@pytest.fixture
+def keep_client(keep_server):
+    """KeepClient synced with a seeded fake server."""
+    keep_server.seed()
+    client = KeepClient("user@example.com", "aas_et/test", "0123456789abcdef")
+    yield client
+    client.close()
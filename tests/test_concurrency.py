@@ -0,0 +1,222 @@
+"""Reader/writer locking of the shared Keep client."""
+
+import random
+import threading
+import time
+
+import pytest
+from gkeepapi import node as _node
+
+from wlater_mcp.concurrency import RWLock
+
+
+def _start(target):
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_readers_share_the_lock():
+    lock = RWLock()
+    inside = threading.Barrier(3, timeout=2)
+
+    def reader():
+        with lock.read():
+            inside.wait()
+
+    threads = [_start(reader) for _ in range(3)]
+    for thread in threads:
+        thread.join(2)
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_waiting_writer_blocks_new_readers():
+    lock = RWLock()
+    order = []
+    first_reader_in = threading.Event()
+    release_first_reader = threading.Event()
+
+    def first_reader():
+        with lock.read():
+            first_reader_in.set()
+            release_first_reader.wait(2)
+        order.append("first reader out")
+
+    def writer():
+        with lock.write():
+            order.append("writer")
+
+    def late_reader():
+        with lock.read():
+            order.append("late reader")
+
+    threads = [_start(first_reader)]
+    first_reader_in.wait(2)
+    threads.append(_start(writer))
+    # Let the writer start waiting before the late reader arrives
+    while not lock._waiting_writers:
+        time.sleep(0.001)
+    threads.append(_start(late_reader))
+    time.sleep(0.05)
+    assert "late reader" not in order
+
+    release_first_reader.set()
+    for thread in threads:
+        thread.join(2)
+    assert order == ["first reader out", "writer", "late reader"]
+
+
+def test_lock_is_reentrant():
+    lock = RWLock()
+    with lock.read():
+        with lock.read():
+            pass
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+
+    # Fully released: another thread can write
+    done = threading.Event()
+
+    def writer():
+        with lock.write():
+            done.set()
+
+    thread = _start(writer)
+    assert done.wait(2)
+    thread.join(2)
+
+
+def test_upgrading_a_read_lock_is_refused():
+    lock = RWLock()
+    with lock.read():
+        with pytest.raises(RuntimeError):
+            with lock.write():
+                pass
+
+
+def test_reads_wait_while_a_sync_is_applied(keep_client, monkeypatch):
+    applying = threading.Event()
+    finish_apply = threading.Event()
+    original_apply = keep_client.keep.apply_deferred
+
+    def slow_apply():
+        applying.set()
+        finish_apply.wait(2)
+        original_apply()
+
+    monkeypatch.setattr(keep_client.keep, "apply_deferred", slow_apply)
+
+    sync = _start(keep_client.refresh_from_server)
+    assert applying.wait(2)
+
+    read_done = threading.Event()
+    reader = _start(lambda: (keep_client.get_all_notes(), read_done.set()))
+    assert not read_done.wait(0.1)
+
+    finish_apply.set()
+    assert read_done.wait(2)
+    sync.join(2)
+    reader.join(2)
+
+
+def test_media_link_request_does_not_hold_the_read_lock(keep_client, monkeypatch):
+    note = keep_client.keep.all()[0]
+    blob = _node.Blob(parent_id=note.id)
+    blob.blob = _node.NodeImage()
+    note.append(blob)
+
+    requesting = threading.Event()
+    finish_request = threading.Event()
+
+    def slow_media_link(blob):
+        requesting.set()
+        finish_request.wait(2)
+        return "https://example.com/media"
+
+    monkeypatch.setattr(keep_client.keep, "getMediaLink", slow_media_link)
+
+    results = []
+    request = _start(lambda: results.append(keep_client.get_media_link(note.id, blob.id)))
+    assert requesting.wait(2)
+
+    # A sync applying its pages is not held up by the request
+    writer_done = threading.Event()
+
+    def writer():
+        with keep_client._rw.write():
+            writer_done.set()
+
+    _start(writer)
+    assert writer_done.wait(1)
+
+    finish_request.set()
+    request.join(2)
+    assert results[0]["success"]
+    assert results[0]["media_type"] == "image"
+
+
+def test_reads_never_see_a_partial_sync(keep_client, keep_server):
+    keep_server.latency = 0.002
+    note_ids = [note.id for note in keep_client.keep.all()]
+    # Another device renames these notes between syncs; the local mutator
+    # edits the others, since the fake server has no conflict merging
+    renamed_ids = set(note_ids[::2])
+    mutated_ids = [note_id for note_id in note_ids if note_id not in renamed_ids]
+    keep_server.rename_notes(renamed_ids, "gen0 title")
+    assert keep_client.refresh_from_server()["success"]
+
+    stop = threading.Event()
+    errors = []
+    torn_reads = []
+    counts = {"reads": 0, "syncs": 0}
+
+    def reader():
+        while not stop.is_set():
+            try:
+                notes = [
+                    n for n in keep_client.get_all_notes(fields=["note_id", "title"])
+                    if n.get("note_id") in renamed_ids
+                ]
+                generations = {note["title"].split()[0] for note in notes}
+                if len(generations) != 1 or len(notes) != len(renamed_ids):
+                    torn_reads.append(generations)
+                hits = [
+                    n for n in keep_client.search_notes(query="title", limit=1000, fields=["note_id", "title"])
+                    if n.get("note_id") in renamed_ids
+                ]
+                generations = {hit["title"].split()[0] for hit in hits}
+                if len(generations) != 1 or len(hits) != len(renamed_ids):
+                    torn_reads.append(generations)
+                keep_client.get_note(random.choice(note_ids))
+                keep_client.get_labels()
+                counts["reads"] += 1
+            except Exception as e:
+                errors.append(repr(e))
+
+    def syncer():
+        generation = 0
+        while not stop.is_set():
+            generation += 1
+            keep_server.rename_notes(renamed_ids, f"gen{generation} title")
+            result = keep_client.refresh_from_server()
+            if not result["success"]:
+                errors.append(result["message"])
+            counts["syncs"] += 1
+
+    def mutator():
+        while not stop.is_set():
+            result = keep_client.update_note_pinned(random.choice(mutated_ids), random.random() < 0.5)
+            if not result["success"]:
+                errors.append(result["message"])
+
+    threads = [_start(reader) for _ in range(4)] + [_start(syncer), _start(mutator)]
+    time.sleep(2)
+    stop.set()
+    for thread in threads:
+        thread.join(10)
+
+    assert not errors
+    assert not torn_reads
+    assert counts["reads"] > 0 and counts["syncs"] > 0
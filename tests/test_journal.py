@@ -0,0 +1,138 @@
+"""Journaling of unsynced modifications and replay after a restart."""
+
+import shutil
+import threading
+
+import pytest
+
+from wlater_mcp.journal import Journal, get_journal_path
+from wlater_mcp.keep_client import KeepClient
+
+
+@pytest.fixture
+def restart(keep_client):
+    """Close a client as if the process exited and start a new one."""
+    clients = []
+
+    def restart(client):
+        client.close()
+        new_client = KeepClient(client.email, client.keep.getMasterToken(), "0123456789abcdef")
+        clients.append(new_client)
+        return new_client
+
+    yield restart
+    for client in clients:
+        client.close()
+
+
+def _titles(client):
+    return sorted(note.title for note in client.keep.all())
+
+
+def test_unsynced_edits_are_replayed_after_a_restart(keep_client, restart):
+    note_id = keep_client.keep.all()[0].id
+    assert keep_client.update_note_title(note_id, "Renamed")["success"]
+    assert keep_client.create_note("Fresh", "not synced yet")["success"]
+    titles = _titles(keep_client)
+
+    client = restart(keep_client)
+
+    assert _titles(client) == titles
+    assert client.keep.get(note_id).title == "Renamed"
+    pending = client.get_pending_changes()
+    assert {change["note_title"] for change in pending["changes"]} == {"Renamed", "Fresh"}
+    # The replayed edits are journaled again for the next restart
+    assert len(client._journal.read()) == 2
+
+
+def test_replay_maps_ids_of_created_nodes(keep_client, restart):
+    created = keep_client.create_list("Trip", [{"text": "socks"}])["preview"]
+    old_list_id = created["list_id"]
+    assert keep_client.add_list_item(old_list_id, "tent")["success"]
+    label_id = keep_client.create_label("Travel")["preview"]["label_id"]
+    assert keep_client.add_label_to_note(old_list_id, "Travel")["success"]
+
+    client = restart(keep_client)
+
+    lists = [note for note in client.keep.all() if note.title == "Trip"]
+    assert len(lists) == 1
+    trip = lists[0]
+    # Created again under new IDs; later records follow them
+    assert trip.id != old_list_id
+    assert client.keep.getLabel(label_id) is None
+    assert sorted(item.text for item in trip.items) == ["socks", "tent"]
+    assert [label.name for label in trip.labels.all()] == ["Travel"]
+
+
+def test_creations_already_synced_are_not_replayed(keep_client, keep_server, restart):
+    assert keep_client.create_note("Once", "")["success"]
+    # The sync reaches Google but the process dies before the journal is emptied
+    journal_copy = get_journal_path().with_name("journal-copy")
+    shutil.copy(get_journal_path(), journal_copy)
+    assert keep_client.sync_changes()["success"]
+    shutil.copy(journal_copy, get_journal_path())
+
+    client = restart(keep_client)
+
+    assert _titles(client).count("Once") == 1
+    assert client.sync_changes()["success"]
+    assert [raw.get("title") for _, raw in keep_server.nodes.values()].count("Once") == 1
+
+
+def test_journal_is_emptied_by_a_sync(keep_client, keep_server, restart):
+    note_id = keep_client.keep.all()[0].id
+    assert keep_client.update_note_title(note_id, "Renamed")["success"]
+    assert keep_client.journal_status()["unsynced_records"] == 1
+
+    assert keep_client.sync_changes()["success"]
+    assert keep_client.journal_status()["unsynced_records"] == 0
+    assert keep_client._journal.read() == []
+    assert keep_server.nodes[note_id][1]["title"] == "Renamed"
+
+    client = restart(keep_client)
+    assert client.get_pending_changes()["has_changes"] is False
+
+
+def test_status_does_not_wait_for_an_fsync(tmp_path, monkeypatch):
+    journal = Journal(tmp_path / "journal")
+    journal.commit(journal.append({"op": "update_note_title"}))
+
+    fsyncing = threading.Event()
+    finish_fsync = threading.Event()
+
+    def slow_fsync(fd):
+        fsyncing.set()
+        finish_fsync.wait(2)
+
+    monkeypatch.setattr("wlater_mcp.journal.os.fsync", slow_fsync)
+    truncate = threading.Thread(target=journal.truncate, daemon=True)
+    truncate.start()
+    assert fsyncing.wait(2)
+
+    status = {}
+    reader = threading.Thread(target=lambda: status.update(journal.status()), daemon=True)
+    reader.start()
+    reader.join(1)
+    assert status["fsyncs"] == 1
+
+    finish_fsync.set()
+    truncate.join(2)
+    assert journal.status()["unsynced_records"] == 0
+
+
+def test_commit_runs_after_the_client_lock_is_released(keep_client, monkeypatch):
+    held_during_commit = []
+    commit = keep_client._journal.commit
+
+    def checking_commit(ticket):
+        held_during_commit.append(keep_client._lock._is_owned())
+        commit(ticket)
+
+    monkeypatch.setattr(keep_client._journal, "commit", checking_commit)
+
+    item_id = next(iter(keep_client._items))
+    assert keep_client.update_item_checked(item_id, True)["success"]
+    note_id = keep_client.keep.all()[0].id
+    assert keep_client.update_note_pinned(note_id, True)["success"]
+
+    assert held_during_commit == [False, False]
@@ -0,0 +1,100 @@
+"""Sort keys of items added to a list with add_list_items."""
+
+import pytest
+
+
+@pytest.fixture
+def shopping(keep_client):
+    """A synced list with items "one" to "four", top to bottom."""
+    created = keep_client.create_list("Shopping", [{"text": text} for text in ("one", "two", "three", "four")])
+    assert keep_client.sync_changes()["success"]
+    return keep_client.keep.get(created["preview"]["list_id"])
+
+
+def _order(note):
+    """Item texts in the order Keep shows them (highest sort first)."""
+    items = [item for item in note.items if not item.deleted]
+    assert len({int(item.sort) for item in items}) == len(items), "sort keys must be unique"
+    return [item.text for item in sorted(items, key=lambda item: -int(item.sort))]
+
+
+def _item_id(note, text):
+    return next(item.id for item in note.items if item.text == text)
+
+
+def test_add_at_top(keep_client, shopping):
+    result = keep_client.add_list_items(shopping.id, ["a", "b"], position="top")
+    assert result["success"]
+    assert [item["text"] for item in result["preview"]["new_items"]] == ["a", "b"]
+    assert _order(shopping) == ["a", "b", "one", "two", "three", "four"]
+    assert "items_moved" not in result["preview"]
+
+
+def test_add_at_bottom(keep_client, shopping):
+    assert keep_client.add_list_items(shopping.id, ["a", {"text": "b", "checked": True}])["success"]
+    assert _order(shopping) == ["one", "two", "three", "four", "a", "b"]
+    assert [item.checked for item in shopping.items if item.text in ("a", "b")] == [False, True]
+
+
+def test_add_after_an_item(keep_client, shopping):
+    result = keep_client.add_list_items(shopping.id, ["a", "b"], position="after", after_item_id=_item_id(shopping, "two"))
+    assert result["success"]
+    assert _order(shopping) == ["one", "two", "a", "b", "three", "four"]
+
+
+def test_add_after_the_last_item(keep_client, shopping):
+    keep_client.add_list_items(shopping.id, ["a"], position="after", after_item_id=_item_id(shopping, "four"))
+    assert _order(shopping) == ["one", "two", "three", "four", "a"]
+
+
+def test_add_after_an_item_of_another_list(keep_client, shopping):
+    other = keep_client.create_list("Other", [{"text": "x"}])["preview"]
+    result = keep_client.add_list_items(shopping.id, ["a"], position="after", after_item_id=other["items"][0]["item_id"])
+    assert not result["success"]
+
+
+def test_exhausted_gap_moves_the_items_below(keep_client, shopping):
+    two = next(item for item in shopping.items if item.text == "two")
+    three = next(item for item in shopping.items if item.text == "three")
+    # Leave no room between "two" and "three"
+    three.sort = int(two.sort) - 1
+    four = next(item for item in shopping.items if item.text == "four")
+    four_sort = int(four.sort)
+
+    result = keep_client.add_list_items(shopping.id, ["a", "b"], position="after", after_item_id=two.id)
+    assert result["success"]
+    assert _order(shopping) == ["one", "two", "a", "b", "three", "four"]
+
+    moved = {item["text"]: item for item in result["preview"]["items_moved"]}
+    assert set(moved) == {"three", "four"}
+    assert moved["four"]["old_sort"] == four_sort
+    assert moved["four"]["new_sort"] == int(four.sort) < four_sort
+
+    # Moved items are pushed by the next sync, so they are reported
+    change = next(c for c in keep_client.get_pending_changes()["changes"] if c["note_id"] == shopping.id)
+    assert {item["text"] for item in change["items_moved"]} == {"three", "four"}
+    assert "2 item(s) moved" in change["details"]
+
+
+def test_repeated_inserts_after_one_item(keep_client, keep_server, shopping):
+    anchor = _item_id(shopping, "two")
+    inserted = []
+    moves = 0
+    for i in range(40):
+        result = keep_client.add_list_items(shopping.id, [f"n{i}", f"m{i}"], position="after", after_item_id=anchor)
+        assert result["success"]
+        moves += bool(result["preview"].get("items_moved"))
+        inserted[0:0] = [f"n{i}", f"m{i}"]
+        assert _order(shopping) == ["one", "two"] + inserted + ["three", "four"]
+    # The gap halves with every insert, so it ran out more than once
+    assert moves > 1
+
+    # Items added and then moved before a sync are reported where they land
+    change = next(c for c in keep_client.get_pending_changes()["changes"] if c["note_id"] == shopping.id)
+    sorts = {item.id: int(item.sort) for item in shopping.items}
+    assert all(item["sort"] == sorts[item["item_id"]] for item in change["items_added"])
+    assert {item["text"] for item in change["items_moved"]} == {"three", "four"}
+
+    assert keep_client.sync_changes()["success"]
+    for item in shopping.items:
+        assert int(keep_server.nodes[item.id][1]["sortValue"]) == int(item.sort)
@@ -0,0 +1,126 @@
+"""Caching the OAuth access token in the credential store."""
+
+import json
+import threading
+import time
+
+import gpsoauth
+import keyring
+import pytest
+from keyring.backend import KeyringBackend
+
+from wlater_mcp import token_cache
+from wlater_mcp.credentials import get_config_path, generate_token_key
+from wlater_mcp.token_cache import CachingAuth, load_token, save_token
+
+
+ACCOUNT = ("user@example.com", "aas_et/test", "0123456789abcdef", "oauth2:scope")
+
+
+class MemoryKeyring(KeyringBackend):
+    """Keyring backend that can be made to hang."""
+
+    priority = 1
+
+    def __init__(self):
+        super().__init__()
+        self.passwords = {}
+        self.stuck = threading.Event()
+        self.release = threading.Event()
+
+    def _wait(self):
+        if self.stuck.is_set():
+            self.release.wait(5)
+
+    def get_password(self, service, username):
+        self._wait()
+        return self.passwords.get((service, username))
+
+    def set_password(self, service, username, password):
+        self._wait()
+        self.passwords[(service, username)] = password
+
+    def delete_password(self, service, username):
+        self._wait()
+        self.passwords.pop((service, username), None)
+
+
+@pytest.fixture
+def memory_keyring(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.delenv("WLATER_MASTER_TOKEN", raising=False)
+    monkeypatch.delenv("WLATER_TOKEN_KEY", raising=False)
+
+    backend = MemoryKeyring()
+    previous = keyring.get_keyring()
+    keyring.set_keyring(backend)
+    yield backend
+    backend.release.set()
+    keyring.set_keyring(previous)
+
+
+def _write_config(token_store):
+    get_config_path().write_text(json.dumps({
+        "email": ACCOUNT[0], "android_id": ACCOUNT[2], "token_store": token_store
+    }))
+
+
+def test_token_is_cached_in_the_keyring(memory_keyring):
+    _write_config("keyring")
+    expires_at = time.time() + 3600
+    save_token(*ACCOUNT, "access", expires_at)
+
+    assert load_token(*ACCOUNT) == ("access", expires_at)
+    assert not token_cache.get_token_cache_path().exists()
+    # Bound to the master token it was exchanged from
+    assert load_token(ACCOUNT[0], "aas_et/other", *ACCOUNT[2:]) is None
+
+
+def test_token_file_is_encrypted(memory_keyring, monkeypatch):
+    _write_config("encrypted_file")
+    monkeypatch.setenv("WLATER_TOKEN_KEY", generate_token_key())
+    expires_at = time.time() + 3600
+    save_token(*ACCOUNT, "access", expires_at)
+
+    assert b"access" not in token_cache.get_token_cache_path().read_bytes()
+    assert load_token(*ACCOUNT) == ("access", expires_at)
+
+    monkeypatch.setenv("WLATER_TOKEN_KEY", generate_token_key())
+    assert load_token(*ACCOUNT) is None
+
+
+def test_token_is_not_written_with_an_environment_master_token(memory_keyring, monkeypatch):
+    _write_config("keyring")
+    monkeypatch.setenv("WLATER_MASTER_TOKEN", ACCOUNT[1])
+    save_token(*ACCOUNT, "access", time.time() + 3600)
+
+    assert memory_keyring.passwords == {}
+    assert not token_cache.get_token_cache_path().exists()
+
+
+def test_stuck_keyring_does_not_block_authentication(memory_keyring, monkeypatch):
+    _write_config("keyring")
+    memory_keyring.stuck.set()
+    monkeypatch.setattr(
+        gpsoauth, "perform_oauth",
+        lambda *args, **kwargs: {"Auth": "access", "Expiry": str(int(time.time()) + 3600)}
+    )
+
+    auth = CachingAuth(ACCOUNT[3], keyring_timeout=0.1)
+    started = time.monotonic()
+    auth.load(*ACCOUNT[:3])
+    assert auth.getAuthToken() == "access"
+    # One timed out read and one timed out write, nothing unbounded
+    assert time.monotonic() - started < 1
+
+    # A refresh caches outside the refresh lock
+    saving = threading.Event()
+    monkeypatch.setattr(token_cache, "save_token", lambda *args: (saving.set(), memory_keyring.release.wait(5)))
+    refresher = threading.Thread(target=auth.refresh, daemon=True)
+    refresher.start()
+    assert saving.wait(2)
+    assert auth._refresh_lock.acquire(timeout=1)
+    auth._refresh_lock.release()
+    memory_keyring.release.set()
+    refresher.join(2)
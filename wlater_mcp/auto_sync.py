@@ -0,0 +1,190 @@
+"""Debounced write-behind sync for local modifications.
+
+Modification tools only stage changes locally. When auto-sync is enabled,
+every modification notifies an AutoSync instance, which waits until no new
+edit has arrived for a quiet window and then pushes all of them with a
+single sync. A maximum delay caps how long an edit can wait while edits
+keep arriving.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+logger = logging.getLogger("wlater")
+
+DEFAULT_QUIET_SECONDS = 5.0
+DEFAULT_MAX_DELAY_SECONDS = 30.0
+
+# Number of recent syncs kept for batching statistics
+RECENT_SYNCS = 20
+
+
+class AutoSync:
+    """Coalesce edits into one sync per quiet window.
+
+    The flush callback runs on a background thread and must raise on
+    failure. Whoever performs a sync (auto or manual) reports it through
+    mark_synced() so edits synced by an explicit sync_changes() are not
+    pushed again.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[], None],
+        quiet_seconds: float = DEFAULT_QUIET_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS
+    ):
+        """Create an idle auto-syncer; its thread starts on the first edit.
+
+        Args:
+            flush: Callable that syncs all staged changes
+            quiet_seconds: Sync once no edit has arrived for this long
+            max_delay_seconds: Sync at the latest this long after the
+                oldest unsynced edit
+        """
+        if quiet_seconds <= 0:
+            raise ValueError(f"Auto-sync quiet window must be positive, got {quiet_seconds}")
+        if max_delay_seconds < quiet_seconds:
+            raise ValueError(
+                f"Auto-sync max delay ({max_delay_seconds}s) must be at least "
+                f"the quiet window ({quiet_seconds}s)"
+            )
+
+        self._flush = flush
+        self.quiet_seconds = quiet_seconds
+        self.max_delay_seconds = max_delay_seconds
+
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._flushing = False
+
+        # Unsynced edits since the last sync
+        self._edits = 0
+        self._first_edit_at: Optional[float] = None
+        self._last_edit_at: Optional[float] = None
+
+        # Batching statistics
+        self._syncs = 0
+        self._edits_synced = 0
+        self._failures = 0
+        self._last_error: Optional[str] = None
+        self._recent: deque = deque(maxlen=RECENT_SYNCS)
+
+    def notify(self) -> None:
+        """Record one local edit and schedule a sync for it."""
+        with self._cond:
+            now = time.monotonic()
+            self._edits += 1
+            if self._first_edit_at is None:
+                self._first_edit_at = now
+            self._last_edit_at = now
+
+            if self._thread is None and not self._stopped:
+                self._thread = threading.Thread(target=self._run, name="wlater-auto-sync", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def mark_synced(self) -> None:
+        """Record that every edit so far was pushed by a successful sync."""
+        with self._cond:
+            if self._edits:
+                now = time.monotonic()
+                self._syncs += 1
+                self._edits_synced += self._edits
+                self._recent.append({
+                    "trigger": "auto" if self._flushing else "manual",
+                    "edits": self._edits,
+                    "oldest_edit_age_seconds": round(now - self._first_edit_at, 3)
+                })
+            self._edits = 0
+            self._first_edit_at = None
+            self._last_edit_at = None
+            self._cond.notify()
+
+    def _deadline(self) -> float:
+        """Monotonic time at which the pending edits are due (lock held)."""
+        return min(
+            self._last_edit_at + self.quiet_seconds,
+            self._first_edit_at + self.max_delay_seconds
+        )
+
+    def _run(self) -> None:
+        """Background loop: wait for a quiet window, then flush."""
+        while True:
+            with self._cond:
+                while not self._stopped and (not self._edits or time.monotonic() < self._deadline()):
+                    timeout = self._deadline() - time.monotonic() if self._edits else None
+                    self._cond.wait(timeout)
+
+                if self._stopped:
+                    return
+                self._flushing = True
+
+            # Flush without holding the condition so edits are never blocked
+            # on the network round trip
+            self._flush_once()
+
+    def _flush_once(self) -> None:
+        """Run the flush callback and record a failure (self._flushing set)."""
+        started = time.monotonic()
+        try:
+            self._flush()
+            logger.info(f"Auto-sync completed in {time.monotonic() - started:.2f}s")
+        except Exception as e:
+            logger.warning(f"Auto-sync failed, will retry after the quiet window: {e}")
+            with self._cond:
+                self._failures += 1
+                self._last_error = str(e)
+                # Back off for one quiet window before retrying
+                if self._edits:
+                    self._last_edit_at = time.monotonic()
+                    self._first_edit_at = self._last_edit_at
+        finally:
+            with self._cond:
+                self._flushing = False
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop the background thread, syncing outstanding edits first.
+
+        Args:
+            flush: Sync any unsynced edits before returning
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+            thread = self._thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        with self._cond:
+            pending = self._edits
+
+        if flush and pending:
+            logger.info(f"Flushing {pending} unsynced edit(s) before shutdown")
+            with self._cond:
+                self._flushing = True
+            self._flush_once()
+
+    def status(self) -> Dict[str, Any]:
+        """Return configuration, unsynced edits and batching statistics."""
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "enabled": True,
+                "quiet_seconds": self.quiet_seconds,
+                "max_delay_seconds": self.max_delay_seconds,
+                "unsynced_edits": self._edits,
+                "next_sync_in_seconds": round(max(0.0, self._deadline() - now), 3) if self._edits else None,
+                "syncs": self._syncs,
+                "edits_synced": self._edits_synced,
+                "average_edits_per_sync": round(self._edits_synced / self._syncs, 2) if self._syncs else None,
+                "failures": self._failures,
+                "last_error": self._last_error,
+                "recent_syncs": list(self._recent)
+            }
@@ -0,0 +1,86 @@
+"""Reader/writer lock for the shared Keep client.
+
+Read tools may run in parallel with each other. Local modifications and
+the apply phase of a sync need the node tree and indexes to themselves.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class RWLock:
+    """Shared/exclusive lock preferring writers.
+
+    Any number of threads may hold the lock shared (read) at once; a
+    writer waits for current readers to finish and blocks new readers
+    while it waits, so a steady stream of reads cannot starve it.
+
+    Both modes are reentrant per thread, and the writing thread may also
+    take the lock shared. A thread holding it shared must not ask for it
+    exclusively (that would deadlock).
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of the with block."""
+        depth = getattr(self._local, "read_depth", 0)
+        me = threading.get_ident()
+
+        if depth == 0 and self._writer != me:
+            with self._cond:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+                self._readers += 1
+            counted = True
+        else:
+            # Nested read, or a read inside this thread's own write
+            counted = False
+
+        self._local.read_depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.read_depth = depth
+            if counted:
+                with self._cond:
+                    self._readers -= 1
+                    if self._readers == 0:
+                        self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock exclusively for the duration of the with block."""
+        me = threading.get_ident()
+
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+            else:
+                if getattr(self._local, "read_depth", 0):
+                    raise RuntimeError("Cannot take the write lock while holding the read lock")
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+                self._write_depth = 1
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._write_depth -= 1
+                if self._write_depth == 0:
+                    self._writer = None
+                    self._cond.notify_all()
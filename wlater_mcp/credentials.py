@@ -2,13 +2,20 @@
 
 Handles secure storage of master tokens in OS keyring and configuration
 data in ~/.wlater file.
+
+For headless machines, where the keyring backend may be slow or missing,
+the master token can instead come from the WLATER_MASTER_TOKEN environment
+variable, or from ~/.wlater_token encrypted with the key in
+WLATER_TOKEN_KEY (requires the optional cryptography package).
 """
 
 import json
+import os
 import platform
 import getpass
+import threading
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Any, Dict, Tuple, Optional
 
 try:
     import keyring
@@ -20,6 +27,23 @@ except ImportError:
 
 SERVICE_NAME = "google-keep-token"
 
+# Headless token sources, checked before the keyring
+TOKEN_ENV_VAR = "WLATER_MASTER_TOKEN"
+EMAIL_ENV_VAR = "WLATER_EMAIL"
+TOKEN_KEY_ENV_VAR = "WLATER_TOKEN_KEY"
+
+# Give up on a keyring backend that doesn't answer (e.g. a stuck D-Bus
+# Secret Service) after this long
+DEFAULT_KEYRING_TIMEOUT_SECONDS = 10.0
+
+# Credentials resolved by load_credentials(): (store fingerprint, credentials)
+_cache_lock = threading.Lock()
+_cached_credentials: Optional[Tuple[Any, Tuple[str, str, str]]] = None
+
+# Keyring calls still running after a timeout, by (function, arguments)
+_keyring_lock = threading.Lock()
+_keyring_calls: Dict[Tuple[Any, ...], Tuple[threading.Thread, Dict[str, Any]]] = {}
+
 # Platform codes for Android ID generation
 PLATFORM_CODES = {
     'Windows': '01',
@@ -40,6 +64,55 @@ def get_config_path() -> Path:
     return Path.home() / ".wlater"
 
 
+def get_token_file_path() -> Path:
+    """Return path to the encrypted .wlater_token file in user's home directory."""
+    return Path.home() / ".wlater_token"
+
+
+def _file_fingerprint(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime in nanoseconds, size) of a file, or None if missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def credential_store_fingerprint() -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+    """Return a cheap fingerprint of the stored credentials.
+    
+    Setup rewrites the config file whenever it stores a token, so its
+    modification time and size change when credentials are replaced. Does
+    not touch the keyring.
+    
+    Returns:
+        Tuple of (mtime in nanoseconds, size) for the config file and the
+        encrypted token file, each None if the file is missing
+    """
+    return (_file_fingerprint(get_config_path()), _file_fingerprint(get_token_file_path()))
+
+
+def _import_fernet() -> Any:
+    """Import the Fernet cipher used for the encrypted token file.
+    
+    Raises:
+        ImportError: If the optional cryptography package is missing
+    """
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        raise ImportError(
+            "cryptography is required for the encrypted token file. "
+            "Install it with: pip install wlater-mcp[encrypted]"
+        )
+    return Fernet
+
+
+def generate_token_key() -> str:
+    """Generate a new key for the encrypted token file."""
+    return _import_fernet().generate_key().decode("utf-8")
+
+
 def encode_base36_to_hex(s: str) -> str:
     """Convert 6-char base-36 string to 8-char hex.
     
@@ -119,16 +192,33 @@ def validate_android_id(android_id: str) -> bool:
         return False
 
 
-def store_credentials(email: str, master_token: str, android_id: str) -> None:
-    """Store master token in OS keyring and create .wlater config file.
+def store_credentials(
+    email: str,
+    master_token: str,
+    android_id: str,
+    token_key: Optional[str] = None
+) -> None:
+    """Store master token and create .wlater config file.
     
     Args:
         email: User's Google email address
         master_token: Google Keep master token (format: aas_et/...)
         android_id: 16-character hexadecimal Android ID
+        token_key: Encrypt the token into ~/.wlater_token with this key
+            instead of storing it in the OS keyring
     """
-    # Store token in OS keyring
-    keyring.set_password(SERVICE_NAME, email, master_token)
+    if token_key:
+        # Encrypted file for machines without a usable keyring
+        encrypted = _import_fernet()(token_key.encode("utf-8")).encrypt(master_token.encode("utf-8"))
+        token_path = get_token_file_path()
+        fd = os.open(str(token_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(encrypted)
+        token_store = "encrypted_file"
+    else:
+        # Store token in OS keyring
+        keyring.set_password(SERVICE_NAME, email, master_token)
+        token_store = "keyring"
     
     # Store non-sensitive config in ~/.wlater
     config = {
@@ -136,6 +226,7 @@ def store_credentials(email: str, master_token: str, android_id: str) -> None:
         "android_id": android_id,
         "android_id_platform": platform.system(),
         "android_id_username": getpass.getuser(),
+        "token_store": token_store,
         "last_sync": None,
         "preferences": {}
     }
@@ -144,21 +235,109 @@ def store_credentials(email: str, master_token: str, android_id: str) -> None:
     config_path.write_text(json.dumps(config, indent=2))
 
 
-def load_credentials() -> Tuple[str, str, str]:
-    """Load credentials from config file and keyring.
+def call_keyring(function: str, *args: str, timeout: float = DEFAULT_KEYRING_TIMEOUT_SECONDS) -> Any:
+    """Call a keyring function, giving up after a timeout.
+    
+    The call runs on a helper thread. One that times out keeps running in
+    the background; an identical call made meanwhile waits on it instead of
+    starting another one.
     
+    Args:
+        function: Name of the keyring function (e.g. "get_password")
+        *args: Its arguments (service, account, ...)
+        timeout: Seconds to wait for the keyring backend
+        
     Returns:
-        Tuple of (email, master_token, android_id)
+        Whatever the keyring function returns
         
     Raises:
-        FileNotFoundError: If .wlater config file doesn't exist
-        ValueError: If master token not found in keyring
-        KeyError: If config file is missing required fields
+        TimeoutError: If the keyring does not answer in time
     """
+    key = (function,) + args
+    
+    with _keyring_lock:
+        call = _keyring_calls.get(key)
+        if call is None:
+            result: Dict[str, Any] = {}
+            
+            def run() -> None:
+                try:
+                    result["value"] = getattr(keyring, function)(*args)
+                except Exception as e:
+                    result["error"] = e
+            
+            thread = threading.Thread(target=run, name="wlater-keyring", daemon=True)
+            thread.start()
+            call = (thread, result)
+            _keyring_calls[key] = call
+    
+    thread, result = call
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(
+            f"OS keyring did not answer within {timeout:g}s. On headless machines set "
+            f"{TOKEN_ENV_VAR}, or store the token encrypted with: wlater-setup --encrypted"
+        )
+    
+    with _keyring_lock:
+        if _keyring_calls.get(key) is call:
+            del _keyring_calls[key]
+    
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+
+def _get_keyring_password(email: str, timeout: float) -> Optional[str]:
+    """Read the master token from the keyring, giving up after a timeout.
+    
+    Args:
+        email: Account the token is stored under
+        timeout: Seconds to wait for the keyring backend
+        
+    Raises:
+        TimeoutError: If the keyring does not answer in time
+    """
+    return call_keyring("get_password", SERVICE_NAME, email, timeout=timeout)
+
+
+def _read_encrypted_token() -> str:
+    """Decrypt the master token from ~/.wlater_token.
+    
+    Raises:
+        ValueError: If the key is not set, wrong, or the file is missing
+    """
+    key = os.environ.get(TOKEN_KEY_ENV_VAR, "").strip()
+    if not key:
+        raise ValueError(
+            f"The master token is stored encrypted; set {TOKEN_KEY_ENV_VAR} to the key shown by wlater-setup."
+        )
+    
+    token_path = get_token_file_path()
+    try:
+        encrypted = token_path.read_bytes()
+    except FileNotFoundError:
+        raise ValueError(f"Encrypted token file not found at {token_path}. Run setup.py first.")
+    
+    fernet = _import_fernet()
+    try:
+        return fernet(key.encode("utf-8")).decrypt(encrypted).decode("utf-8")
+    except Exception:
+        raise ValueError(f"Could not decrypt {token_path}: {TOKEN_KEY_ENV_VAR} is not the key it was stored with.")
+
+
+def _read_credentials(keyring_timeout: float) -> Tuple[str, str, str]:
+    """Resolve credentials from the environment, config file and token store."""
+    env_token = os.environ.get(TOKEN_ENV_VAR, "").strip()
+    
     # Load config file to get email and android_id
     config_path = get_config_path()
     
     if not config_path.exists():
+        env_email = os.environ.get(EMAIL_ENV_VAR, "").strip()
+        if env_token and env_email:
+            # Fully configured from the environment
+            return (env_email, env_token, generate_android_id())
         raise FileNotFoundError(
             f"Config file not found at {config_path}. Run setup.py first."
         )
@@ -180,8 +359,13 @@ def load_credentials() -> Tuple[str, str, str]:
         config["android_id_username"] = current_username
         config_path.write_text(json.dumps(config, indent=2))
     
-    # Retrieve master token from keyring
-    master_token = keyring.get_password(SERVICE_NAME, email)
+    if env_token:
+        master_token = env_token
+    elif config.get("token_store") == "encrypted_file":
+        master_token = _read_encrypted_token()
+    else:
+        # Retrieve master token from keyring
+        master_token = _get_keyring_password(email, keyring_timeout)
     
     if not master_token:
         raise ValueError(
@@ -189,3 +373,41 @@ def load_credentials() -> Tuple[str, str, str]:
         )
     
     return (email, master_token, android_id)
+
+
+def load_credentials(keyring_timeout: float = DEFAULT_KEYRING_TIMEOUT_SECONDS) -> Tuple[str, str, str]:
+    """Load credentials from config file and token store.
+    
+    The master token comes from WLATER_MASTER_TOKEN if set, else from the
+    encrypted token file if setup stored it there, else from the keyring.
+    Credentials are resolved once per process and reused until setup
+    rewrites the stored credentials.
+    
+    Args:
+        keyring_timeout: Seconds to wait for the OS keyring backend
+    
+    Returns:
+        Tuple of (email, master_token, android_id)
+        
+    Raises:
+        FileNotFoundError: If .wlater config file doesn't exist
+        ValueError: If master token not found in keyring
+        KeyError: If config file is missing required fields
+        TimeoutError: If the keyring does not answer in time
+    """
+    global _cached_credentials
+    
+    fingerprint = credential_store_fingerprint()
+    cached = _cached_credentials
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    with _cache_lock:
+        cached = _cached_credentials
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        credentials = _read_credentials(keyring_timeout)
+        # Regenerating the android_id rewrites the config file
+        _cached_credentials = (credential_store_fingerprint(), credentials)
+        return credentials
@@ -0,0 +1,233 @@
+"""Write-ahead journal of local modifications not yet synced.
+
+Modification tools only change the in-memory node tree until the next
+sync. Each modification is also appended to ~/.wlater_journal (one JSON
+record per line) and fsync'd before the tool returns, so edits survive the
+server process being killed. On the next start KeepClient replays the
+journal onto the restored notes; after a successful sync the journal is
+emptied.
+
+Appends are cheap buffered writes; durability comes from commit(), which
+uses group commit: one thread (the leader) fsyncs on behalf of everyone
+waiting, so concurrent modifications share a single fsync, and
+group() makes a whole batch of appends wait for just one.
+"""
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+logger = logging.getLogger("wlater")
+
+
+def get_journal_path() -> Path:
+    """Return path to the .wlater_journal file in user's home directory."""
+    return Path.home() / ".wlater_journal"
+
+
+class Journal:
+    """Append-only record file with group commit.
+
+    Records are numbered in append order; append() returns that number
+    as a ticket for commit().
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Open (lazily) the journal file.
+
+        Args:
+            path: Journal file (default: ~/.wlater_journal)
+        """
+        self.path = path or get_journal_path()
+
+        self._cond = threading.Condition()
+        self._file = None
+        # Tickets of the last record written and the last one fsync'd
+        self._written = 0
+        self._durable = 0
+        self._syncing = False
+        # Records in the file since it was last emptied
+        self._pending = 0
+        self._local = threading.local()
+
+        # Counters for monitoring
+        self._fsyncs = 0
+        self._committed = 0
+
+    def _open(self) -> Any:
+        """Return the journal file opened for appending (lock held)."""
+        if self._file is None:
+            # Journaled edits are private note contents, owner-only
+            fd = os.open(str(self.path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            self._file = os.fdopen(fd, "a", encoding="utf-8")
+        return self._file
+
+    def read(self) -> List[Dict[str, Any]]:
+        """Return all complete records in the journal.
+
+        A record cut short by a crash mid-write ends the journal; it and
+        anything after it are ignored.
+        """
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+
+        records = []
+        for number, line in enumerate(lines, 1):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"Journal record {number} is incomplete, ignoring it and any after it")
+                break
+            if isinstance(record, dict):
+                records.append(record)
+
+        with self._cond:
+            self._pending = len(records)
+        return records
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """Write a record without waiting for it to reach the disk.
+
+        Args:
+            record: JSON-serializable record
+
+        Returns:
+            Ticket to pass to commit()
+        """
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._cond:
+            f = self._open()
+            f.write(line)
+            f.flush()
+            self._written += 1
+            self._pending += 1
+            return self._written
+
+    def commit(self, ticket: int) -> None:
+        """Wait until the record with this ticket (and all before it) is on disk.
+
+        Inside group() the wait is postponed to the end of the group.
+
+        Args:
+            ticket: Value returned by append()
+        """
+        if getattr(self._local, "group_depth", 0):
+            self._local.group_ticket = max(self._local.group_ticket, ticket)
+            return
+
+        with self._cond:
+            while self._durable < ticket:
+                if self._syncing:
+                    # Another thread is fsyncing; it may cover this record
+                    self._cond.wait()
+                    continue
+
+                # Become the leader: fsync everything written so far
+                self._syncing = True
+                target = self._written
+                f = self._file
+                self._cond.release()
+                try:
+                    os.fsync(f.fileno())
+                finally:
+                    self._cond.acquire()
+                    self._syncing = False
+                    self._cond.notify_all()
+
+                self._fsyncs += 1
+                self._committed += target - self._durable
+                self._durable = max(self._durable, target)
+
+    @contextmanager
+    def group(self) -> Iterator[None]:
+        """Commit every record appended by this thread inside the block at once."""
+        depth = getattr(self._local, "group_depth", 0)
+        if depth == 0:
+            self._local.group_ticket = 0
+        self._local.group_depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.group_depth = depth
+            if depth == 0 and self._local.group_ticket:
+                self.commit(self._local.group_ticket)
+
+    def truncate(self) -> None:
+        """Empty the journal once its records are synced to Google Keep."""
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+
+            if self._pending or self._file is not None:
+                f = self._open()
+                f.truncate(0)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Records waiting for a commit no longer need to be on disk
+            self._pending = 0
+            self._durable = self._written
+            self._cond.notify_all()
+
+    def rewrite(self, records: List[Dict[str, Any]]) -> None:
+        """Atomically replace the journal's contents.
+
+        Args:
+            records: JSON-serializable records to keep
+        """
+        data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+
+            fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(str(tmp_path), str(self.path))
+
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._pending = len(records)
+            self._durable = self._written
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Close the journal file; it is reopened on the next append."""
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+            self._durable = self._written
+            self._cond.notify_all()
+
+    def status(self) -> Dict[str, Any]:
+        """Return the number of unsynced records and group commit statistics.
+
+        Reads the counters without taking the lock, which truncate(),
+        rewrite() and close() hold across an fsync, so a slow disk never
+        stalls the caller (the server_status tool runs on the event loop).
+        The numbers may be a moment apart from each other.
+        """
+        fsyncs = self._fsyncs
+        committed = self._committed
+        return {
+            "unsynced_records": self._pending,
+            "fsyncs": fsyncs,
+            "records_committed": committed,
+            "average_records_per_fsync": round(committed / fsyncs, 2) if fsyncs else None
+        }
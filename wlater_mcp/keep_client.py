@@ -1,9 +1,19 @@
 """Google Keep client wrapper for read-only and modification operations."""
 
+import base64
+import functools
+import hashlib
+import heapq
+import http
+import inspect
+import json
 import logging
 import re
+import threading
+import time
+import uuid
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set, Tuple
 
 try:
     import gkeepapi
@@ -12,6 +22,15 @@ except ImportError:
         "gkeepapi is required. Install it with: pip install gkeepapi"
     )
 
+from wlater_mcp.concurrency import RWLock
+from wlater_mcp.credentials import DEFAULT_KEYRING_TIMEOUT_SECONDS
+from wlater_mcp.journal import Journal
+from wlater_mcp.resilience import CircuitOpenError, Resilience, is_transient
+from wlater_mcp.auto_sync import DEFAULT_MAX_DELAY_SECONDS, DEFAULT_QUIET_SECONDS, AutoSync
+from wlater_mcp.search_index import FUZZY_THRESHOLD, AttributeIndex, SearchIndex, make_snippet
+from wlater_mcp.state_cache import load_state, save_state, clear_state
+from wlater_mcp.token_cache import CachingAuth, TokenRefresher
+
 
 logger = logging.getLogger("wlater")
 
@@ -92,6 +111,195 @@ def format_error_response(
     }
 
 
+# Note Field Projection
+
+def _note_type(note: Any) -> str:
+    """Return "List" or "Note" for a gkeepapi note."""
+    return "List" if isinstance(note, gkeepapi.node.List) else "Note"
+
+
+# Builders for each projectable note field; only requested fields are computed
+NOTE_FIELDS = {
+    "note_id": lambda note: note.id,
+    "title": lambda note: note.title or "",
+    "text": lambda note: note.text,
+    "note_type": _note_type,
+    "color": lambda note: note.color.name,
+    "pinned": lambda note: note.pinned,
+    "archived": lambda note: note.archived,
+    "trashed": lambda note: note.trashed,
+    "labels": lambda note: [{"id": label.id, "name": label.name} for label in note.labels.all()],
+    "timestamps": lambda note: {
+        "created": note.timestamps.created.isoformat(),
+        "updated": note.timestamps.updated.isoformat(),
+        "edited": note.timestamps.edited.isoformat()
+    }
+}
+
+SUMMARY_FIELDS = ["note_id", "title", "note_type", "pinned", "archived", "color"]
+DETAIL_FIELDS = ["note_id", "title", "text", "note_type", "color", "pinned", "archived", "labels", "timestamps"]
+
+
+def resolve_fields(
+    fields: Optional[List[str]],
+    default: List[str],
+    extra: Tuple[str, ...] = ()
+) -> List[str]:
+    """Validate a requested field projection.
+    
+    Args:
+        fields: Requested field names, or None for the default set
+        default: Fields returned when none are requested
+        extra: Additional non-note fields the caller supports
+        
+    Returns:
+        List of field names to build
+        
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if not fields:
+        return list(default)
+    
+    unknown = [field for field in fields if field not in NOTE_FIELDS and field not in extra]
+    if unknown:
+        valid = list(NOTE_FIELDS) + list(extra)
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Valid fields: {', '.join(valid)}")
+    
+    return list(dict.fromkeys(fields))
+
+
+def project_note(note: Any, fields: List[str]) -> Dict[str, Any]:
+    """Build a note dictionary containing only the requested fields.
+    
+    Args:
+        note: gkeepapi note or list
+        fields: Field names from NOTE_FIELDS (others are skipped)
+        
+    Returns:
+        Dictionary of field name to value
+    """
+    return {field: NOTE_FIELDS[field](note) for field in fields if field in NOTE_FIELDS}
+
+
+# Tabular Output
+
+OUTPUT_FORMATS = ("records", "table")
+
+# Low-cardinality columns sent as indexes into a per-response value list
+DICTIONARY_COLUMNS = ("note_type", "color")
+
+
+def validate_output_format(output_format: str) -> None:
+    """Raise ValueError if output_format is not a supported format."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Invalid output_format '{output_format}'. Valid formats: {', '.join(OUTPUT_FORMATS)}"
+        )
+
+
+def tabulate_notes(
+    notes: List[Dict[str, Any]],
+    columns: List[str],
+    more: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Convert note dictionaries into a compact columnar response.
+    
+    Keys are sent once in "columns" and each note becomes a row of values
+    in the same order. note_type and color values are dictionary-encoded:
+    rows hold an index into the matching list under "dictionaries".
+    
+    Args:
+        notes: Note dictionaries, all built from the same field list
+        columns: Column order (the projected fields)
+        more: Optional truncation entry whose keys are merged into the result
+        
+    Returns:
+        Dictionary with columns, dictionaries, rows and truncation info
+    """
+    columns = [column for column in columns if not notes or column in notes[0]]
+    encoded = [(position, column) for position, column in enumerate(columns) if column in DICTIONARY_COLUMNS]
+    dictionaries = {column: [] for _, column in encoded}
+    codes = {column: {} for _, column in encoded}
+    
+    rows = []
+    for note in notes:
+        row = [note.get(column) for column in columns]
+        for position, column in encoded:
+            value = row[position]
+            code = codes[column].get(value)
+            if code is None:
+                code = codes[column][value] = len(dictionaries[column])
+                dictionaries[column].append(value)
+            row[position] = code
+        rows.append(row)
+    
+    table = {"columns": columns, "dictionaries": dictionaries, "rows": rows}
+    if more:
+        table.update(more)
+    return table
+
+
+# Pagination Utilities
+
+def encode_cursor(generation: int, params: Dict[str, Any], position: Dict[str, Any]) -> str:
+    """Encode an opaque page cursor.
+    
+    Args:
+        generation: Sync generation the page was computed at
+        params: Query parameters the cursor is valid for
+        position: Where the next page starts ({"after": key} or {"offset": n})
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {"g": generation, "q": _params_digest(params)}
+    payload.update(position)
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, generation: int, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode and validate a page cursor.
+    
+    Args:
+        cursor: Cursor from a previous page
+        generation: Current sync generation
+        params: Query parameters of the current request
+        
+    Returns:
+        Position dictionary the cursor was encoded with
+        
+    Raises:
+        ValueError: If the cursor is malformed, was issued for different
+            query parameters, or notes were synced since it was issued
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_generation = payload.pop("g")
+        digest = payload.pop("q")
+    except Exception:
+        raise ValueError("Invalid cursor. Start again without a cursor.")
+    
+    if digest != _params_digest(params):
+        raise ValueError("Cursor was issued for different parameters. Start again without a cursor.")
+    
+    if cursor_generation != generation:
+        raise ValueError(
+            "Cursor expired: notes were synced since this page was produced. "
+            "Start again without a cursor."
+        )
+    
+    return payload
+
+
+def _params_digest(params: Dict[str, Any]) -> str:
+    """Return a short stable digest of query parameters."""
+    raw = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()[:12]
+
+
 # Error Handling Helper Functions
 
 def validate_note_exists(keep: gkeepapi.Keep, note_id: str) -> Optional[Dict[str, Any]]:
@@ -166,6 +374,30 @@ def validate_color(color: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+# Batch Operations
+
+# op name -> (KeepClient method, required arguments and types, fixed arguments)
+BATCH_OPERATIONS = {
+    "check": ("update_item_checked", {"item_id": str}, {"checked": True}),
+    "uncheck": ("update_item_checked", {"item_id": str}, {"checked": False}),
+    "add_item": ("add_list_item", {"list_id": str, "text": str}, {}),
+    "set_title": ("update_note_title", {"note_id": str, "title": str}, {}),
+    "set_text": ("update_note_text", {"note_id": str, "text": str}, {}),
+    "set_color": ("update_note_color", {"note_id": str, "color": str}, {}),
+    "set_pinned": ("update_note_pinned", {"note_id": str, "pinned": bool}, {}),
+    "set_archived": ("update_note_archived", {"note_id": str, "archived": bool}, {}),
+    "add_label": ("add_label_to_note", {"note_id": str, "label_name": str}, {}),
+    "remove_label": ("remove_label_from_note", {"note_id": str, "label_name": str}, {}),
+    "trash": ("trash_note", {"note_id": str}, {}),
+    "untrash": ("untrash_note", {"note_id": str}, {})
+}
+
+# Optional arguments accepted by some batch operations
+BATCH_OPTIONAL_ARGUMENTS = {
+    "add_item": {"checked": bool}
+}
+
+
 def safe_execute(operation: str, func, *args, **kwargs) -> Dict[str, Any]:
     """Execute a function with comprehensive error handling.
     
@@ -203,84 +435,930 @@ def safe_execute(operation: str, func, *args, **kwargs) -> Dict[str, Any]:
 
 logger = logging.getLogger("wlater")
 
+# Number of finished background sync jobs kept for get_sync_job()
+SYNC_JOB_HISTORY = 20
+
+
+def _send_once(api: Any, **req_kwargs: Any) -> Dict[str, Any]:
+    """Send a gkeepapi API request without its built-in retry loops.
+    
+    gkeepapi's API.send() sleeps and retries 429 responses forever and
+    refreshes the access token on 401 by itself. This version raises both
+    (and non-JSON error pages) as APIException: Resilience backs off
+    within its retry budget, and KeepClient re-authenticates once and
+    retries the whole operation.
+    
+    Args:
+        api: gkeepapi API instance
+        **req_kwargs: Arguments for the underlying request
+        
+    Returns:
+        Parsed JSON response
+    """
+    response = api._send(**req_kwargs)
+    try:
+        body = response.json()
+    except ValueError:
+        raise gkeepapi.exception.APIException(
+            response.status_code, f"HTTP {response.status_code} with a non-JSON body"
+        )
+    
+    if "error" in body:
+        error = body["error"]
+        raise gkeepapi.exception.APIException(error["code"], error)
+    return body
+
+
+def is_token_expired(error: Exception) -> bool:
+    """Return True if Google rejected the request's access token."""
+    return (
+        isinstance(error, gkeepapi.exception.APIException)
+        and getattr(error, "code", None) == http.HTTPStatus.UNAUTHORIZED
+    )
+
+
+class _TrackingKeep(gkeepapi.Keep):
+    """gkeepapi Keep that records which notes each sync touched.
+    
+    Lets KeepClient update its indexes from the sync delta instead of
+    rescanning the whole node tree. Server responses can also be held back
+    (defer_apply) and applied later in one step (apply_deferred), so the
+    node tree never shows a partly applied sync.
+    """
+    
+    def __init__(self):
+        self._changed_note_ids: Set[str] = set()
+        self._labels_changed = False
+        # Running total of nodes received from the server (sync progress)
+        self.nodes_received = 0
+        # Held back (parser, payload) pairs while deferring, else None
+        self._deferred: Optional[List[Tuple[Any, Any]]] = None
+        super().__init__()
+        
+        for api in (self._keep_api, self._reminders_api, self._media_api):
+            api.send = functools.partial(_send_once, api)
+    
+    def sync(self, resync: bool = False) -> None:
+        """Sync with the server, keeping local edits dirty if it fails.
+        
+        gkeepapi clears each node's dirty bit while building the request,
+        before knowing whether the request succeeds. A failed sync would
+        otherwise drop those edits from the next attempt.
+        """
+        dirty_nodes = [] if resync else self._findDirtyNodes()
+        dirty_labels = [] if resync else [label for label in self._labels.values() if label.dirty]
+        try:
+            super().sync(resync)
+        except Exception:
+            for element in dirty_nodes + dirty_labels:
+                element._dirty = True
+            raise
+    
+    def defer_apply(self) -> None:
+        """Hold back server responses until apply_deferred() is called."""
+        self._deferred = []
+    
+    def apply_deferred(self) -> None:
+        """Apply held back server responses in the order they arrived."""
+        deferred, self._deferred = self._deferred or [], None
+        for parse, raw in deferred:
+            parse(raw)
+    
+    def _parseNodes(self, raw: List[Dict[str, Any]]) -> None:
+        self.nodes_received += len(raw)
+        if self._deferred is not None:
+            self._deferred.append((self._apply_nodes, raw))
+        else:
+            self._apply_nodes(raw)
+    
+    def _parseUserInfo(self, raw: Dict[str, Any]) -> None:
+        if self._deferred is not None:
+            self._deferred.append((self._apply_user_info, raw))
+        else:
+            self._apply_user_info(raw)
+    
+    def _apply_nodes(self, raw: List[Dict[str, Any]]) -> None:
+        """Record the notes a node payload touches, then apply it."""
+        for raw_node in raw:
+            parent_id = raw_node.get("parentId")
+            if parent_id is None and raw_node["id"] in self._nodes:
+                # Deleted nodes come without a parentId
+                parent_id = self._nodes[raw_node["id"]].parent_id
+            
+            if parent_id == gkeepapi.node.Root.ID:
+                self._changed_note_ids.add(raw_node["id"])
+            elif parent_id is not None:
+                # List items and blobs point at their note
+                self._changed_note_ids.add(parent_id)
+        
+        super()._parseNodes(raw)
+    
+    def _apply_user_info(self, raw: Dict[str, Any]) -> None:
+        """Apply a label payload and flag labels as changed."""
+        super()._parseUserInfo(raw)
+        self._labels_changed = True
+    
+    def pop_changes(self) -> Tuple[Set[str], bool]:
+        """Return and reset the notes and label flag touched since last call.
+        
+        Returns:
+            Tuple of (changed note IDs, whether labels were refreshed)
+        """
+        changes = (self._changed_note_ids, self._labels_changed)
+        self._changed_note_ids = set()
+        self._labels_changed = False
+        return changes
+
+
+# Modification methods recorded in the journal (filled in by @_mutation)
+JOURNALED_OPERATIONS: Set[str] = set()
+
+# Journaled modifications that create nodes or labels. If everything they
+# created is already present at replay, they were synced before the crash.
+CREATE_OPERATIONS = {"create_note", "create_list", "create_label", "add_list_item", "add_list_items"}
+
+# Preview fields holding node or label IDs
+ID_FIELDS = ("note_id", "list_id", "item_id", "label_id")
+
+
+def _preview_ids(preview: Any) -> List[Tuple[str, str]]:
+    """Return (field, ID) pairs found in a preview, in a stable order.
+    
+    The same modification with the same arguments yields the same pairs,
+    so pairs from a journaled and a replayed run line up one to one.
+    
+    Args:
+        preview: Preview dictionary (or a nested part of it)
+    """
+    ids = []
+    if isinstance(preview, dict):
+        for key, value in preview.items():
+            if key in ID_FIELDS and isinstance(value, str):
+                ids.append((key, value))
+            elif key != "items_moved":
+                # Moved items already existed; which ones move depends on
+                # the list's state, so they would not line up on replay
+                ids.extend(_preview_ids(value))
+    elif isinstance(preview, list):
+        for value in preview:
+            ids.extend(_preview_ids(value))
+    return ids
+
+
+def _mutation(method):
+    """Mark a KeepClient method as a local modification.
+    
+    Modifications are serialized with each other and with syncs by the
+    client lock, and hold the read/write lock exclusively so readers never
+    see a half-made change. After a successful modification the affected
+    note is reindexed so reads reflect the change before it is synced, and
+    the auto-syncer (if enabled) is told about the edit.
+    
+    The outermost modification is also appended to the journal and
+    committed after the locks are released, so concurrent modifications
+    share one fsync.
+    """
+    signature = inspect.signature(method)
+    JOURNALED_OPERATIONS.add(method.__name__)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        ticket = None
+        with self._lock, self._rw.write():
+            self._mutation_depth += 1
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                self._mutation_depth -= 1
+            
+            if result.get("success"):
+                self._after_mutation(result)
+                if self._mutation_depth == 0:
+                    arguments = signature.bind(self, *args, **kwargs).arguments
+                    arguments.pop("self")
+                    ticket = self._journal_mutation(method.__name__, arguments, result)
+        
+        if ticket is not None:
+            try:
+                self._journal.commit(ticket)
+            except OSError as e:
+                logger.error(f"Failed to write journal, {method.__name__} is only held in memory: {e}")
+        return result
+    return wrapper
+
+
+def _read_only(method):
+    """Mark a KeepClient method as a read.
+    
+    Reads hold the read/write lock shared: they run in parallel with each
+    other and with the network part of a sync, but never during a
+    modification or while a sync result is being applied.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._rw.read():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _authentication_error(error: Exception) -> RuntimeError:
+    """Translate a failed token exchange into a user-facing error.
+    
+    Args:
+        error: Exception raised while exchanging the master token
+        
+    Returns:
+        RuntimeError telling the user whether to retry or re-authenticate
+    """
+    error_msg = str(error)
+    if isinstance(error, CircuitOpenError) or is_transient(error):
+        return RuntimeError(
+            f"Could not reach Google Keep to authenticate: {error_msg}. "
+            f"Your credentials were not checked; try again later."
+        )
+    return RuntimeError(
+        f"AUTHENTICATION FAILED: {error_msg}. "
+        f"Your master token is INVALID or EXPIRED and cannot be used. "
+        f"You MUST re-authenticate by running: wlater-setup token (for automated setup) "
+        f"or wlater-setup (for manual setup). "
+        f"The refresh_notes tool will NOT work until you re-authenticate with valid credentials."
+    )
+
+
+def verify_credentials(
+    email: str,
+    master_token: str,
+    android_id: str,
+    resilience: Optional[Resilience] = None,
+    keyring_timeout: float = DEFAULT_KEYRING_TIMEOUT_SECONDS
+) -> None:
+    """Check credentials by exchanging the master token for an OAuth token.
+    
+    Always performs the token exchange, ignoring any cached access token;
+    the fresh token is cached for the next start. No notes are synced.
+    
+    Args:
+        email: User's Google email address
+        master_token: Google Keep master token
+        android_id: 16-character hexadecimal Android ID
+        resilience: Retry and circuit breaker policy (default: a new policy)
+        keyring_timeout: Seconds to wait for the OS keyring when caching
+            the access token
+        
+    Raises:
+        RuntimeError: If the token exchange fails; chained to the original
+            error so transient failures can be told apart
+    """
+    auth = CachingAuth(gkeepapi.Keep.OAUTH_SCOPES, keyring_timeout)
+    try:
+        (resilience or Resilience()).call(
+            "authenticate", auth.load, email, master_token, android_id, reuse_cached=False
+        )
+    except Exception as e:
+        raise _authentication_error(e) from e
+
 
 class KeepClient:
     """Wrapper around gkeepapi for read-only Google Keep access."""
     
-    def __init__(self, email: str, master_token: str, android_id: str):
+    def __init__(
+        self,
+        email: str,
+        master_token: str,
+        android_id: str,
+        auto_sync: bool = False,
+        auto_sync_quiet_seconds: float = DEFAULT_QUIET_SECONDS,
+        auto_sync_max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        resilience: Optional[Resilience] = None,
+        journal: Optional[Journal] = None,
+        keyring_timeout: float = DEFAULT_KEYRING_TIMEOUT_SECONDS
+    ):
         """Initialize and authenticate with Google Keep.
         
         Args:
             email: User's Google email address
             master_token: Google Keep master token
             android_id: 16-character hexadecimal Android ID
+            auto_sync: Sync modifications automatically in the background
+            auto_sync_quiet_seconds: Auto-sync once no modification has
+                happened for this long
+            auto_sync_max_delay_seconds: Auto-sync at the latest this long
+                after the oldest unsynced modification
+            resilience: Retry and circuit breaker policy for network calls,
+                shareable between clients (default: a new policy)
+            journal: Write-ahead journal of unsynced modifications, replayed
+                on start (default: ~/.wlater_journal)
+            keyring_timeout: Seconds to wait for the OS keyring when reading
+                or writing the cached access token
             
         Raises:
             RuntimeError: If authentication fails
+            ValueError: If the auto-sync timings are invalid
+        """
+        self.email = email
+        self.keep = _TrackingKeep()
+        self._resilience = resilience or Resilience()
+        
+        # Serializes modifications and syncs
+        self._lock = threading.RLock()
+        # Shared for reads, exclusive while notes or indexes change
+        self._rw = RWLock()
+        
+        self._auto_sync: Optional[AutoSync] = None
+        if auto_sync:
+            self._auto_sync = AutoSync(self._sync, auto_sync_quiet_seconds, auto_sync_max_delay_seconds)
+        
+        # Background sync jobs by ID (oldest first) and the one running now
+        self._jobs_lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._active_job: Optional[Dict[str, Any]] = None
+        self._active_job_thread: Optional[threading.Thread] = None
+        
+        # Restore the last synced state (if any) so only the delta is fetched
+        state = load_state(email)
+        if state is not None:
+            try:
+                self.keep.restore(state)
+                logger.info("Restored local state snapshot")
+            except Exception as e:
+                logger.warning(f"Failed to restore state snapshot, falling back to full sync: {e}")
+                clear_state()
+                state = None
+                self.keep = _TrackingKeep()
+        
+        # Authenticate with the master token (no password needed), reusing
+        # the access token cached by a previous run while it is valid
+        self._auth = CachingAuth(gkeepapi.Keep.OAUTH_SCOPES, keyring_timeout)
+        # Access tokens replaced after Google rejected them mid-session
+        self._reauthentications = 0
+        try:
+            self._resilience.call("authenticate", self._auth.load, email, master_token, android_id)
+        except Exception as e:
+            raise _authentication_error(e) from e
+        self.keep.load(self._auth, sync=False)
+        
+        # Initial sync to load notes (this can also fail with auth errors)
+        try:
+            self._initial_sync(resumed=state is not None)
+        except Exception as e:
+            error_msg = str(e).lower()
+            if 'auth' in error_msg or 'login' in error_msg or 'credential' in error_msg or 'badauthentication' in error_msg:
+                raise RuntimeError(
+                    f"AUTHENTICATION FAILED during initial sync: {str(e)}. "
+                    f"Your credentials are INVALID or EXPIRED. "
+                    f"You MUST re-authenticate by running: wlater-setup token (for automated setup) "
+                    f"or wlater-setup (for manual setup)."
+                )
+            raise RuntimeError(f"Failed to sync with Google Keep: {str(e)}") from e
+        
+        self._save_state()
+        
+        self._index = SearchIndex()
+        self._attributes = AttributeIndex()
+        self._labels_by_name: Dict[str, Any] = {}
+        self._sorted_labels: Optional[List[Dict[str, str]]] = None
+        # item_id -> (list_id, ListItem), and list_id -> indexed item IDs
+        self._items: Dict[str, Tuple[str, Any]] = {}
+        self._list_item_ids: Dict[str, Set[str]] = {}
+        self._rebuild_indexes()
+        
+        # Incremented whenever a sync changes the corpus; page cursors are
+        # only valid within one generation
+        self._sync_generation = 0
+        
+        # Notes and labels touched by modifications since the last sync
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_labels: Dict[str, str] = {}
+        
+        # Set while batch_apply runs: notes to reindex once the batch ends
+        self._deferred_reindex: Optional[Set[str]] = None
+        
+        # Nesting of @_mutation calls; only the outermost one is journaled
+        self._mutation_depth = 0
+        # Set while replaying: records collected instead of being appended
+        self._journal_capture: Optional[List[Dict[str, Any]]] = None
+        self._journal = journal or Journal()
+        self._replay_journal()
+        
+        # Renew the access token before it expires so requests never wait on it
+        self._token_refresher = TokenRefresher(
+            self._auth, functools.partial(self._resilience.call, "refresh_token", self._auth.refresh)
+        )
+        self._token_refresher.start()
+        
+        logger.info(f"Authenticated as {email}")
+    
+    def uses_credentials(self, email: str, master_token: str) -> bool:
+        """Return True if this client was authenticated with these credentials.
+        
+        Args:
+            email: User's Google email address
+            master_token: Google Keep master token
+        """
+        return self.email == email and self.keep.getMasterToken() == master_token
+    
+    def _journal_mutation(self, operation: str, arguments: Dict[str, Any], result: Dict[str, Any]) -> Optional[int]:
+        """Append a successful modification to the journal.
+        
+        Args:
+            operation: Name of the modification method
+            arguments: Arguments it was called with
+            result: Its preview response
+            
+        Returns:
+            Ticket to commit, or None if nothing was appended
         """
-        self.keep = gkeepapi.Keep()
+        record = {
+            "email": self.email,
+            "op": operation,
+            "args": arguments,
+            "ids": _preview_ids(result.get("preview", {}))
+        }
+        
+        if self._journal_capture is not None:
+            self._journal_capture.append(record)
+            return None
+        
+        try:
+            return self._journal.append(record)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Failed to write journal, {operation} is only held in memory: {e}")
+            return None
+    
+    def _replay_journal(self) -> None:
+        """Re-apply modifications journaled by a previous run but never synced.
+        
+        Runs after the restored state has been synced. Nodes and labels
+        created on replay get new IDs; later records are translated to
+        them. Records that no longer apply (e.g. the note was deleted) are
+        dropped. The journal is then rewritten with the replayed records.
+        """
+        try:
+            records = self._journal.read()
+        except OSError as e:
+            logger.error(f"Failed to read journal, unsynced edits from the last run are not restored: {e}")
+            return
+        if not records:
+            return
+        
+        id_map: Dict[str, str] = {}
+        replayed = 0
+        self._journal_capture = []
+        try:
+            for record in records:
+                operation = record.get("op")
+                if record.get("email") != self.email or operation not in JOURNALED_OPERATIONS:
+                    continue
+                
+                arguments = {
+                    name: id_map.get(value, value) if name.endswith("_id") and isinstance(value, str) else value
+                    for name, value in record.get("args", {}).items()
+                }
+                recorded_ids = [tuple(pair) for pair in record.get("ids", [])]
+                
+                if operation in CREATE_OPERATIONS and recorded_ids and all(
+                    (self.keep.getLabel(value) if key == "label_id" else self.keep.get(value)) is not None
+                    for key, value in recorded_ids
+                ):
+                    # Already on the server: synced before the journal was emptied
+                    continue
+                
+                try:
+                    result = getattr(self, operation)(**arguments)
+                except Exception as e:
+                    result = {"success": False, "message": str(e)}
+                if not result.get("success"):
+                    logger.warning(f"Dropping journaled {operation} that no longer applies: {result.get('message')}")
+                    continue
+                
+                replayed += 1
+                for (_, old_id), (_, new_id) in zip(recorded_ids, _preview_ids(result["preview"])):
+                    if old_id != new_id:
+                        id_map[old_id] = new_id
+        finally:
+            captured, self._journal_capture = self._journal_capture, None
         
-        # Authenticate using resume (no password needed)
+        self._journal.rewrite(captured)
+        logger.info(f"Replayed {replayed} unsynced modification(s) from the journal")
+    
+    def _call_keep(self, operation: str, func: Any, *args, **kwargs) -> Any:
+        """Call Google Keep, re-authenticating once if the token was rejected.
+        
+        The new access token is obtained in place: the node tree, pending
+        edits (kept dirty by _TrackingKeep.sync) and indexes stay as they
+        are, and the call is retried once.
+        
+        Args:
+            operation: Name used in logs and errors (e.g. "sync")
+            func: gkeepapi callable that talks to Google
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Whatever func returns
+        """
+        rejected_token = self._auth.getAuthToken()
         try:
-            self.keep.resume(email, master_token, device_id=android_id)
+            return self._resilience.call(operation, func, *args, **kwargs)
         except Exception as e:
-            error_msg = str(e)
-            raise RuntimeError(
-                f"AUTHENTICATION FAILED: {error_msg}. "
-                f"Your master token is INVALID or EXPIRED and cannot be used. "
-                f"You MUST re-authenticate by running: wlater-setup token (for automated setup) "
-                f"or wlater-setup (for manual setup). "
-                f"The refresh_notes tool will NOT work until you re-authenticate with valid credentials."
+            if not is_token_expired(e):
+                raise
+        
+        # Another thread may have refreshed the token in the meantime
+        if self._auth.getAuthToken() == rejected_token:
+            logger.info(f"Access token rejected during {operation}, re-authenticating")
+            self._resilience.call("refresh_token", self._auth.refresh)
+            self._reauthentications += 1
+        return self._resilience.call(operation, func, *args, **kwargs)
+    
+    def _initial_sync(self, resumed: bool) -> None:
+        """Run the startup sync, incremental when resumed from a snapshot.
+        
+        Args:
+            resumed: Whether the node tree was restored from a state snapshot
+        """
+        if not resumed:
+            self._call_keep("sync", self.keep.sync)
+            return
+        
+        try:
+            self._call_keep("sync", self.keep.sync)
+        except gkeepapi.exception.ResyncRequiredException:
+            logger.info("Server requested a full resync, discarding state snapshot")
+            self._call_keep("sync", self.keep.sync, resync=True)
+        except Exception as e:
+            error_msg = str(e).lower()
+            if 'auth' in error_msg or 'login' in error_msg or 'credential' in error_msg or 'badauthentication' in error_msg:
+                raise
+            if isinstance(e, CircuitOpenError) or is_transient(e):
+                # Google is unavailable, a full sync would fail the same way
+                raise
+            # A stale or inconsistent snapshot can break the delta sync
+            logger.warning(f"Incremental sync from snapshot failed, running full sync: {e}")
+            self._call_keep("sync", self.keep.sync, resync=True)
+    
+    def _sync(self) -> None:
+        """Sync with Google Keep and apply the delta to local indexes.
+        
+        Readers keep running while the server is contacted. Server
+        responses are held back and applied together with the index updates
+        in one exclusive section, so reads see either the state before the
+        sync or after it, never a mix.
+        """
+        with self._lock:
+            self.keep.defer_apply()
+            try:
+                self._call_keep("sync", self.keep.sync)
+            finally:
+                # Apply whatever arrived, even if a later page failed: the
+                # sync version has already moved past it
+                with self._rw.write():
+                    self.keep.apply_deferred()
+                    self._apply_sync_changes()
+            
+            with self._rw.write():
+                # Everything staged so far has been pushed
+                self._pending.clear()
+                self._pending_labels.clear()
+            try:
+                # Everything journaled so far is on the server now
+                self._journal.truncate()
+            except OSError as e:
+                logger.warning(f"Failed to empty journal, synced edits may be replayed on restart: {e}")
+            if self._auto_sync is not None:
+                self._auto_sync.mark_synced()
+            
+            self._save_state()
+    
+    def close(self) -> None:
+        """Stop background work, syncing any edits auto-sync still holds."""
+        with self._jobs_lock:
+            thread = self._active_job_thread
+        if thread is not None:
+            thread.join()
+        
+        if self._auto_sync is not None:
+            self._auto_sync.stop(flush=True)
+        
+        self._token_refresher.stop()
+        self._journal.close()
+    
+    def resilience_status(self) -> Dict[str, Any]:
+        """Return circuit breaker state and retry counters for network calls."""
+        return self._resilience.status()
+    
+    def journal_status(self) -> Dict[str, Any]:
+        """Return unsynced journal records and group commit statistics."""
+        return self._journal.status()
+    
+    def token_status(self) -> Dict[str, Any]:
+        """Return access token expiry, refresh and re-authentication statistics."""
+        return {**self._token_refresher.status(), "reauthentications": self._reauthentications}
+    
+    def auto_sync_status(self) -> Dict[str, Any]:
+        """Return auto-sync configuration and batching statistics.
+        
+        Returns:
+            Dictionary with timings, unsynced edits and per-sync batch sizes
+        """
+        if self._auto_sync is None:
+            return {"enabled": False}
+        return self._auto_sync.status()
+    
+    def _rebuild_indexes(self) -> None:
+        """Build all local indexes from the full node tree."""
+        self.keep.pop_changes()
+        notes = self.keep.all()
+        self._index.build(notes)
+        self._attributes.build(notes)
+        self._rebuild_label_map()
+        
+        self._items = {}
+        self._list_item_ids = {}
+        for note in notes:
+            self._index_items(note.id, note)
+    
+    def _apply_sync_changes(self) -> None:
+        """Update local indexes from the notes touched by the last sync."""
+        changed_note_ids, labels_changed = self.keep.pop_changes()
+        
+        if changed_note_ids or labels_changed:
+            self._sync_generation += 1
+        
+        if labels_changed:
+            self._rebuild_label_map()
+            
+            # Notes keep pointing at labels deleted on the server, but those
+            # notes are not part of the node delta
+            live_label_ids = {label.id for label in self.keep.labels()}
+            for label_id in self._attributes.label_ids() - live_label_ids:
+                changed_note_ids |= self._attributes.notes_with_label(label_id)
+        
+        for note_id in changed_note_ids:
+            self._reindex_note(note_id)
+    
+    def _rebuild_label_map(self) -> None:
+        """Rebuild the case-folded label name lookup table."""
+        self._labels_by_name = {}
+        for label in self.keep.labels():
+            # Same precedence as keep.findLabel(): first match wins
+            self._labels_by_name.setdefault(label.name.casefold(), label)
+        self._sorted_labels = None
+    
+    def _lookup_label(self, name: str) -> Optional[Any]:
+        """Find a label by case-insensitive name in constant time.
+        
+        Args:
+            name: Label name
+            
+        Returns:
+            gkeepapi Label or None if not found
+        """
+        return self._labels_by_name.get(name.casefold())
+    
+    def _page_in_sort_order(
+        self,
+        note_ids: Set[str],
+        page_size: int,
+        after: Optional[List[Any]] = None
+    ) -> Tuple[List[str], bool]:
+        """Return one page of note IDs in stable Keep sort order.
+        
+        Keyset pagination over (sort value descending, note ID), so memory
+        is bounded by the page size.
+        
+        Args:
+            note_ids: All matching note IDs
+            page_size: Maximum number of IDs to return
+            after: Sort key of the last note on the previous page
+            
+        Returns:
+            Tuple of (page of note IDs, whether more notes follow)
+        """
+        def key(note_id: str) -> Tuple[int, str]:
+            return (-self._attributes.sort_key(note_id), note_id)
+        
+        keys = (key(note_id) for note_id in note_ids)
+        if after is not None:
+            after_key = tuple(after)
+            keys = (k for k in keys if k > after_key)
+        
+        page = heapq.nsmallest(page_size + 1, keys)
+        return [note_id for _, note_id in page[:page_size]], len(page) > page_size
+    
+    def _reindex_note(self, note_id: str) -> None:
+        """Refresh index entries for one note, dropping it if it is gone.
+        
+        Args:
+            note_id: Google Keep note ID
+        """
+        note = self.keep.get(note_id)
+        if note is None:
+            self._index.remove(note_id)
+            self._attributes.remove(note_id)
+        else:
+            self._index.update(note)
+            self._attributes.update(note)
+        self._index_items(note_id, note)
+    
+    def _index_items(self, note_id: str, note: Optional[Any]) -> None:
+        """Refresh the item ID index for one list.
+        
+        Args:
+            note_id: Google Keep note ID
+            note: The note, or None if it no longer exists
+        """
+        for item_id in self._list_item_ids.pop(note_id, ()):
+            self._items.pop(item_id, None)
+        
+        if not isinstance(note, gkeepapi.node.List):
+            return
+        
+        item_ids = set()
+        for child in note.children:
+            if isinstance(child, gkeepapi.node.ListItem) and not child.deleted:
+                self._items[child.id] = (note_id, child)
+                item_ids.add(child.id)
+        self._list_item_ids[note_id] = item_ids
+    
+    def _after_mutation(self, result: Dict[str, Any]) -> None:
+        """Bring local indexes up to date after a local modification.
+        
+        Args:
+            result: Preview response returned by the modification
+        """
+        preview = result.get("preview", {})
+        self._record_pending(result["operation"], preview)
+        
+        if self._auto_sync is not None:
+            self._auto_sync.notify()
+            result["message"] = result["message"].replace(
+                "Call sync_changes() to save to Google Keep.",
+                f"Auto-sync will save it to Google Keep within {self._auto_sync.max_delay_seconds:g} seconds."
             )
         
-        # Initial sync to load notes (this can also fail with auth errors)
+        # Checking an item off changes nothing that is indexed
+        note_id = preview.get("note_id") or preview.get("list_id")
+        if note_id and result.get("operation") != "update_list_item_checked":
+            if self._deferred_reindex is not None:
+                self._deferred_reindex.add(note_id)
+            else:
+                self._reindex_note(note_id)
+        
+        label_id = preview.get("label_id")
+        if label_id:
+            label = self.keep.getLabel(label_id)
+            if label is not None:
+                self._labels_by_name.setdefault(label.name.casefold(), label)
+            self._sorted_labels = None
+    
+    def _record_pending(self, operation: str, preview: Dict[str, Any]) -> None:
+        """Record a modification in the pending change set.
+        
+        Field-level old/new values are taken from the preview's
+        old_<field>/new_<field> pairs. Repeated edits to the same field keep
+        the original old value and the latest new value.
+        
+        Args:
+            operation: Name of the modification operation
+            preview: Preview dictionary returned by the modification
+        """
+        if operation == "create_label":
+            self._pending_labels[preview["label_id"]] = preview["name"]
+            return
+        
+        note_id = preview.get("note_id") or preview.get("list_id")
+        if not note_id:
+            return
+        
+        entry = self._pending.setdefault(note_id, {
+            "created": False,
+            "fields": {},
+            "items": {},
+            "items_added": [],
+            "items_moved": {},
+            "labels_added": [],
+            "labels_removed": []
+        })
+        
+        if operation in ("create_note", "create_list"):
+            entry["created"] = True
+        elif operation == "update_list_item_checked":
+            item = entry["items"].setdefault(preview["item_id"], {
+                "item_id": preview["item_id"],
+                "item_text": preview["item_text"],
+                "old_checked": preview["old_checked"]
+            })
+            item["new_checked"] = preview["new_checked"]
+            return
+        elif operation == "add_list_item":
+            entry["items_added"].append(preview["new_item"])
+        elif operation == "add_list_items":
+            entry["items_added"].extend(preview["new_items"])
+            added = {item["item_id"]: item for item in entry["items_added"]}
+            for moved in preview.get("items_moved", []):
+                if moved["item_id"] in added:
+                    # Not synced yet either: report where it will land
+                    added[moved["item_id"]]["sort"] = moved["new_sort"]
+                    continue
+                item = entry["items_moved"].setdefault(moved["item_id"], {
+                    "item_id": moved["item_id"],
+                    "text": moved["text"],
+                    "old_sort": moved["old_sort"]
+                })
+                item["new_sort"] = moved["new_sort"]
+        elif operation == "add_label_to_note":
+            entry["labels_added"].append(preview["label_added"])
+        elif operation == "remove_label_from_note":
+            entry["labels_removed"].append(preview["label_removed"])
+        
+        for key, old_value in preview.items():
+            if not key.startswith("old_"):
+                continue
+            field = key[len("old_"):]
+            change = entry["fields"].setdefault(field, {"old": old_value})
+            change["new"] = preview.get("new_" + field)
+    
+    def _save_state(self) -> None:
+        """Persist the current node tree so the next start can resume from it."""
         try:
-            self.keep.sync()
+            save_state(self.email, self.keep.dump())
         except Exception as e:
-            error_msg = str(e).lower()
-            if 'auth' in error_msg or 'login' in error_msg or 'credential' in error_msg or 'badauthentication' in error_msg:
-                raise RuntimeError(
-                    f"AUTHENTICATION FAILED during initial sync: {str(e)}. "
-                    f"Your credentials are INVALID or EXPIRED. "
-                    f"You MUST re-authenticate by running: wlater-setup token (for automated setup) "
-                    f"or wlater-setup (for manual setup)."
-                )
-            raise RuntimeError(f"Failed to sync with Google Keep: {str(e)}")
-        
-        logger.info(f"Authenticated as {email}")
+            # The snapshot is only an optimization, never fail the caller
+            logger.warning(f"Failed to save state snapshot: {e}")
     
-    def get_all_notes(self, limit: int = 1000) -> List[Dict[str, Any]]:
-        """Retrieve all non-trashed notes and lists.
+    @_read_only
+    def get_all_notes(
+        self,
+        limit: int = 1000,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        output_format: str = "records"
+    ) -> Any:
+        """Retrieve all non-trashed notes and lists, one page at a time.
+        
+        Notes come in a stable order (Keep sort order, then ID). When more
+        notes remain, a final {"truncated": True, "next_cursor": ...} entry
+        is appended; pass next_cursor back to fetch the following page.
         
         Args:
-            limit: Maximum number of notes to return
+            limit: Maximum number of notes per page
+            cursor: Cursor from the previous page (None for the first page)
+            fields: Note fields to include (default: SUMMARY_FIELDS)
+            output_format: "records" for a list of note dictionaries, or
+                "table" for the compact form built by tabulate_notes()
             
         Returns:
-            List of note dictionaries with basic metadata
+            List of note dictionaries with basic metadata, or a table
+            dictionary when output_format is "table"
+            
+        Raises:
+            ValueError: If the cursor is invalid or expired, or an unknown
+                field or output format is requested
         """
+        if limit < 1:
+            raise ValueError(f"Page size must be at least 1, got {limit}")
+        fields = resolve_fields(fields, SUMMARY_FIELDS)
+        validate_output_format(output_format)
+        
         try:
+            params = {"tool": "list_all_notes", "limit": limit}
+            after = None
+            if cursor:
+                after = decode_cursor(cursor, self._sync_generation, params).get("after")
+            
+            note_ids = self._attributes.filter(trashed=False)
+            page_ids, has_more = self._page_in_sort_order(note_ids, limit, after)
+            
             notes = []
-            count = 0
             
-            for note in self.keep.all():
-                if note.trashed:
+            for note_id in page_ids:
+                note = self.keep.get(note_id)
+                if note is None:
                     continue
                     
-                notes.append({
-                    "note_id": note.id,
-                    "title": note.title or "",
-                    "note_type": "List" if isinstance(note, gkeepapi.node.List) else "Note",
-                    "pinned": note.pinned,
-                    "archived": note.archived,
-                    "color": note.color.name
-                })
-                
-                count += 1
-                if count >= limit:
-                    notes.append({"truncated": True, "message": f"Results limited to {limit} notes"})
-                    break
+                notes.append(project_note(note, fields))
+            
+            more = None
+            if has_more:
+                last_id = page_ids[-1]
+                more = {
+                    "truncated": True,
+                    "next_cursor": encode_cursor(
+                        self._sync_generation,
+                        params,
+                        {"after": [-self._attributes.sort_key(last_id), last_id]}
+                    ),
+                    "message": f"Results limited to {limit} notes. Pass next_cursor to get the next page."
+                }
             
+            if output_format == "table":
+                return tabulate_notes(notes, fields, more)
+            if more:
+                notes.append(more)
             return notes
+        except ValueError:
+            raise
         except Exception as e:
             logger.exception("Unexpected error in get_all_notes")
             error_msg = str(e).lower()
@@ -291,39 +1369,28 @@ class KeepClient:
                 )
             raise RuntimeError(f"Failed to retrieve notes: {str(e)}")
     
-    def get_note(self, note_id: str) -> Dict[str, Any]:
+    @_read_only
+    def get_note(self, note_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Get detailed content for a specific note.
         
         Args:
             note_id: Google Keep note ID
+            fields: Note fields to include (default: DETAIL_FIELDS)
             
         Returns:
             Dictionary with full note details
             
         Raises:
-            ValueError: If note_id doesn't exist
+            ValueError: If note_id doesn't exist or an unknown field is requested
         """
         try:
+            fields = resolve_fields(fields, DETAIL_FIELDS)
             note = self.keep.get(note_id)
             
             if note is None:
                 raise ValueError(f"Note {note_id} not found")
             
-            return {
-                "note_id": note.id,
-                "title": note.title or "",
-                "text": note.text,
-                "note_type": "List" if isinstance(note, gkeepapi.node.List) else "Note",
-                "color": note.color.name,
-                "pinned": note.pinned,
-                "archived": note.archived,
-                "labels": [{"id": label.id, "name": label.name} for label in note.labels.all()],
-                "timestamps": {
-                    "created": note.timestamps.created.isoformat(),
-                    "updated": note.timestamps.updated.isoformat(),
-                    "edited": note.timestamps.edited.isoformat()
-                }
-            }
+            return project_note(note, fields)
         except ValueError:
             # Re-raise ValueError for proper handling by MCP server
             raise
@@ -331,6 +1398,7 @@ class KeepClient:
             logger.exception("Unexpected error in get_note")
             raise RuntimeError(f"Failed to get note: {str(e)}")
     
+    @_read_only
     def get_list_items(self, list_id: str) -> Dict[str, Any]:
         """Get list items with checked status.
         
@@ -385,6 +1453,7 @@ class KeepClient:
             logger.exception("Unexpected error in get_list_items")
             raise RuntimeError(f"Failed to get list items: {str(e)}")
     
+    @_read_only
     def search_notes(
         self,
         query: Optional[str] = None,
@@ -393,10 +1462,20 @@ class KeepClient:
         trashed: Optional[bool] = None,
         colors: Optional[List[str]] = None,
         labels: Optional[List[str]] = None,
-        limit: int = 100
-    ) -> List[Dict[str, Any]]:
+        limit: int = 100,
+        fuzzy: bool = False,
+        fuzzy_threshold: float = FUZZY_THRESHOLD,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        output_format: str = "records"
+    ) -> Any:
         """Search notes with filters.
         
+        Text queries are answered from the inverted index: a note matches
+        when it contains every word of the query (words match as prefixes)
+        and every double-quoted phrase. Matches are ranked by relevance
+        (BM25, title matches boosted) and carry a highlighted snippet.
+        
         Args:
             query: Text to search for (case-insensitive)
             pinned: Filter by pinned status
@@ -405,56 +1484,127 @@ class KeepClient:
             colors: Filter by color names
             labels: Filter by label names
             limit: Maximum number of results
+            fuzzy: Also match misspelled words via trigram similarity
+            fuzzy_threshold: Minimum similarity (0-1) for fuzzy matches
+            cursor: Cursor from the previous page (None for the first page)
+            fields: Fields to include, from NOTE_FIELDS plus "score" and
+                "snippet" (default: SUMMARY_FIELDS plus score and snippet)
+            output_format: "records" for a list of note dictionaries, or
+                "table" for the compact form built by tabulate_notes()
             
         Returns:
-            List of matching note dictionaries
+            List of matching note dictionaries, most relevant first for
+            text queries. When more matches remain, a final
+            {"truncated": True, "next_cursor": ...} entry is appended.
+            With output_format "table", a table dictionary instead.
+            
+        Raises:
+            ValueError: If fuzzy_threshold is outside (0, 1], the cursor
+                is invalid or expired, or an unknown field or output
+                format is requested
         """
+        if not 0 < fuzzy_threshold <= 1:
+            raise ValueError(f"fuzzy_threshold must be between 0 and 1, got {fuzzy_threshold}")
+        if limit < 1:
+            raise ValueError(f"Page size must be at least 1, got {limit}")
+        fields = resolve_fields(fields, SUMMARY_FIELDS + ["score", "snippet"], extra=("score", "snippet"))
+        validate_output_format(output_format)
+        
         try:
-            # Convert query to case-insensitive regex pattern
+            # Text searches skip trashed notes unless asked for explicitly
+            if query and trashed is None:
+                trashed = False
+            
+            params = {
+                "tool": "search_notes", "query": query, "pinned": pinned,
+                "archived": archived, "trashed": trashed, "colors": colors,
+                "labels": labels, "limit": limit, "fuzzy": fuzzy,
+                "fuzzy_threshold": fuzzy_threshold
+            }
+            position = {}
+            if cursor:
+                position = decode_cursor(cursor, self._sync_generation, params)
+            
+            candidate_ids = None
+            ranked = False
             if query:
-                # Escape special regex characters and make case-insensitive
-                pattern = re.compile(re.escape(query), re.IGNORECASE)
-                results = self.keep.find(query=pattern)
+                # Answer term and phrase queries from the inverted index
+                candidate_ids = self._index.search(query, fuzzy, fuzzy_threshold)
+                if candidate_ids is not None:
+                    ranked = True
+                else:
+                    # No indexable words (e.g. only punctuation): fall back to
+                    # a case-insensitive substring scan
+                    pattern = re.compile(re.escape(query), re.IGNORECASE)
+                    candidate_ids = {note.id for note in self.keep.find(query=pattern, trashed=None)}
+            
+            # Resolve filters through the secondary indexes
+            label_ids = None
+            if labels:
+                label_ids = [label.id for label in map(self._lookup_label, labels) if label is not None]
+            
+            note_ids = self._attributes.filter(
+                candidates=candidate_ids,
+                pinned=pinned,
+                archived=archived,
+                trashed=trashed,
+                colors=colors,
+                label_ids=label_ids
+            )
+            
+            scores = {}
+            if ranked:
+                # Rank by relevance (BM25 over title, text and list items)
+                weights = self._index.match_terms(query, fuzzy, fuzzy_threshold)
+                ranking = self._index.rank(weights, note_ids)
+                scores = dict(ranking)
+                offset = position.get("offset", 0)
+                ordered_ids = [note_id for note_id, _ in ranking[offset:offset + limit]]
+                has_more = offset + limit < len(ranking)
+                next_position = {"offset": offset + limit}
             else:
-                results = self.keep.all()
+                # Keep's own sort order
+                ordered_ids, has_more = self._page_in_sort_order(note_ids, limit, position.get("after"))
+                if ordered_ids:
+                    last_id = ordered_ids[-1]
+                    next_position = {"after": [-self._attributes.sort_key(last_id), last_id]}
+            
+            matches = [self.keep.get(note_id) for note_id in ordered_ids]
+            matches = [note for note in matches if note is not None]
             
             notes = []
-            count = 0
             
-            for note in results:
-                # Apply filters
-                if pinned is not None and note.pinned != pinned:
-                    continue
-                if archived is not None and note.archived != archived:
-                    continue
-                if trashed is not None and note.trashed != trashed:
-                    continue
-                if colors and note.color.name not in colors:
-                    continue
-                if labels:
-                    note_labels = {label.name for label in note.labels.all()}
-                    if not any(label in note_labels for label in labels):
-                        continue
+            for note in matches:
+                note_dict = project_note(note, fields)
                 
-                notes.append({
-                    "note_id": note.id,
-                    "title": note.title or "",
-                    "note_type": "List" if isinstance(note, gkeepapi.node.List) else "Note",
-                    "pinned": note.pinned,
-                    "archived": note.archived,
-                    "color": note.color.name
-                })
+                if ranked:
+                    if "score" in fields:
+                        note_dict["score"] = round(scores[note.id], 3)
+                    if "snippet" in fields:
+                        note_dict["snippet"] = make_snippet(note, weights)
                 
-                count += 1
-                if count >= limit:
-                    notes.append({"truncated": True, "message": f"Results limited to {limit} notes"})
-                    break
+                notes.append(note_dict)
+            
+            more = None
+            if has_more:
+                more = {
+                    "truncated": True,
+                    "next_cursor": encode_cursor(self._sync_generation, params, next_position),
+                    "message": f"Results limited to {limit} notes. Pass next_cursor to get the next page."
+                }
             
+            if output_format == "table":
+                return tabulate_notes(notes, fields, more)
+            if more:
+                notes.append(more)
             return notes
+        except ValueError:
+            raise
         except Exception as e:
             logger.exception("Unexpected error in search_notes")
             raise RuntimeError(f"Failed to search notes: {str(e)}")
     
+    @_read_only
     def get_labels(self) -> List[Dict[str, str]]:
         """Get all labels sorted alphabetically.
         
@@ -462,23 +1612,27 @@ class KeepClient:
             List of label dictionaries with id and name
         """
         try:
-            labels = []
-            
-            for label in self.keep.labels():
-                if not label.deleted:
-                    labels.append({
-                        "label_id": label.id,
-                        "name": label.name
-                    })
-            
-            # Sort alphabetically by name
-            labels.sort(key=lambda x: x["name"].lower())
+            # Sorted view is cached until labels change
+            if self._sorted_labels is None:
+                labels = []
+                
+                for label in self.keep.labels():
+                    if not label.deleted:
+                        labels.append({
+                            "label_id": label.id,
+                            "name": label.name
+                        })
+                
+                # Sort alphabetically by name
+                labels.sort(key=lambda x: x["name"].lower())
+                self._sorted_labels = labels
             
-            return labels
+            return [dict(label) for label in self._sorted_labels]
         except Exception as e:
             logger.exception("Unexpected error in get_labels")
             raise RuntimeError(f"Failed to retrieve labels: {str(e)}")
     
+    @_read_only
     def find_label(self, name: str) -> Optional[Dict[str, str]]:
         """Find a label by name (case-insensitive).
         
@@ -489,7 +1643,7 @@ class KeepClient:
             Label dictionary or None if not found
         """
         try:
-            label = self.keep.findLabel(name)
+            label = self._lookup_label(name)
             
             if label is None:
                 return None
@@ -508,6 +1662,7 @@ class KeepClient:
     
     # List Item Operations
     
+    @_mutation
     def update_list_item_checked(
         self, 
         list_id: str, 
@@ -543,12 +1698,9 @@ class KeepClient:
                     "Use get_note() to check note type"
                 )
             
-            # Find list item by iterating through list.items
-            target_item = None
-            for item in note.items:
-                if item.id == item_id:
-                    target_item = item
-                    break
+            # Find list item through the item index
+            list_and_item = self._items.get(item_id)
+            target_item = list_and_item[1] if list_and_item and list_and_item[0] == note.id else None
             
             if target_item is None:
                 return format_error_response(
@@ -585,6 +1737,38 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    def update_item_checked(
+        self, 
+        item_id: str, 
+        checked: bool
+    ) -> Dict[str, Any]:
+        """Update checked status of a list item given only its ID.
+        
+        The parent list is resolved from the item index, then the update
+        is delegated without holding the client lock so its journal commit
+        runs after the lock is released. update_list_item_checked()
+        re-checks that the item is still in that list.
+        
+        Args:
+            item_id: List item ID
+            checked: New checked status
+            
+        Returns:
+            Preview response with old and new checked status
+        """
+        with self._rw.read():
+            list_and_item = self._items.get(item_id)
+        
+        if list_and_item is None:
+            return format_error_response(
+                "ValueError",
+                f"Item {item_id} not found in any list",
+                "Use get_list_items() to see available items"
+            )
+        
+        return self.update_list_item_checked(list_and_item[0], item_id, checked)
+    
+    @_mutation
     def add_list_item(
         self, 
         list_id: str, 
@@ -657,8 +1841,185 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    @_mutation
+    def add_list_items(
+        self,
+        list_id: str,
+        items: List[Any],
+        position: str = "bottom",
+        after_item_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Add many items to an existing list in one call.
+        
+        Sort keys for all new items are computed in one pass over the
+        existing items. Keep shows higher sort keys first, so new items take
+        keys above the current maximum (top), below the current minimum
+        (bottom), or evenly spaced in the gap below after_item_id. Existing
+        items are only renumbered when that gap is too small, in which case
+        every item below the gap is shifted down once; those items are listed
+        in the preview's items_moved and in get_pending_changes(), since
+        syncing pushes them too.
+        
+        Args:
+            list_id: Google Keep list ID
+            items: Item texts, or dictionaries with "text" and optional "checked"
+            position: "top", "bottom" (default) or "after"
+            after_item_id: Item to insert after when position is "after"
+            
+        Returns:
+            Preview response with the new items in list order
+        """
+        try:
+            # Normalize and validate items
+            new_items = []
+            for index, item in enumerate(items or []):
+                if isinstance(item, str):
+                    text, checked = item, False
+                elif isinstance(item, dict):
+                    text, checked = item.get("text"), bool(item.get("checked", False))
+                else:
+                    text, checked = None, False
+                
+                if not isinstance(text, str) or not text.strip():
+                    return format_error_response(
+                        "ValueError",
+                        f"Item {index} has no text",
+                        "Provide non-empty item texts, or objects like {\"text\": \"...\", \"checked\": false}"
+                    )
+                new_items.append((text, checked))
+            
+            if not new_items:
+                return format_error_response(
+                    "ValueError",
+                    "No items given",
+                    "Provide at least one item to add"
+                )
+            
+            if position not in ("top", "bottom", "after"):
+                return format_error_response(
+                    "ValueError",
+                    f"Invalid position '{position}'",
+                    "Valid positions: top, bottom, after"
+                )
+            
+            # Get list by ID
+            note = self.keep.get(list_id)
+            
+            if note is None:
+                return format_error_response(
+                    "ValueError",
+                    f"List {list_id} not found",
+                    "Use list_all_notes() to see available lists"
+                )
+            
+            # Validate it's a List type
+            if not isinstance(note, gkeepapi.node.List):
+                return format_error_response(
+                    "TypeError",
+                    f"Note {list_id} is not a List type",
+                    "Use create_note() for text notes"
+                )
+            
+            # Only top-level items take part in ordering; indented items
+            # sort together with their parent
+            existing = [
+                child for child in note.children
+                if isinstance(child, gkeepapi.node.ListItem) and not child.deleted and not child.indented
+            ]
+            sorts = [int(child.sort) for child in existing]
+            count = len(new_items)
+            delta = gkeepapi.node.List.SORT_DELTA
+            moved = []
+            
+            if position == "after":
+                list_and_item = self._items.get(after_item_id) if after_item_id else None
+                if list_and_item is None or list_and_item[0] != note.id:
+                    return format_error_response(
+                        "ValueError",
+                        f"Item {after_item_id} not found in list {list_id}",
+                        "Use get_list_items() to see available items"
+                    )
+                
+                anchor = list_and_item[1]
+                if anchor.indented and anchor.parent_item is not None:
+                    # Insert after the whole indented group
+                    anchor = anchor.parent_item
+                upper = int(anchor.sort)
+                below = [sort for sort in sorts if sort < upper]
+                lower = max(below) if below else upper - delta * (count + 1)
+                
+                if upper - lower <= count:
+                    # Gap exhausted: move everything below it down in one pass
+                    shift = delta * (count + 1)
+                    for child in existing:
+                        old_sort = int(child.sort)
+                        if old_sort <= lower:
+                            child.sort = old_sort - shift
+                            moved.append({
+                                "item_id": child.id,
+                                "text": child.text,
+                                "old_sort": old_sort,
+                                "new_sort": child.sort
+                            })
+                    lower -= shift
+                
+                step = (upper - lower) // (count + 1)
+                keys = [upper - step * (i + 1) for i in range(count)]
+            elif not sorts:
+                keys = [delta * (count - i) for i in range(count)]
+            elif position == "top":
+                top = max(sorts)
+                keys = [top + delta * (count - i) for i in range(count)]
+            else:
+                bottom = min(sorts)
+                keys = [bottom - delta * (i + 1) for i in range(count)]
+            
+            # Build the nodes directly: List.add() rescans and re-sorts the
+            # whole list for every item
+            added = []
+            for (text, checked), key in zip(new_items, keys):
+                node = gkeepapi.node.ListItem(parent_id=note.id, parent_server_id=note.server_id)
+                node.checked = checked
+                node.text = text
+                node.sort = key
+                note.append(node, True)
+                added.append(node)
+            note.touch(True)
+            
+            # Return preview with the new items in list order
+            preview = {
+                "list_id": list_id,
+                "list_title": note.title or "",
+                "position": position,
+                "new_items": [
+                    {
+                        "item_id": node.id,
+                        "text": node.text,
+                        "checked": node.checked,
+                        "sort": node.sort
+                    }
+                    for node in added
+                ]
+            }
+            if moved:
+                preview["items_moved"] = moved
+            return format_preview_response(
+                "add_list_items",
+                preview,
+                f"{len(added)} items added to list locally. Call sync_changes() to save to Google Keep."
+            )
+            
+        except Exception as e:
+            logger.exception("Unexpected error in add_list_items")
+            return format_error_response(
+                type(e).__name__,
+                f"Unexpected error: {str(e)}",
+                "Check server logs for details"
+            )
+    
     # Note Creation
     
+    @_mutation
     def create_note(
         self, 
         title: str = "", 
@@ -698,6 +2059,7 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    @_mutation
     def create_list(
         self, 
         title: str = "", 
@@ -758,6 +2120,7 @@ class KeepClient:
     
     # Note Updates
     
+    @_mutation
     def update_note_title(
         self, 
         note_id: str, 
@@ -809,6 +2172,7 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    @_mutation
     def update_note_text(
         self, 
         note_id: str, 
@@ -870,6 +2234,7 @@ class KeepClient:
     
     # Note Properties
     
+    @_mutation
     def update_note_color(
         self, 
         note_id: str, 
@@ -939,6 +2304,7 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    @_mutation
     def update_note_pinned(
         self, 
         note_id: str, 
@@ -991,6 +2357,7 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    @_mutation
     def update_note_archived(
         self, 
         note_id: str, 
@@ -1045,6 +2412,7 @@ class KeepClient:
     
     # Label Operations
     
+    @_mutation
     def create_label(
         self, 
         name: str
@@ -1067,7 +2435,7 @@ class KeepClient:
                 )
             
             # Check if label already exists
-            existing_label = self.keep.findLabel(name)
+            existing_label = self._lookup_label(name)
             if existing_label is not None:
                 return format_error_response(
                     "ValueError",
@@ -1096,6 +2464,7 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    @_mutation
     def add_label_to_note(
         self, 
         note_id: str, 
@@ -1121,8 +2490,8 @@ class KeepClient:
                     "Use list_all_notes() to see available notes"
                 )
             
-            # Find label using keep.findLabel(label_name)
-            label = self.keep.findLabel(label_name)
+            # Find label by case-insensitive name
+            label = self._lookup_label(label_name)
             
             if label is None:
                 return format_error_response(
@@ -1132,8 +2501,7 @@ class KeepClient:
                 )
             
             # Check if label is already on the note
-            existing_labels = {lbl.name for lbl in note.labels.all()}
-            if label_name in existing_labels:
+            if note.labels.get(label.id) is not None:
                 return format_error_response(
                     "ValueError",
                     f"Label '{label_name}' is already on note {note_id}",
@@ -1167,6 +2535,7 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    @_mutation
     def remove_label_from_note(
         self, 
         note_id: str, 
@@ -1192,8 +2561,8 @@ class KeepClient:
                     "Use list_all_notes() to see available notes"
                 )
             
-            # Find label using keep.findLabel(label_name)
-            label = self.keep.findLabel(label_name)
+            # Find label by case-insensitive name
+            label = self._lookup_label(label_name)
             
             if label is None:
                 return format_error_response(
@@ -1203,8 +2572,7 @@ class KeepClient:
                 )
             
             # Check if label is on the note
-            existing_labels = {lbl.name for lbl in note.labels.all()}
-            if label_name not in existing_labels:
+            if note.labels.get(label.id) is None:
                 return format_error_response(
                     "ValueError",
                     f"Label '{label_name}' is not on note {note_id}",
@@ -1252,7 +2620,7 @@ class KeepClient:
             # We'll sync and report success
             
             # Call keep.sync() to push all pending changes
-            self.keep.sync()
+            self._sync()
             
             # Generate timestamp
             timestamp = datetime.utcnow().isoformat() + "Z"
@@ -1280,45 +2648,81 @@ class KeepClient:
                 "Check network connection and credentials"
             )
     
+    @_read_only
     def get_pending_changes(self) -> Dict[str, Any]:
         """Get preview of all pending changes.
         
+        Built from the set of notes touched since the last sync, so the
+        cost grows with the number of pending changes, not the corpus.
+        
         Returns:
-            Structured preview of all pending changes
+            Structured preview of all pending changes with field-level
+            old and new values
         """
         try:
             changes = []
             
-            # Iterate through all notes to find dirty/modified notes
-            for note in self.keep.all():
-                # Check if note is dirty (has pending changes)
-                if note.dirty:
-                    # Determine change type based on note state
-                    change_type = "modified"
-                    details = ""
-                    
-                    # Check if it's a new note (no timestamps yet or very recent)
-                    if hasattr(note, 'timestamps') and note.timestamps.created == note.timestamps.updated:
-                        change_type = "created"
-                        if isinstance(note, gkeepapi.node.List):
-                            details = f"New list with {len(note.items)} items"
-                        else:
-                            details = "New note created"
+            # Only notes touched by modifications since the last sync
+            for note_id, entry in self._pending.items():
+                note = self.keep.get(note_id)
+                if note is None:
+                    continue
+                
+                is_list = isinstance(note, gkeepapi.node.List)
+                
+                if entry["created"]:
+                    change_type = "created"
+                    if is_list:
+                        details = f"New list with {len(self._list_item_ids.get(note_id, ()))} items"
                     else:
-                        # For modified notes, provide generic details
-                        if isinstance(note, gkeepapi.node.List):
-                            details = "List modified"
-                        else:
-                            details = "Note modified"
-                    
-                    # Build list of changes with note IDs and change types
-                    changes.append({
-                        "note_id": note.id,
-                        "note_title": note.title or "(Untitled)",
-                        "note_type": "List" if isinstance(note, gkeepapi.node.List) else "Note",
-                        "change_type": change_type,
-                        "details": details
-                    })
+                        details = "New note created"
+                else:
+                    change_type = "modified"
+                    changed = list(entry["fields"])
+                    if entry["items"]:
+                        changed.append(f"{len(entry['items'])} item(s) checked/unchecked")
+                    if entry["items_added"]:
+                        changed.append(f"{len(entry['items_added'])} item(s) added")
+                    if entry["items_moved"]:
+                        changed.append(f"{len(entry['items_moved'])} item(s) moved to make room")
+                    if entry["labels_added"] or entry["labels_removed"]:
+                        changed.append("labels")
+                    details = f"{'List' if is_list else 'Note'} modified: {', '.join(changed)}"
+                
+                change = {
+                    "note_id": note_id,
+                    "note_title": note.title or "(Untitled)",
+                    "note_type": "List" if is_list else "Note",
+                    "change_type": change_type,
+                    "details": details
+                }
+                
+                # Field-level old/new values captured from the previews
+                if not entry["created"]:
+                    if entry["fields"]:
+                        change["fields"] = {
+                            field: dict(values) for field, values in entry["fields"].items()
+                        }
+                    if entry["items"]:
+                        change["items_checked"] = [dict(item) for item in entry["items"].values()]
+                    if entry["items_moved"]:
+                        change["items_moved"] = [dict(item) for item in entry["items_moved"].values()]
+                if entry["items_added"]:
+                    change["items_added"] = list(entry["items_added"])
+                if entry["labels_added"]:
+                    change["labels_added"] = list(entry["labels_added"])
+                if entry["labels_removed"]:
+                    change["labels_removed"] = list(entry["labels_removed"])
+                
+                changes.append(change)
+            
+            for label_id, name in self._pending_labels.items():
+                changes.append({
+                    "label_id": label_id,
+                    "name": name,
+                    "change_type": "created",
+                    "details": f"New label '{name}'"
+                })
             
             # Return structured preview of all pending changes
             has_changes = len(changes) > 0
@@ -1348,7 +2752,7 @@ class KeepClient:
         try:
             # Call keep.sync() to fetch latest data and push pending changes
             # Note: keep.sync() both pushes local changes AND pulls server changes
-            self.keep.sync()
+            self._sync()
             
             # Generate timestamp
             timestamp = datetime.utcnow().isoformat() + "Z"
@@ -1376,8 +2780,129 @@ class KeepClient:
                 "Check network connection and credentials"
             )
     
+    def start_sync_job(self, operation: str = "sync") -> Dict[str, Any]:
+        """Start a sync or refresh on a background thread.
+        
+        Only one job runs at a time; starting another while one is running
+        returns the running job instead. Reads are not blocked while the
+        job talks to Google Keep and keep seeing the last synced notes.
+        
+        Args:
+            operation: "sync" (push pending changes) or "refresh" (pull the
+                latest notes); both run a full two-way sync
+            
+        Returns:
+            Response with the job handle to pass to get_sync_job()
+        """
+        if operation not in ("sync", "refresh"):
+            return format_error_response(
+                "ValueError",
+                f"Invalid operation '{operation}'",
+                "Valid operations: sync, refresh"
+            )
+        
+        with self._jobs_lock:
+            if self._active_job is not None:
+                return {
+                    "success": True,
+                    "job_id": self._active_job["job_id"],
+                    "status": "running",
+                    "message": (
+                        f"A {self._active_job['operation']} job is already running. "
+                        f"Call get_sync_job() with this job_id to check on it."
+                    )
+                }
+            
+            job = {
+                "job_id": uuid.uuid4().hex[:12],
+                "operation": operation,
+                "status": "running",
+                "started_at": datetime.utcnow().isoformat() + "Z",
+                "finished_at": None,
+                "duration_seconds": None,
+                "result": None,
+                "_started": time.monotonic(),
+                "_nodes_at_start": self.keep.nodes_received
+            }
+            self._jobs[job["job_id"]] = job
+            while len(self._jobs) > SYNC_JOB_HISTORY:
+                del self._jobs[next(iter(self._jobs))]
+            
+            self._active_job = job
+            self._active_job_thread = threading.Thread(
+                target=self._run_sync_job,
+                args=(job,),
+                name=f"wlater-{operation}-job",
+                daemon=True
+            )
+            self._active_job_thread.start()
+        
+        return {
+            "success": True,
+            "job_id": job["job_id"],
+            "status": "running",
+            "message": f"{operation.capitalize()} started in the background. Call get_sync_job() with this job_id to check on it."
+        }
+    
+    def _run_sync_job(self, job: Dict[str, Any]) -> None:
+        """Run one background sync job and publish its result.
+        
+        Args:
+            job: Job record created by start_sync_job()
+        """
+        try:
+            if job["operation"] == "refresh":
+                result = self.refresh_from_server()
+            else:
+                result = self.sync_changes()
+        except Exception as e:
+            # sync_changes/refresh_from_server report errors themselves;
+            # this only guards the job record against unexpected failures
+            logger.exception("Unexpected error in background sync job")
+            result = format_error_response(type(e).__name__, f"Unexpected error: {str(e)}", "Check server logs for details")
+        
+        with self._jobs_lock:
+            job["status"] = "succeeded" if result.get("success") else "failed"
+            job["result"] = result
+            job["finished_at"] = datetime.utcnow().isoformat() + "Z"
+            job["duration_seconds"] = round(time.monotonic() - job["_started"], 3)
+            job["nodes_received"] = self.keep.nodes_received - job["_nodes_at_start"]
+            self._active_job = None
+            self._active_job_thread = None
+    
+    def get_sync_job(self, job_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get status, progress and result of a background sync job.
+        
+        Args:
+            job_id: Job ID from start_sync_job() (default: most recent job)
+            
+        Returns:
+            Job dictionary with status ("running", "succeeded" or "failed"),
+            timing, nodes received so far and, once finished, the result
+        """
+        with self._jobs_lock:
+            if job_id is None:
+                job = self._jobs[next(reversed(self._jobs))] if self._jobs else None
+            else:
+                job = self._jobs.get(job_id)
+            
+            if job is None:
+                return format_error_response(
+                    "ValueError",
+                    f"Sync job {job_id} not found" if job_id else "No sync jobs have been started",
+                    f"Only the last {SYNC_JOB_HISTORY} jobs are kept. Start one with sync_changes(wait=False)."
+                )
+            
+            status = {key: value for key, value in job.items() if not key.startswith("_")}
+            if job["status"] == "running":
+                status["elapsed_seconds"] = round(time.monotonic() - job["_started"], 3)
+                status["nodes_received"] = self.keep.nodes_received - job["_nodes_at_start"]
+            
+            return {"success": True, **status}
+    
     # Media Operations (Read-Only)
     
+    @_read_only
     def get_note_media(
         self, 
         note_id: str
@@ -1478,6 +3003,10 @@ class KeepClient:
     ) -> Dict[str, Any]:
         """Get download URL for a media blob.
         
+        The blob is looked up under the read lock, but the request to
+        Google (which may back off and retry) runs without it so a waiting
+        sync doesn't hold up every other read.
+        
         Args:
             note_id: Google Keep note ID
             blob_id: Media blob ID
@@ -1486,53 +3015,54 @@ class KeepClient:
             URL with media metadata
         """
         try:
-            # Get note by ID using keep.get()
-            note = self.keep.get(note_id)
-            
-            if note is None:
-                return format_error_response(
-                    "ValueError",
-                    f"Note {note_id} not found",
-                    "Use list_all_notes() to see available notes"
-                )
-            
-            # Find blob by ID in note.images, note.drawings, or note.audio
-            blob = None
-            media_type = None
-            
-            # Search in images
-            for img in note.images:
-                if img.id == blob_id:
-                    blob = img
-                    media_type = "image"
-                    break
-            
-            # Search in drawings if not found
-            if blob is None:
-                for draw in note.drawings:
-                    if draw.id == blob_id:
-                        blob = draw
-                        media_type = "drawing"
-                        break
-            
-            # Search in audio if not found
-            if blob is None:
-                for aud in note.audio:
-                    if aud.id == blob_id:
-                        blob = aud
-                        media_type = "audio"
+            with self._rw.read():
+                # Get note by ID using keep.get()
+                note = self.keep.get(note_id)
+            
+                if note is None:
+                    return format_error_response(
+                        "ValueError",
+                        f"Note {note_id} not found",
+                        "Use list_all_notes() to see available notes"
+                    )
+            
+                # Find blob by ID in note.images, note.drawings, or note.audio
+                blob = None
+                media_type = None
+            
+                # Search in images
+                for img in note.images:
+                    if img.id == blob_id:
+                        blob = img
+                        media_type = "image"
                         break
             
-            # If blob not found, return error
-            if blob is None:
-                return format_error_response(
-                    "ValueError",
-                    f"Media blob {blob_id} not found in note {note_id}",
-                    "Use get_note_media() to see available media blobs"
-                )
+                # Search in drawings if not found
+                if blob is None:
+                    for draw in note.drawings:
+                        if draw.id == blob_id:
+                            blob = draw
+                            media_type = "drawing"
+                            break
+            
+                # Search in audio if not found
+                if blob is None:
+                    for aud in note.audio:
+                        if aud.id == blob_id:
+                            blob = aud
+                            media_type = "audio"
+                            break
+            
+                # If blob not found, return error
+                if blob is None:
+                    return format_error_response(
+                        "ValueError",
+                        f"Media blob {blob_id} not found in note {note_id}",
+                        "Use get_note_media() to see available media blobs"
+                    )
             
             # Call keep.getMediaLink(blob) to get download URL
-            download_url = self.keep.getMediaLink(blob)
+            download_url = self._call_keep("get_media_link", self.keep.getMediaLink, blob)
             
             # Return URL with media metadata
             return {
@@ -1554,6 +3084,7 @@ class KeepClient:
     
     # Trash Operations (Recoverable)
     
+    @_mutation
     def trash_note(
         self, 
         note_id: str
@@ -1604,6 +3135,7 @@ class KeepClient:
                 "Check server logs for details"
             )
     
+    @_mutation
     def untrash_note(
         self, 
         note_id: str
@@ -1653,3 +3185,215 @@ class KeepClient:
                 f"Unexpected error: {str(e)}",
                 "Check server logs for details"
             )
+    
+    # Batch Operations
+    
+    def _validate_batch_operation(
+        self,
+        operation: Any,
+        label_state: Dict[Tuple[str, str], bool]
+    ) -> Optional[str]:
+        """Check one batch_apply operation against the current notes.
+        
+        Args:
+            operation: Operation dictionary, e.g. {"op": "check", "item_id": "..."}
+            label_state: (note_id, label_id) -> whether the label will be on
+                the note after the operations validated so far; updated here
+            
+        Returns:
+            Error message if the operation is invalid, None otherwise
+        """
+        if not isinstance(operation, dict):
+            return "Operation must be an object with an 'op' field"
+        
+        op = operation.get("op")
+        if op not in BATCH_OPERATIONS:
+            return f"Unknown op '{op}'. Valid ops: {', '.join(BATCH_OPERATIONS)}"
+        
+        _, required, _ = BATCH_OPERATIONS[op]
+        optional = BATCH_OPTIONAL_ARGUMENTS.get(op, {})
+        
+        unexpected = set(operation) - {"op"} - set(required) - set(optional)
+        if unexpected:
+            return f"Unexpected argument(s) for '{op}': {', '.join(sorted(unexpected))}"
+        
+        for name, expected in {**required, **optional}.items():
+            if name not in operation:
+                if name in required:
+                    return f"Missing argument '{name}' for '{op}'"
+                continue
+            if not isinstance(operation[name], expected):
+                return f"Argument '{name}' for '{op}' must be {expected.__name__}"
+        
+        if "item_id" in operation and operation["item_id"] not in self._items:
+            return f"Item {operation['item_id']} not found in any list"
+        
+        note_id = operation.get("note_id") or operation.get("list_id")
+        if note_id is not None:
+            note = self.keep.get(note_id)
+            if note is None:
+                return f"Note {note_id} not found"
+            is_list = isinstance(note, gkeepapi.node.List)
+            if op == "add_item" and not is_list:
+                return f"Note {note_id} is not a List type"
+            if op == "set_text" and is_list:
+                return f"Note {note_id} is a List type. Lists do not support text updates"
+        
+        if op == "add_item" and not operation["text"].strip():
+            return "Item text cannot be empty"
+        
+        if op == "set_color":
+            error = validate_color(operation["color"])
+            if error:
+                return error["message"]
+        
+        if "label_name" in operation:
+            label = self._lookup_label(operation["label_name"])
+            if label is None:
+                return f"Label '{operation['label_name']}' not found"
+            
+            # Follow membership through the batch so repeated adds or
+            # removes are caught before anything is applied
+            key = (note_id, label.id)
+            if key not in label_state:
+                label_state[key] = note.labels.get(label.id) is not None
+            adding = op == "add_label"
+            if label_state[key] == adding:
+                state = "already on" if adding else "not on"
+                return f"Label '{operation['label_name']}' is {state} note {note_id}"
+            label_state[key] = adding
+        
+        return None
+    
+    def _run_batch(
+        self,
+        operations: List[Any]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Validate and apply batch operations under the client lock.
+        
+        Args:
+            operations: Operation dictionaries passed to batch_apply()
+            
+        Returns:
+            Tuple of (validation errors, applied results, failure). Nothing
+            is applied when there are validation errors. Readers see the
+            batch all at once.
+        """
+        with self._lock, self._rw.write():
+            errors = []
+            label_state: Dict[Tuple[str, str], bool] = {}
+            for index, operation in enumerate(operations):
+                message = self._validate_batch_operation(operation, label_state)
+                if message:
+                    op = operation.get("op") if isinstance(operation, dict) else None
+                    errors.append({"index": index, "op": op, "message": message})
+            
+            if errors:
+                return errors, [], None
+            
+            results = []
+            failure = None
+            self._deferred_reindex = set()
+            try:
+                for index, operation in enumerate(operations):
+                    method_name, _, fixed = BATCH_OPERATIONS[operation["op"]]
+                    arguments = {name: value for name, value in operation.items() if name != "op"}
+                    result = getattr(self, method_name)(**arguments, **fixed)
+                    
+                    if not result.get("success"):
+                        failure = {"index": index, "op": operation["op"], "message": result.get("message")}
+                        break
+                    results.append({"index": index, "op": operation["op"], "preview": result["preview"]})
+            finally:
+                deferred, self._deferred_reindex = self._deferred_reindex, None
+                for note_id in deferred:
+                    self._reindex_note(note_id)
+            
+            return [], results, failure
+    
+    def batch_apply(
+        self,
+        operations: List[Dict[str, Any]],
+        sync: bool = False
+    ) -> Dict[str, Any]:
+        """Apply many modifications in one call.
+        
+        Every operation is validated before any is applied; if one is
+        invalid nothing changes. Operations then run in order through the
+        regular modification methods, with reindexing deferred until the
+        whole batch is done. Should an operation still fail while applying,
+        applying stops there; operations before it stay applied locally.
+        
+        Args:
+            operations: Operation dictionaries with an "op" field, one of
+                BATCH_OPERATIONS, plus that operation's arguments
+            sync: Sync to Google Keep after all operations are applied
+            
+        Returns:
+            Combined preview response with one result per operation
+        """
+        if not operations:
+            return format_error_response(
+                "ValueError",
+                "No operations given",
+                "Pass a list of operations, e.g. [{\"op\": \"check\", \"item_id\": \"...\"}]"
+            )
+        
+        # One journal fsync for the whole batch
+        with self._journal.group():
+            errors, results, failure = self._run_batch(operations)
+        
+        if errors:
+            response = format_error_response(
+                "ValueError",
+                f"{len(errors)} of {len(operations)} operations are invalid. Nothing was applied.",
+                "Fix the listed operations and retry the batch"
+            )
+            response["errors"] = errors
+            return response
+        
+        preview = {
+            "operations_applied": len(results),
+            "operations_total": len(operations),
+            "results": results
+        }
+        
+        if failure:
+            preview["failed"] = failure
+            return {
+                "success": False,
+                "error": "BatchError",
+                "operation": "batch_apply",
+                "preview": preview,
+                "synced": False,
+                "message": (
+                    f"Operation {failure['index']} ({failure['op']}) failed: {failure['message']}. "
+                    f"{len(results)} earlier operations were applied locally and are not synced."
+                ),
+                "suggestion": "Call get_pending_changes() to review, then sync_changes() or refresh_notes()"
+            }
+        
+        response = format_preview_response(
+            "batch_apply",
+            preview,
+            f"{len(results)} operations applied locally. Call sync_changes() to save to Google Keep."
+        )
+        if self._auto_sync is not None:
+            response["message"] = (
+                f"{len(results)} operations applied locally. Auto-sync will save them to Google Keep "
+                f"within {self._auto_sync.max_delay_seconds:g} seconds."
+            )
+        
+        if sync:
+            sync_result = self.sync_changes()
+            if sync_result.get("success"):
+                response["synced"] = True
+                response["message"] = f"{len(results)} operations applied and synced to Google Keep."
+            else:
+                response["sync_error"] = sync_result.get("message")
+                response["message"] = (
+                    f"{len(results)} operations applied locally, but sync failed. "
+                    f"Call sync_changes() to retry."
+                )
+        
+        return response
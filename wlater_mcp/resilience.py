@@ -0,0 +1,247 @@
+"""Retry and circuit breaker policy for Google Keep network calls.
+
+Every gkeepapi call that talks to Google goes through Resilience.call():
+
+- Transient failures (rate limiting, 5xx responses, connection errors and
+  timeouts) are retried with jittered exponential backoff.
+- Retries draw from a shared per-window budget, so a burst of failing
+  calls cannot multiply the load on an already struggling server.
+- After repeated transient failures the circuit opens and calls fail fast
+  until a cool-down has passed; then one trial call decides whether to
+  close it again.
+
+Other errors (bad credentials, invalid data) are raised immediately and do
+not count against the circuit.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+import gkeepapi
+
+try:
+    import requests
+except ImportError:
+    raise ImportError(
+        "requests is required (installed with gkeepapi). Install it with: pip install requests"
+    )
+
+
+logger = logging.getLogger("wlater")
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BASE_DELAY_SECONDS = 0.5
+DEFAULT_MAX_DELAY_SECONDS = 8.0
+DEFAULT_RETRY_BUDGET = 20
+DEFAULT_BUDGET_WINDOW_SECONDS = 60.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN_SECONDS = 30.0
+
+# HTTP status codes worth retrying
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Google Keep while the circuit is open."""
+
+
+def is_transient(error: Exception) -> bool:
+    """Return True if an error is likely to go away on retry.
+
+    Args:
+        error: Exception raised by a gkeepapi call
+
+    Returns:
+        True for rate limiting, server errors and network failures
+    """
+    if isinstance(error, gkeepapi.exception.APIException):
+        return getattr(error, "code", None) in TRANSIENT_STATUS_CODES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+class Resilience:
+    """Backoff, retry budget and circuit breaker shared by Keep API calls."""
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY_SECONDS,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+        retry_budget: int = DEFAULT_RETRY_BUDGET,
+        budget_window: float = DEFAULT_BUDGET_WINDOW_SECONDS,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN_SECONDS
+    ):
+        """Create a policy.
+
+        Args:
+            max_retries: Retries per call after the first attempt
+            base_delay: Backoff ceiling for the first retry, doubled per retry
+            max_delay: Upper bound for the backoff ceiling
+            retry_budget: Retries allowed across all calls per window
+            budget_window: Length of the retry budget window in seconds
+            failure_threshold: Consecutive failed calls that open the circuit
+            cooldown: Seconds the circuit stays open before a trial call
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget
+        self.budget_window = budget_window
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._retry_times: deque = deque()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+        # Counters for monitoring
+        self._calls = 0
+        self._failures = 0
+        self._retries = 0
+        self._budget_exhausted = 0
+        self._short_circuited = 0
+        self._last_error: Optional[str] = None
+
+    def call(self, operation: str, func: Callable, *args, **kwargs) -> Any:
+        """Call func, retrying transient failures within policy limits.
+
+        Args:
+            operation: Name used in logs and errors (e.g. "sync")
+            func: gkeepapi callable that talks to Google
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: The last error from func once retries are used up,
+                or any non-transient error right away
+        """
+        trial = self._before_call(operation)
+        attempt = 0
+
+        while True:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_transient(e):
+                    self._record(success=True, trial=trial)
+                    raise
+
+                if attempt < self.max_retries and self._take_retry():
+                    delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                    attempt += 1
+                    logger.warning(
+                        f"Transient error in {operation} ({e}), retry {attempt}/{self.max_retries} in {delay:.2f}s"
+                    )
+                    time.sleep(delay)
+                    continue
+
+                self._record(success=False, trial=trial, error=e)
+                raise
+
+            self._record(success=True, trial=trial)
+            return result
+
+    def _before_call(self, operation: str) -> bool:
+        """Check the circuit before a call.
+
+        Returns:
+            True if this call is the half-open trial call
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            self._calls += 1
+            if self._opened_at is None:
+                return False
+
+            remaining = self._opened_at + self.cooldown - time.monotonic()
+            if remaining > 0 or self._trial_in_flight:
+                self._short_circuited += 1
+                raise CircuitOpenError(
+                    f"Google Keep is failing or rate limiting requests; not attempting {operation} "
+                    f"for another {max(remaining, 0):.0f}s. Last error: {self._last_error}"
+                )
+
+            # Cool-down over: let exactly one call through to probe
+            self._trial_in_flight = True
+            return True
+
+    def _take_retry(self) -> bool:
+        """Consume one retry from the budget if any is left in the window."""
+        with self._lock:
+            now = time.monotonic()
+            while self._retry_times and self._retry_times[0] <= now - self.budget_window:
+                self._retry_times.popleft()
+
+            if len(self._retry_times) >= self.retry_budget:
+                self._budget_exhausted += 1
+                return False
+
+            self._retry_times.append(now)
+            self._retries += 1
+            return True
+
+    def _record(self, success: bool, trial: bool, error: Optional[Exception] = None) -> None:
+        """Update the circuit after a call finished."""
+        with self._lock:
+            if trial:
+                self._trial_in_flight = False
+
+            if success:
+                if self._opened_at is not None:
+                    logger.info("Google Keep calls are succeeding again, closing circuit")
+                self._consecutive_failures = 0
+                self._opened_at = None
+                return
+
+            self._failures += 1
+            self._consecutive_failures += 1
+            self._last_error = str(error)
+
+            if trial or self._consecutive_failures >= self.failure_threshold:
+                if self._opened_at is None or trial:
+                    logger.warning(
+                        f"Opening circuit after {self._consecutive_failures} failed Google Keep calls "
+                        f"for {self.cooldown:g}s"
+                    )
+                self._opened_at = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        """Return circuit state, retry budget use and counters."""
+        with self._lock:
+            now = time.monotonic()
+            if self._opened_at is None:
+                state = "closed"
+                retry_in = None
+            else:
+                retry_in = max(0.0, self._opened_at + self.cooldown - now)
+                state = "open" if retry_in > 0 or self._trial_in_flight else "half_open"
+
+            retries_in_window = sum(1 for t in self._retry_times if t > now - self.budget_window)
+
+            return {
+                "circuit": state,
+                "consecutive_failures": self._consecutive_failures,
+                "retry_in_seconds": round(retry_in, 3) if retry_in is not None else None,
+                "retries_in_window": retries_in_window,
+                "retry_budget": self.retry_budget,
+                "budget_window_seconds": self.budget_window,
+                "calls": self._calls,
+                "failures": self._failures,
+                "retries": self._retries,
+                "budget_exhausted": self._budget_exhausted,
+                "short_circuited": self._short_circuited,
+                "last_error": self._last_error
+            }
@@ -0,0 +1,627 @@
+"""In-memory search indexes over Google Keep notes.
+
+Maintains a positional inverted index over note titles, note text and list
+item text so searches are answered from posting lists instead of scanning
+every note, plus secondary indexes over labels, colors and pinned,
+archived and trashed state for filters. The indexes are built once after
+the initial sync and updated note by note from sync deltas and local
+modifications.
+"""
+
+import bisect
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import gkeepapi
+except ImportError:
+    raise ImportError(
+        "gkeepapi is required. Install it with: pip install gkeepapi"
+    )
+
+
+_TOKEN_RE = re.compile(r"\w+")
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term frequency weight of a title occurrence relative to a body occurrence
+TITLE_BOOST = 3.0
+
+# Prefix expansions ("groc" -> "groceries") score below exact word matches
+PREFIX_MATCH_WEIGHT = 0.5
+
+SNIPPET_WIDTH = 120
+
+# Default minimum trigram (Jaccard) similarity for fuzzy term matches
+FUZZY_THRESHOLD = 0.4
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of lowercase tokens in order of appearance
+    """
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+def trigrams(term: str) -> Set[str]:
+    """Return the padded character trigrams of a term.
+
+    Args:
+        term: Lowercase token
+
+    Returns:
+        Set of 3-character strings; padding makes word starts and ends count
+    """
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def parse_query(query: str) -> Tuple[List[str], List[List[str]]]:
+    """Split a query into bare terms and double-quoted phrases.
+
+    Args:
+        query: Search query
+
+    Returns:
+        Tuple of (terms, phrases) where each phrase is a list of tokens
+    """
+    phrases = [tokenize(p) for p in _PHRASE_RE.findall(query)]
+    phrases = [p for p in phrases if p]
+    terms = tokenize(_PHRASE_RE.sub(" ", query))
+    return terms, phrases
+
+
+def note_segments(note: Any) -> List[str]:
+    """Return the indexable text segments of a note.
+
+    The title comes first, followed by the note body or one segment per
+    list item. Phrases never match across segment boundaries.
+
+    Args:
+        note: gkeepapi note or list
+
+    Returns:
+        List of text segments
+    """
+    segments = [note.title or ""]
+
+    if isinstance(note, gkeepapi.node.List):
+        for child in note.children:
+            if isinstance(child, gkeepapi.node.ListItem) and not child.deleted:
+                segments.append(child.text or "")
+    else:
+        segments.append(note.text or "")
+
+    return segments
+
+
+class SearchIndex:
+    """Positional inverted index keyed by note ID.
+
+    Queries are split into bare terms and double-quoted phrases. A note
+    matches when it contains every term (as a word prefix, so "groc" finds
+    "groceries") and every phrase (as consecutive words). Matches are ranked
+    with BM25 using per-note lengths and document frequencies maintained
+    alongside the postings.
+
+    For typo-tolerant searches a trigram index over the vocabulary maps each
+    query word to similarly spelled indexed words, so fuzzy lookups cost
+    time in the number of candidate words rather than the number of notes.
+    """
+
+    def __init__(self):
+        # term -> note_id -> token positions (title tokens come first)
+        self._postings: Dict[str, Dict[str, List[int]]] = {}
+        # note_id -> terms indexed for that note (for removal)
+        self._doc_terms: Dict[str, Set[str]] = {}
+        # Sorted vocabulary for prefix expansion
+        self._vocabulary: List[str] = []
+        # trigram -> vocabulary terms containing it, for fuzzy matching
+        self._trigrams: Dict[str, Set[str]] = {}
+        # note_id -> number of tokens, and number of title tokens
+        self._doc_len: Dict[str, int] = {}
+        self._title_len: Dict[str, int] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def build(self, notes: Iterable[Any]) -> None:
+        """Rebuild the index from scratch.
+
+        Args:
+            notes: All top-level gkeepapi notes
+        """
+        self._postings = {}
+        self._doc_terms = {}
+        self._doc_len = {}
+        self._title_len = {}
+        self._total_len = 0
+
+        for note in notes:
+            self._add(note)
+
+        self._vocabulary = sorted(self._postings)
+
+        self._trigrams = {}
+        for term in self._vocabulary:
+            for gram in trigrams(term):
+                self._trigrams.setdefault(gram, set()).add(term)
+
+    def update(self, note: Any) -> None:
+        """Reindex a single note after it changed.
+
+        Args:
+            note: gkeepapi note or list
+        """
+        self.remove(note.id)
+
+        for term in self._add(note):
+            if len(self._postings[term]) == 1:
+                bisect.insort(self._vocabulary, term)
+                for gram in trigrams(term):
+                    self._trigrams.setdefault(gram, set()).add(term)
+
+    def remove(self, note_id: str) -> None:
+        """Drop a note from the index.
+
+        Args:
+            note_id: Google Keep note ID
+        """
+        terms = self._doc_terms.pop(note_id, None)
+        if terms is None:
+            return
+
+        self._total_len -= self._doc_len.pop(note_id)
+        del self._title_len[note_id]
+
+        for term in terms:
+            postings = self._postings[term]
+            del postings[note_id]
+            if not postings:
+                del self._postings[term]
+                pos = bisect.bisect_left(self._vocabulary, term)
+                if pos < len(self._vocabulary) and self._vocabulary[pos] == term:
+                    del self._vocabulary[pos]
+                for gram in trigrams(term):
+                    grams = self._trigrams.get(gram)
+                    if grams is not None:
+                        grams.discard(term)
+                        if not grams:
+                            del self._trigrams[gram]
+
+    def _add(self, note: Any) -> Set[str]:
+        """Index a note that is not currently in the index.
+
+        Returns:
+            Set of terms indexed for the note
+        """
+        positions: Dict[str, List[int]] = {}
+        offset = 0
+        length = 0
+
+        for segment in note_segments(note):
+            tokens = tokenize(segment)
+            for i, token in enumerate(tokens):
+                positions.setdefault(token, []).append(offset + i)
+            if offset == 0:
+                self._title_len[note.id] = len(tokens)
+            length += len(tokens)
+            # Leave a gap so phrases can't span two segments
+            offset += len(tokens) + 1
+
+        for term, term_positions in positions.items():
+            self._postings.setdefault(term, {})[note.id] = term_positions
+
+        self._doc_len[note.id] = length
+        self._total_len += length
+
+        terms = set(positions)
+        self._doc_terms[note.id] = terms
+        return terms
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Return all indexed terms starting with prefix."""
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def _similar(self, term: str, threshold: float) -> Dict[str, float]:
+        """Return indexed terms whose trigram similarity to term is high enough.
+
+        Args:
+            term: Query token
+            threshold: Minimum Jaccard similarity of the trigram sets
+
+        Returns:
+            Mapping of similar indexed term to similarity
+        """
+        grams = trigrams(term)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for candidate in self._trigrams.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        similar = {}
+        for candidate, count in shared.items():
+            similarity = count / (len(grams) + len(candidate) + 1 - count)
+            if similarity >= threshold:
+                similar[candidate] = similarity
+        return similar
+
+    def _term_matches(
+        self,
+        term: str,
+        fuzzy: bool = False,
+        threshold: float = FUZZY_THRESHOLD
+    ) -> Dict[str, float]:
+        """Return the indexed terms a query word matches, with match weights.
+
+        Exact matches weigh 1.0, prefix expansions PREFIX_MATCH_WEIGHT and
+        fuzzy matches their similarity scaled by PREFIX_MATCH_WEIGHT.
+        """
+        matches = {}
+        for expansion in self._expand(term):
+            matches[expansion] = 1.0 if expansion == term else PREFIX_MATCH_WEIGHT
+
+        if fuzzy:
+            for candidate, similarity in self._similar(term, threshold).items():
+                weight = similarity * PREFIX_MATCH_WEIGHT
+                if weight > matches.get(candidate, 0.0):
+                    matches[candidate] = weight
+
+        return matches
+
+    def _docs(self, terms: Iterable[str]) -> Set[str]:
+        """Return IDs of notes containing any of the given indexed terms."""
+        docs: Set[str] = set()
+        for term in terms:
+            docs.update(self._postings[term])
+        return docs
+
+    def _phrase_docs(self, tokens: List[str], candidates: Optional[Set[str]]) -> Set[str]:
+        """Return IDs of notes containing tokens as consecutive words."""
+        postings = [self._postings.get(token) for token in tokens]
+        if any(p is None for p in postings):
+            return set()
+
+        # Intersect the smallest posting lists first
+        docs = candidates
+        for p in sorted(postings, key=len):
+            docs = set(p) if docs is None else docs.intersection(p)
+            if not docs:
+                return set()
+
+        matches = set()
+        for note_id in docs:
+            first = postings[0][note_id]
+            rest = [set(p[note_id]) for p in postings[1:]]
+            if any(all(start + i + 1 in positions for i, positions in enumerate(rest)) for start in first):
+                matches.add(note_id)
+        return matches
+
+    def search(
+        self,
+        query: str,
+        fuzzy: bool = False,
+        threshold: float = FUZZY_THRESHOLD
+    ) -> Optional[Set[str]]:
+        """Find notes matching all terms and phrases of a query.
+
+        Args:
+            query: Search query; double-quoted parts are matched as phrases
+            fuzzy: Also match bare words to similarly spelled words
+            threshold: Minimum trigram similarity for fuzzy matches (0-1)
+
+        Returns:
+            Set of matching note IDs, or None if the query contains no
+            indexable words (callers should fall back to a scan)
+        """
+        terms, phrases = parse_query(query)
+
+        if not terms and not phrases:
+            return None
+
+        # Posting-list intersection, smallest lists first
+        term_sets = sorted(
+            (self._docs(self._term_matches(term, fuzzy, threshold)) for term in set(terms)),
+            key=len
+        )
+
+        result: Optional[Set[str]] = None
+        for docs in term_sets:
+            result = docs if result is None else result & docs
+            if not result:
+                return set()
+
+        for phrase in phrases:
+            result = self._phrase_docs(phrase, result)
+            if not result:
+                return set()
+
+        return result if result is not None else set()
+
+    def match_terms(
+        self,
+        query: str,
+        fuzzy: bool = False,
+        threshold: float = FUZZY_THRESHOLD
+    ) -> Dict[str, float]:
+        """Return every indexed term the query matches, with its weight.
+
+        Args:
+            query: Search query
+            fuzzy: Include fuzzy matches of bare words
+            threshold: Minimum trigram similarity for fuzzy matches (0-1)
+
+        Returns:
+            Mapping of indexed term to match weight
+        """
+        terms, phrases = parse_query(query)
+
+        weights: Dict[str, float] = {}
+        for term in terms:
+            for match, weight in self._term_matches(term, fuzzy, threshold).items():
+                weights[match] = max(weights.get(match, 0.0), weight)
+        for phrase in phrases:
+            for token in phrase:
+                weights[token] = 1.0
+
+        return weights
+
+    def rank(self, weights: Dict[str, float], note_ids: Iterable[str]) -> List[Tuple[str, float]]:
+        """Score notes with BM25, boosting title occurrences.
+
+        Args:
+            weights: Matched terms and weights from match_terms()
+            note_ids: IDs of notes to score (typically from search())
+
+        Returns:
+            List of (note_id, score) sorted by descending score
+        """
+        note_ids = list(note_ids)
+        candidates = set(note_ids)
+
+        doc_count = len(self._doc_len)
+        avg_len = (self._total_len / doc_count) if doc_count else 0.0
+        scores = dict.fromkeys(note_ids, 0.0)
+
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+
+            df = len(postings)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+
+            # Set intersection walks the smaller side, so the total cost is
+            # bounded by the postings lengths rather than terms x candidates
+            for note_id in postings.keys() & candidates:
+                positions = postings[note_id]
+                if not positions:
+                    continue
+
+                title_hits = bisect.bisect_left(positions, self._title_len[note_id])
+                tf = title_hits * TITLE_BOOST + (len(positions) - title_hits)
+                norm = 1 - BM25_B + BM25_B * (self._doc_len[note_id] / avg_len if avg_len else 0.0)
+                scores[note_id] += weight * idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+def make_snippet(note: Any, words: Iterable[str], width: int = SNIPPET_WIDTH) -> str:
+    """Build a short snippet around the first matching word in a note.
+
+    Matching words are wrapped in ``**`` for highlighting. Body matches are
+    preferred over title matches since the title is returned separately.
+
+    Args:
+        note: gkeepapi note or list
+        words: Lowercase indexed terms to highlight (from match_terms())
+        width: Approximate maximum snippet length in characters
+
+    Returns:
+        Snippet text, or an empty string if nothing matches
+    """
+    words = set(words)
+    if not words:
+        return ""
+
+    def is_match(word: str) -> bool:
+        return word.lower() in words
+
+    segments = note_segments(note)
+    for segment in segments[1:] + segments[:1]:
+        first = next((m for m in _TOKEN_RE.finditer(segment) if is_match(m.group())), None)
+        if first is None:
+            continue
+
+        # Center the window on the first match
+        start = max(0, first.start() - width // 3)
+        end = min(len(segment), start + width)
+        if start > 0:
+            space = segment.find(" ", start, first.start())
+            start = space + 1 if space != -1 else start
+
+        window = segment[start:end]
+        highlighted = _TOKEN_RE.sub(
+            lambda m: f"**{m.group()}**" if is_match(m.group()) else m.group(),
+            window
+        )
+        highlighted = " ".join(highlighted.split())
+
+        prefix = "..." if start > 0 else ""
+        suffix = "..." if end < len(segment) else ""
+        return prefix + highlighted + suffix
+
+    return ""
+
+
+class AttributeIndex:
+    """Secondary indexes over note attributes used by search filters.
+
+    Maps label IDs and colors to note IDs and keeps the sets of pinned,
+    archived and trashed notes, so filters resolve through set
+    intersections without touching note objects. Also records each note's
+    Keep sort value for ordering unranked results.
+    """
+
+    def __init__(self):
+        self._all: Set[str] = set()
+        self._by_label: Dict[str, Set[str]] = {}
+        self._by_color: Dict[str, Set[str]] = {}
+        self._pinned: Set[str] = set()
+        self._archived: Set[str] = set()
+        self._trashed: Set[str] = set()
+        self._sort: Dict[str, int] = {}
+        # note_id -> (label_ids, color) currently indexed (for removal)
+        self._note_keys: Dict[str, Tuple[Set[str], str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def build(self, notes: Iterable[Any]) -> None:
+        """Rebuild the indexes from scratch.
+
+        Args:
+            notes: All top-level gkeepapi notes
+        """
+        self._all = set()
+        self._by_label = {}
+        self._by_color = {}
+        self._pinned = set()
+        self._archived = set()
+        self._trashed = set()
+        self._sort = {}
+        self._note_keys = {}
+
+        for note in notes:
+            self.update(note)
+
+    def update(self, note: Any) -> None:
+        """Reindex a single note after it changed.
+
+        Args:
+            note: gkeepapi note or list
+        """
+        self.remove(note.id)
+
+        label_ids = {label.id for label in note.labels.all()}
+        color = note.color.name
+
+        self._all.add(note.id)
+        for label_id in label_ids:
+            self._by_label.setdefault(label_id, set()).add(note.id)
+        self._by_color.setdefault(color, set()).add(note.id)
+        if note.pinned:
+            self._pinned.add(note.id)
+        if note.archived:
+            self._archived.add(note.id)
+        if note.trashed:
+            self._trashed.add(note.id)
+        self._sort[note.id] = int(note.sort)
+        self._note_keys[note.id] = (label_ids, color)
+
+    def remove(self, note_id: str) -> None:
+        """Drop a note from the indexes.
+
+        Args:
+            note_id: Google Keep note ID
+        """
+        keys = self._note_keys.pop(note_id, None)
+        if keys is None:
+            return
+
+        label_ids, color = keys
+        for label_id in label_ids:
+            _discard(self._by_label, label_id, note_id)
+        _discard(self._by_color, color, note_id)
+
+        self._all.discard(note_id)
+        self._pinned.discard(note_id)
+        self._archived.discard(note_id)
+        self._trashed.discard(note_id)
+        del self._sort[note_id]
+
+    def label_ids(self) -> Set[str]:
+        """Return IDs of all labels currently referenced by indexed notes."""
+        return set(self._by_label)
+
+    def notes_with_label(self, label_id: str) -> Set[str]:
+        """Return IDs of notes carrying a label."""
+        return set(self._by_label.get(label_id, ()))
+
+    def sort_key(self, note_id: str) -> int:
+        """Return the Keep sort value of an indexed note."""
+        return self._sort.get(note_id, 0)
+
+    def filter(
+        self,
+        candidates: Optional[Set[str]] = None,
+        pinned: Optional[bool] = None,
+        archived: Optional[bool] = None,
+        trashed: Optional[bool] = None,
+        colors: Optional[List[str]] = None,
+        label_ids: Optional[Iterable[str]] = None
+    ) -> Set[str]:
+        """Resolve filters to the set of matching note IDs.
+
+        Args:
+            candidates: Restrict results to these note IDs (None for all)
+            pinned: Filter by pinned status
+            archived: Filter by archived status
+            trashed: Filter by trashed status
+            colors: Match notes with any of these color names
+            label_ids: Match notes with any of these labels
+
+        Returns:
+            Set of matching note IDs
+        """
+        result = set(self._all if candidates is None else self._all & candidates)
+
+        for flag, members in ((pinned, self._pinned), (archived, self._archived), (trashed, self._trashed)):
+            if flag is None or not result:
+                continue
+            if flag:
+                result &= members
+            else:
+                result -= members
+
+        if colors and result:
+            matching: Set[str] = set()
+            for color in colors:
+                matching |= self._by_color.get(color, set())
+            result &= matching
+
+        if label_ids is not None and result:
+            matching = set()
+            for label_id in label_ids:
+                matching |= self._by_label.get(label_id, set())
+            result &= matching
+
+        return result
+
+
+def _discard(index: Dict[str, Set[str]], key: str, note_id: str) -> None:
+    """Remove note_id from index[key], dropping the key once empty."""
+    members = index.get(key)
+    if members is None:
+        return
+    members.discard(note_id)
+    if not members:
+        del index[key]
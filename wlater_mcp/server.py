@@ -4,8 +4,14 @@ This server provides MCP tools for querying, searching, and retrieving
 Google Keep notes and lists without any modification capabilities.
 """
 
+import asyncio
+import functools
 import logging
-from typing import List, Optional, Dict, Any
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple, Union
 
 try:
     from fastmcp import FastMCP
@@ -14,8 +20,22 @@ except ImportError:
         "fastmcp is required. Install it with: pip install fastmcp"
     )
 
-from wlater_mcp.credentials import load_credentials
-from wlater_mcp.keep_client import KeepClient
+from wlater_mcp.auto_sync import DEFAULT_MAX_DELAY_SECONDS, DEFAULT_QUIET_SECONDS
+from wlater_mcp.credentials import (
+    DEFAULT_KEYRING_TIMEOUT_SECONDS,
+    credential_store_fingerprint,
+    load_credentials
+)
+from wlater_mcp.keep_client import KeepClient, verify_credentials
+from wlater_mcp.resilience import (
+    DEFAULT_COOLDOWN_SECONDS,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BUDGET,
+    CircuitOpenError,
+    Resilience,
+    is_transient
+)
 
 
 # Configure logging
@@ -31,67 +51,346 @@ mcp = FastMCP("wlater")
 # Module-level state for Keep Client (persists across tool calls)
 _keep_client: Optional[KeepClient] = None
 
+# Single-flight initialization state: concurrent callers (and the optional
+# warm-up thread) share one in-flight initialization instead of racing
+_init_lock = threading.Lock()
+_init_done: Optional[threading.Event] = None
+_init_error: Optional[Exception] = None
+_init_started_at: Optional[float] = None
+_init_finished_at: Optional[float] = None
+
+# Whether the last failure is remembered (fail fast until the cool-down
+# ends or the credential store changes), and the store it failed with
+_init_failure_cached = False
+_init_failure_fingerprint: Optional[Tuple] = None
+
+# Last check_credentials verdict: (credentials checked, monotonic time, result)
+_credential_check: Optional[Tuple[Tuple[str, str, str], float, Dict[str, Any]]] = None
+
+
+def _env_flag(name: str) -> bool:
+    """Return True if an environment variable is set to a truthy value."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment.
+    
+    Falls back to the default (with a warning) if the value is not a
+    positive integer.
+    """
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        number = int(value)
+        if number > 0:
+            return number
+    except ValueError:
+        pass
+    logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+    return default
+
+
+def _env_seconds(name: str, default: float) -> float:
+    """Read a positive number of seconds from the environment.
+    
+    Falls back to the default (with a warning) if the value is not a
+    positive number.
+    """
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+        if seconds > 0:
+            return seconds
+    except ValueError:
+        pass
+    logger.warning(f"Ignoring invalid {name}={value!r}, using {default:g} seconds")
+    return default
+
+
+# Opt-in eager mode: authenticate and sync in the background at server start
+EAGER_INIT = _env_flag("WLATER_EAGER_INIT")
+
+# Opt-in write-behind mode: modifications are synced automatically once
+# edits pause for the quiet window, and at most after the max delay
+AUTO_SYNC = _env_flag("WLATER_AUTO_SYNC")
+AUTO_SYNC_QUIET_SECONDS = _env_seconds("WLATER_AUTO_SYNC_QUIET_SECONDS", DEFAULT_QUIET_SECONDS)
+AUTO_SYNC_MAX_DELAY_SECONDS = max(
+    _env_seconds("WLATER_AUTO_SYNC_MAX_DELAY_SECONDS", DEFAULT_MAX_DELAY_SECONDS),
+    AUTO_SYNC_QUIET_SECONDS
+)
+
+# Failed initializations are remembered for this long so retry loops
+# don't repeat slow, doomed logins against Google
+INIT_FAILURE_COOLDOWN_SECONDS = _env_seconds("WLATER_INIT_FAILURE_COOLDOWN_SECONDS", 60.0)
+
+# Keyring backends (e.g. D-Bus Secret Service on headless Linux) can hang
+KEYRING_TIMEOUT_SECONDS = _env_seconds("WLATER_KEYRING_TIMEOUT_SECONDS", DEFAULT_KEYRING_TIMEOUT_SECONDS)
+
+# check_credentials answers from its last result for this long
+CREDENTIAL_CHECK_TTL_SECONDS = _env_seconds("WLATER_CREDENTIAL_CHECK_TTL_SECONDS", 30.0)
+
+# Blocking work (network calls, modifications, and reads, which may wait
+# for a sync to apply or a batch to finish) runs on a bounded worker pool so
+# the event loop keeps serving pings, cancellations and status checks.
+# MAX_QUEUED caps running plus waiting calls.
+WORKERS = _env_int("WLATER_WORKERS", 4)
+MAX_QUEUED = _env_int("WLATER_MAX_QUEUED", 32)
+
+_executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="wlater-worker")
+_queue_slots = threading.BoundedSemaphore(max(MAX_QUEUED, WORKERS))
+
+# One retry budget and circuit breaker for every Google Keep call the
+# server makes, including the clients built by check_credentials
+_resilience = Resilience(
+    max_retries=_env_int("WLATER_MAX_RETRIES", DEFAULT_MAX_RETRIES),
+    retry_budget=_env_int("WLATER_RETRY_BUDGET", DEFAULT_RETRY_BUDGET),
+    failure_threshold=_env_int("WLATER_BREAKER_THRESHOLD", DEFAULT_FAILURE_THRESHOLD),
+    cooldown=_env_seconds("WLATER_BREAKER_COOLDOWN_SECONDS", DEFAULT_COOLDOWN_SECONDS)
+)
+
+
+def _initialize_keep_client() -> None:
+    """Authenticate and sync a new Keep Client, publishing the outcome.
+    
+    Must only be called by the thread that claimed initialization in
+    _claim_initialization().
+    """
+    global _keep_client, _init_error, _init_finished_at
+    global _init_failure_cached, _init_failure_fingerprint
+    
+    try:
+        email, token, android_id = load_credentials(KEYRING_TIMEOUT_SECONDS)
+        client = KeepClient(
+            email,
+            token,
+            android_id,
+            auto_sync=AUTO_SYNC,
+            auto_sync_quiet_seconds=AUTO_SYNC_QUIET_SECONDS,
+            auto_sync_max_delay_seconds=AUTO_SYNC_MAX_DELAY_SECONDS,
+            resilience=_resilience,
+            keyring_timeout=KEYRING_TIMEOUT_SECONDS
+        )
+        _keep_client = client
+        _init_error = None
+        _init_failure_cached = False
+        logger.info("Keep Client initialized successfully")
+    except Exception as e:
+        _init_error = e
+        # Google being unreachable is handled by the circuit breaker;
+        # only remember failures a retry would repeat
+        cause = e.__cause__
+        _init_failure_cached = not (
+            isinstance(cause, CircuitOpenError) or (cause is not None and is_transient(cause))
+        )
+        _init_failure_fingerprint = credential_store_fingerprint()
+        logger.error(f"Failed to initialize Keep Client: {e}")
+    finally:
+        _init_finished_at = time.monotonic()
+        _init_done.set()
+
+
+def _claim_initialization() -> Tuple[bool, threading.Event]:
+    """Join the in-flight initialization or claim a new one.
+    
+    Returns:
+        Tuple of (owner, done_event). The owner must run
+        _initialize_keep_client(); everybody else waits on done_event.
+    """
+    global _init_done, _init_started_at, _init_finished_at
+    
+    with _init_lock:
+        if _init_done is not None and not _init_done.is_set():
+            return False, _init_done
+        
+        _init_done = threading.Event()
+        _init_started_at = time.monotonic()
+        _init_finished_at = None
+        return True, _init_done
+
+
+def start_warmup() -> None:
+    """Start Keep Client initialization in a background thread."""
+    if _keep_client is not None:
+        return
+    
+    owner, _ = _claim_initialization()
+    if owner:
+        logger.info("Warming up Keep Client in the background...")
+        threading.Thread(
+            target=_initialize_keep_client,
+            name="wlater-warmup",
+            daemon=True
+        ).start()
+
+
+def _cached_failure_remaining() -> Optional[float]:
+    """Return seconds left on a remembered initialization failure.
+    
+    Returns:
+        Remaining cool-down in seconds, or None if initialization may be
+        attempted (nothing remembered, cool-down over, or the credential
+        store changed since the failure)
+    """
+    if not _init_failure_cached or _init_error is None or _init_finished_at is None:
+        return None
+    
+    remaining = _init_finished_at + INIT_FAILURE_COOLDOWN_SECONDS - time.monotonic()
+    if remaining <= 0:
+        return None
+    
+    if credential_store_fingerprint() != _init_failure_fingerprint:
+        logger.info("Credential store changed since the last failure, retrying initialization")
+        return None
+    
+    return remaining
+
+
+def clear_init_failure() -> None:
+    """Forget a remembered initialization failure so the next call retries."""
+    global _init_failure_cached
+    _init_failure_cached = False
+
+
+def _initialization_error(cached_remaining: Optional[float] = None) -> RuntimeError:
+    """Build the error raised when no Keep Client is available.
+    
+    Args:
+        cached_remaining: Cool-down left if the failure is a remembered one
+    """
+    message = (
+        f"CRITICAL: Google Keep authentication FAILED. Your stored credentials are INVALID or EXPIRED. "
+        f"Error details: {_init_error}. "
+        f"REQUIRED ACTION: User must run 'wlater-setup token' (automated) or 'wlater-setup' (manual) "
+        f"to re-authenticate with Google Keep. The check_credentials tool only checks if credentials "
+        f"exist in storage, not if they are valid. refresh_notes will NOT fix this - new credentials are required."
+    )
+    if cached_remaining is not None:
+        message += (
+            f" (This failure is remembered: authentication will not be retried for another "
+            f"{cached_remaining:.0f}s. Running wlater-setup or calling check_credentials retries sooner.)"
+        )
+    return RuntimeError(message)
+
+
+def shutdown_keep_client() -> None:
+    """Finish queued work, flush pending auto-sync edits and stop background work."""
+    _executor.shutdown(wait=True)
+    if _keep_client is not None:
+        _keep_client.close()
+
+
+async def run_blocking(func, *args, **kwargs) -> Any:
+    """Run a blocking call on the worker pool and await its result.
+    
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        Whatever func returns
+        
+    Raises:
+        RuntimeError: If too many blocking calls are already queued
+    """
+    if not _queue_slots.acquire(blocking=False):
+        raise RuntimeError(
+            f"Server busy: {MAX_QUEUED} Google Keep operations are already running or queued. "
+            f"Try again shortly."
+        )
+    
+    try:
+        future = asyncio.get_running_loop().run_in_executor(
+            _executor, functools.partial(func, *args, **kwargs)
+        )
+    except BaseException:
+        _queue_slots.release()
+        raise
+    
+    # Free the slot when the work ends, not when the caller stops waiting:
+    # a cancelled call keeps running on its worker thread
+    future.add_done_callback(lambda _: _queue_slots.release())
+    return await future
+
+
+async def get_keep_client_async() -> KeepClient:
+    """Return the Keep Client, initializing it on the worker pool if needed.
+    
+    Returns:
+        Authenticated KeepClient instance
+        
+    Raises:
+        RuntimeError: If authentication fails or the server is busy
+    """
+    if _keep_client is not None:
+        return _keep_client
+    
+    # Fail fast without taking a worker slot
+    remaining = _cached_failure_remaining()
+    if remaining is not None:
+        raise _initialization_error(remaining)
+    
+    return await run_blocking(get_keep_client)
+
 
 def get_keep_client() -> KeepClient:
     """Lazy initialization of Keep Client on first use.
     
+    If an initialization is already in flight (e.g. the eager warm-up),
+    waits for it instead of starting a second one. A recent failure is
+    remembered for INIT_FAILURE_COOLDOWN_SECONDS and raised again at once,
+    unless the credential store has changed since.
+    
     Returns:
         Authenticated KeepClient instance
         
     Raises:
         RuntimeError: If authentication fails
     """
-    global _keep_client
+    if _keep_client is not None:
+        return _keep_client
+    
+    remaining = _cached_failure_remaining()
+    if remaining is not None:
+        raise _initialization_error(remaining)
+    
+    owner, done = _claim_initialization()
+    if owner:
+        _initialize_keep_client()
+    else:
+        done.wait()
     
     if _keep_client is None:
-        try:
-            email, token, android_id = load_credentials()
-            _keep_client = KeepClient(email, token, android_id)
-            logger.info("Keep Client initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Keep Client: {e}")
-            raise RuntimeError(
-                f"CRITICAL: Google Keep authentication FAILED. Your stored credentials are INVALID or EXPIRED. "
-                f"Error details: {e}. "
-                f"REQUIRED ACTION: User must run 'wlater-setup token' (automated) or 'wlater-setup' (manual) "
-                f"to re-authenticate with Google Keep. The check_credentials tool only checks if credentials "
-                f"exist in storage, not if they are valid. refresh_notes will NOT fix this - new credentials are required."
-            )
+        raise _initialization_error()
     
     return _keep_client
 
 
 @mcp.tool
-def check_credentials() -> Dict[str, Any]:
+async def check_credentials() -> Dict[str, Any]:
     """Check if credentials are configured and actually valid by testing authentication.
     
-    This tool now performs a LIVE authentication test, not just checking if credentials exist.
+    This tool performs a LIVE authentication test, not just checking if credentials exist.
+    If the server is already signed in with the stored credentials, that session is the
+    proof; otherwise only the token exchange with Google is done (no notes are synced).
+    The verdict is reused for WLATER_CREDENTIAL_CHECK_TTL_SECONDS (default 30).
     
     Returns:
-        Dictionary with configuration status, email, and actual authentication test result
+        Dictionary with configuration status, email, actual authentication test result,
+        how it was verified ("live_session" or "token_exchange") and whether it was cached.
+        "valid" is null if Google could not be reached to test the credentials
     """
+    global _credential_check
+    
+    # An explicit re-check also lets the next tool call retry initialization
+    clear_init_failure()
+    
     try:
-        email, token, android_id = load_credentials()
-        
-        # Test if credentials actually work by attempting to initialize Keep Client
-        try:
-            test_client = KeepClient(email, token, android_id)
-            return {
-                "configured": True,
-                "valid": True,
-                "email": email,
-                "message": "✅ Credentials found and VERIFIED - authentication successful"
-            }
-        except Exception as auth_error:
-            # Credentials exist but are invalid/expired
-            error_msg = str(auth_error)
-            return {
-                "configured": True,
-                "valid": False,
-                "email": email,
-                "message": f"❌ {error_msg}",
-                "action_required": "Run 'wlater-setup token' (automated) or 'wlater-setup' (manual) to re-authenticate"
-            }
+        email, token, android_id = await run_blocking(load_credentials, KEYRING_TIMEOUT_SECONDS)
     except FileNotFoundError as e:
         return {
             "configured": False,
@@ -106,35 +405,113 @@ def check_credentials() -> Dict[str, Any]:
             "message": f"❌ Error loading credentials: {e}",
             "action_required": "Run 'wlater-setup token' or 'wlater-setup' to fix credentials"
         }
+    
+    credentials = (email, token, android_id)
+    now = time.monotonic()
+    
+    cached = _credential_check
+    if cached is not None and cached[0] == credentials and now - cached[1] < CREDENTIAL_CHECK_TTL_SECONDS:
+        return {**cached[2], "cached": True, "checked_seconds_ago": round(now - cached[1], 3)}
+    
+    verified_result = {
+        "configured": True,
+        "valid": True,
+        "email": email,
+        "message": "✅ Credentials found and VERIFIED - authentication successful"
+    }
+    
+    # Tier 1: the running client already authenticated with these credentials
+    keep_client = _keep_client
+    if keep_client is not None and keep_client.uses_credentials(email, token):
+        result = {**verified_result, "verified_by": "live_session"}
+        _credential_check = (credentials, now, result)
+        return {**result, "cached": False}
+    
+    # Tier 2: exchange the master token for an OAuth token, without syncing notes
+    try:
+        await run_blocking(
+            verify_credentials, email, token, android_id,
+            resilience=_resilience, keyring_timeout=KEYRING_TIMEOUT_SECONDS
+        )
+        result = {**verified_result, "verified_by": "token_exchange"}
+    except Exception as auth_error:
+        # Credentials exist but are invalid/expired
+        result = {
+            "configured": True,
+            "valid": False,
+            "email": email,
+            "verified_by": "token_exchange",
+            "message": f"❌ {auth_error}",
+            "action_required": "Run 'wlater-setup token' (automated) or 'wlater-setup' (manual) to re-authenticate"
+        }
+        cause = auth_error.__cause__
+        if isinstance(cause, CircuitOpenError) or (cause is not None and is_transient(cause)):
+            # Google could not be reached: the verdict says nothing about the credentials
+            result.pop("action_required")
+            return {**result, "valid": None, "cached": False}
+    
+    _credential_check = (credentials, time.monotonic(), result)
+    return {**result, "cached": False}
 
 
 @mcp.tool
-def list_all_notes() -> List[Dict[str, Any]]:
+async def list_all_notes(
+    page_size: int = 1000,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    output_format: str = "records"
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """List all notes and lists from Google Keep (read-only).
     
+    Results are paginated in a stable order. If more notes remain, the last
+    entry is {"truncated": true, "next_cursor": "..."}; call again with that
+    cursor to get the next page. Cursors expire when notes are synced.
+    
+    Args:
+        page_size: Maximum number of notes per page (default: 1000)
+        cursor: next_cursor from the previous page (omit for the first page)
+        fields: Only return these fields, e.g. ["note_id", "title"]. Available:
+            note_id, title, text, note_type, color, pinned, archived, trashed,
+            labels, timestamps (default: note_id, title, note_type, pinned,
+            archived, color)
+        output_format: "records" (default) for one dictionary per note, or
+            "table" for a compact form: {"columns": [...], "rows": [[...]],
+            "dictionaries": {...}}. In table mode note_type and color values
+            are indexes into the matching "dictionaries" list, and truncation
+            info is returned as top-level keys
+    
     Returns:
-        List of note dictionaries with basic metadata
+        List of note dictionaries with basic metadata, or a table
     """
-    keep_client = get_keep_client()
-    return keep_client.get_all_notes()
+    keep_client = await get_keep_client_async()
+    return await run_blocking(
+        keep_client.get_all_notes,
+        limit=page_size,
+        cursor=cursor,
+        fields=fields,
+        output_format=output_format
+    )
 
 
 @mcp.tool
-def get_note(note_id: str) -> Dict[str, Any]:
+async def get_note(note_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """Get detailed content for a specific note by ID (read-only).
     
     Args:
         note_id: Google Keep note ID
+        fields: Only return these fields, e.g. ["title", "text"]. Available:
+            note_id, title, text, note_type, color, pinned, archived, trashed,
+            labels, timestamps (default: all except trashed)
         
     Returns:
         Dictionary with full note details including text, labels, and timestamps
     """
-    keep_client = get_keep_client()
-    return keep_client.get_note(note_id)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.get_note, note_id, fields=fields)
 
 
 @mcp.tool
-def get_list_items(list_id: str) -> Dict[str, Any]:
+async def get_list_items(list_id: str) -> Dict[str, Any]:
     """Get list items with checked status (read-only).
     
     Args:
@@ -143,21 +520,34 @@ def get_list_items(list_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary with all items, checked items, and unchecked items
     """
-    keep_client = get_keep_client()
-    return keep_client.get_list_items(list_id)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.get_list_items, list_id)
 
 
 @mcp.tool
-def search_notes(
+async def search_notes(
     query: Optional[str] = None,
     pinned: Optional[bool] = None,
     archived: Optional[bool] = None,
     trashed: Optional[bool] = None,
     colors: Optional[List[str]] = None,
-    labels: Optional[List[str]] = None
-) -> List[Dict[str, Any]]:
+    labels: Optional[List[str]] = None,
+    fuzzy: bool = False,
+    fuzzy_threshold: float = 0.4,
+    page_size: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    output_format: str = "records"
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """Search notes with optional filters (read-only).
     
+    Text queries match notes containing every word (words match as
+    prefixes); wrap words in double quotes to match an exact phrase.
+    Results are ranked by relevance and include a "score" and a "snippet"
+    with matching words highlighted as **word**, which is often enough to
+    answer without calling get_note. If more results remain, the last entry
+    is {"truncated": true, "next_cursor": "..."} for fetching the next page.
+    
     Args:
         query: Text to search for in notes
         pinned: Filter by pinned status
@@ -165,34 +555,56 @@ def search_notes(
         trashed: Filter by trashed status
         colors: Filter by color names (e.g., ["RED", "BLUE"])
         labels: Filter by label names
+        fuzzy: Tolerate typos in query words (e.g. "grocerys" finds "groceries")
+        fuzzy_threshold: Minimum spelling similarity from 0 to 1 for fuzzy
+            matches; lower values are more tolerant (default: 0.4)
+        page_size: Maximum number of results per page (default: 100)
+        cursor: next_cursor from the previous page, with the same other
+            arguments (omit for the first page)
+        fields: Only return these fields. Available: note_id, title, text,
+            note_type, color, pinned, archived, trashed, labels, timestamps,
+            score, snippet (default: note_id, title, note_type, pinned,
+            archived, color, score, snippet)
+        output_format: "records" (default) for one dictionary per note, or
+            "table" for a compact form: {"columns": [...], "rows": [[...]],
+            "dictionaries": {...}}. In table mode note_type and color values
+            are indexes into the matching "dictionaries" list, and truncation
+            info is returned as top-level keys
         
     Returns:
-        List of matching note dictionaries
+        List of matching note dictionaries, or a table
     """
-    keep_client = get_keep_client()
-    return keep_client.search_notes(
+    keep_client = await get_keep_client_async()
+    return await run_blocking(
+        keep_client.search_notes,
         query=query,
         pinned=pinned,
         archived=archived,
         trashed=trashed,
         colors=colors,
-        labels=labels
+        labels=labels,
+        fuzzy=fuzzy,
+        fuzzy_threshold=fuzzy_threshold,
+        limit=page_size,
+        cursor=cursor,
+        fields=fields,
+        output_format=output_format
     )
 
 
 @mcp.tool
-def list_labels() -> List[Dict[str, str]]:
+async def list_labels() -> List[Dict[str, str]]:
     """List all labels sorted alphabetically (read-only).
     
     Returns:
         List of label dictionaries with id and name
     """
-    keep_client = get_keep_client()
-    return keep_client.get_labels()
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.get_labels)
 
 
 @mcp.tool
-def find_label(name: str) -> Optional[Dict[str, str]]:
+async def find_label(name: str) -> Optional[Dict[str, str]]:
     """Find a label by name with case-insensitive matching (read-only).
     
     Args:
@@ -201,8 +613,8 @@ def find_label(name: str) -> Optional[Dict[str, str]]:
     Returns:
         Label dictionary or None if not found
     """
-    keep_client = get_keep_client()
-    return keep_client.find_label(name)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.find_label, name)
 
 
 # ============================================================================
@@ -210,7 +622,7 @@ def find_label(name: str) -> Optional[Dict[str, str]]:
 # ============================================================================
 
 @mcp.tool
-def update_list_item_checked(
+async def update_list_item_checked(
     list_id: str, 
     item_id: str, 
     checked: bool
@@ -227,12 +639,34 @@ def update_list_item_checked(
     Returns:
         Preview response showing old and new checked status
     """
-    keep_client = get_keep_client()
-    return keep_client.update_list_item_checked(list_id, item_id, checked)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.update_list_item_checked, list_id, item_id, checked)
 
 
 @mcp.tool
-def add_list_item(
+async def update_item_checked(
+    item_id: str, 
+    checked: bool
+) -> Dict[str, Any]:
+    """Update checked status of a list item by item ID alone (requires sync).
+    
+    Same as update_list_item_checked() but the parent list is looked up
+    from the item ID. Changes are made locally and must be synced with
+    sync_changes().
+    
+    Args:
+        item_id: List item ID
+        checked: New checked status (True to check, False to uncheck)
+        
+    Returns:
+        Preview response showing old and new checked status
+    """
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.update_item_checked, item_id, checked)
+
+
+@mcp.tool
+async def add_list_item(
     list_id: str, 
     text: str, 
     checked: bool = False,
@@ -251,12 +685,39 @@ def add_list_item(
     Returns:
         Preview response with new item details
     """
-    keep_client = get_keep_client()
-    return keep_client.add_list_item(list_id, text, checked, sort)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.add_list_item, list_id, text, checked, sort)
+
+
+@mcp.tool
+async def add_list_items(
+    list_id: str,
+    items: List[Any],
+    position: str = "bottom",
+    after_item_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Add many items to an existing list in one call (requires sync).
+    
+    Changes are made locally and must be synced with sync_changes().
+    Items keep the given order at the chosen position.
+    
+    Args:
+        list_id: Google Keep list ID
+        items: Item texts (e.g. ["eggs", "flour"]) or objects like
+            {"text": "eggs", "checked": false}
+        position: Where to insert: "top", "bottom" (default), or "after"
+        after_item_id: Item to insert after when position is "after"
+        
+    Returns:
+        Preview response with the new items, plus items_moved when existing
+        items had to be moved down to make room after after_item_id
+    """
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.add_list_items, list_id, items, position, after_item_id)
 
 
 @mcp.tool
-def create_note(
+async def create_note(
     title: str = "", 
     text: str = ""
 ) -> Dict[str, Any]:
@@ -271,12 +732,12 @@ def create_note(
     Returns:
         Preview response with note ID, title, and text
     """
-    keep_client = get_keep_client()
-    return keep_client.create_note(title, text)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.create_note, title, text)
 
 
 @mcp.tool
-def create_list(
+async def create_list(
     title: str = "", 
     items: List[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
@@ -292,12 +753,12 @@ def create_list(
     Returns:
         Preview response with list ID, title, and items
     """
-    keep_client = get_keep_client()
-    return keep_client.create_list(title, items)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.create_list, title, items)
 
 
 @mcp.tool
-def update_note_title(
+async def update_note_title(
     note_id: str, 
     title: str
 ) -> Dict[str, Any]:
@@ -312,12 +773,12 @@ def update_note_title(
     Returns:
         Preview response showing old and new title
     """
-    keep_client = get_keep_client()
-    return keep_client.update_note_title(note_id, title)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.update_note_title, note_id, title)
 
 
 @mcp.tool
-def update_note_text(
+async def update_note_text(
     note_id: str, 
     text: str
 ) -> Dict[str, Any]:
@@ -333,12 +794,12 @@ def update_note_text(
     Returns:
         Preview response showing old and new text
     """
-    keep_client = get_keep_client()
-    return keep_client.update_note_text(note_id, text)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.update_note_text, note_id, text)
 
 
 @mcp.tool
-def update_note_color(
+async def update_note_color(
     note_id: str, 
     color: str
 ) -> Dict[str, Any]:
@@ -354,12 +815,12 @@ def update_note_color(
     Returns:
         Preview response showing old and new color
     """
-    keep_client = get_keep_client()
-    return keep_client.update_note_color(note_id, color)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.update_note_color, note_id, color)
 
 
 @mcp.tool
-def update_note_pinned(
+async def update_note_pinned(
     note_id: str, 
     pinned: bool
 ) -> Dict[str, Any]:
@@ -374,12 +835,12 @@ def update_note_pinned(
     Returns:
         Preview response showing old and new pinned status
     """
-    keep_client = get_keep_client()
-    return keep_client.update_note_pinned(note_id, pinned)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.update_note_pinned, note_id, pinned)
 
 
 @mcp.tool
-def update_note_archived(
+async def update_note_archived(
     note_id: str, 
     archived: bool
 ) -> Dict[str, Any]:
@@ -394,12 +855,12 @@ def update_note_archived(
     Returns:
         Preview response showing old and new archived status
     """
-    keep_client = get_keep_client()
-    return keep_client.update_note_archived(note_id, archived)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.update_note_archived, note_id, archived)
 
 
 @mcp.tool
-def create_label(name: str) -> Dict[str, Any]:
+async def create_label(name: str) -> Dict[str, Any]:
     """Create new label (requires sync).
     
     Creates a new label locally. Must call sync_changes() to save to Google Keep.
@@ -410,12 +871,12 @@ def create_label(name: str) -> Dict[str, Any]:
     Returns:
         Preview response with label ID and name
     """
-    keep_client = get_keep_client()
-    return keep_client.create_label(name)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.create_label, name)
 
 
 @mcp.tool
-def add_label_to_note(
+async def add_label_to_note(
     note_id: str, 
     label_name: str
 ) -> Dict[str, Any]:
@@ -430,12 +891,12 @@ def add_label_to_note(
     Returns:
         Preview response with note title and updated labels
     """
-    keep_client = get_keep_client()
-    return keep_client.add_label_to_note(note_id, label_name)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.add_label_to_note, note_id, label_name)
 
 
 @mcp.tool
-def remove_label_from_note(
+async def remove_label_from_note(
     note_id: str, 
     label_name: str
 ) -> Dict[str, Any]:
@@ -450,8 +911,42 @@ def remove_label_from_note(
     Returns:
         Preview response with note title and updated labels
     """
-    keep_client = get_keep_client()
-    return keep_client.remove_label_from_note(note_id, label_name)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.remove_label_from_note, note_id, label_name)
+
+
+@mcp.tool
+async def batch_apply(
+    operations: List[Dict[str, Any]],
+    sync: bool = False
+) -> Dict[str, Any]:
+    """Apply many modifications in one call (requires sync unless sync=True).
+    
+    All operations are validated first; if any is invalid, nothing is
+    applied and the errors are listed by index. Valid batches are applied
+    in order.
+    
+    Operations (each an object with "op" plus arguments):
+        {"op": "check", "item_id": ...}, {"op": "uncheck", "item_id": ...}
+        {"op": "add_item", "list_id": ..., "text": ..., "checked": false}
+        {"op": "set_title", "note_id": ..., "title": ...}
+        {"op": "set_text", "note_id": ..., "text": ...}
+        {"op": "set_color", "note_id": ..., "color": ...}
+        {"op": "set_pinned", "note_id": ..., "pinned": true}
+        {"op": "set_archived", "note_id": ..., "archived": true}
+        {"op": "add_label", "note_id": ..., "label_name": ...}
+        {"op": "remove_label", "note_id": ..., "label_name": ...}
+        {"op": "trash", "note_id": ...}, {"op": "untrash", "note_id": ...}
+    
+    Args:
+        operations: List of operations to apply in order
+        sync: Sync to Google Keep after applying (default: False)
+        
+    Returns:
+        Combined preview with one result per operation
+    """
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.batch_apply, operations, sync)
 
 
 # ============================================================================
@@ -459,21 +954,29 @@ def remove_label_from_note(
 # ============================================================================
 
 @mcp.tool
-def sync_changes() -> Dict[str, Any]:
+async def sync_changes(wait: bool = True) -> Dict[str, Any]:
     """Sync all pending changes to Google Keep.
     
     Pushes all local modifications to Google Keep servers.
-    This is the ONLY way changes are saved.
+    This is the ONLY way changes are saved (unless auto-sync is enabled).
+    
+    Args:
+        wait: Wait for the sync to finish (default: True). With False, the
+            sync runs in the background and a job_id is returned right
+            away; check it with get_sync_job(). Other tools keep working
+            on the last synced notes meanwhile.
     
     Returns:
-        Confirmation with sync timestamp
+        Confirmation with sync timestamp, or a job handle when wait is False
     """
-    keep_client = get_keep_client()
-    return keep_client.sync_changes()
+    keep_client = await get_keep_client_async()
+    if not wait:
+        return keep_client.start_sync_job("sync")
+    return await run_blocking(keep_client.sync_changes)
 
 
 @mcp.tool
-def get_pending_changes() -> Dict[str, Any]:
+async def get_pending_changes() -> Dict[str, Any]:
     """Get preview of all pending changes before syncing.
     
     Shows what will be synced when sync_changes() is called.
@@ -481,22 +984,45 @@ def get_pending_changes() -> Dict[str, Any]:
     Returns:
         Structured preview of all pending changes
     """
-    keep_client = get_keep_client()
-    return keep_client.get_pending_changes()
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.get_pending_changes)
 
 
 @mcp.tool
-def refresh_notes() -> Dict[str, Any]:
+async def refresh_notes(wait: bool = True) -> Dict[str, Any]:
     """Refresh local cache from Google Keep server.
     
     Fetches latest data from Google Keep. If there are pending local
     changes, they will be synced during this operation.
     
+    Args:
+        wait: Wait for the refresh to finish (default: True). With False,
+            it runs in the background and a job_id is returned right away;
+            check it with get_sync_job().
+    
     Returns:
-        Confirmation message with timestamp
+        Confirmation message with timestamp, or a job handle when wait is False
     """
-    keep_client = get_keep_client()
-    return keep_client.refresh_from_server()
+    keep_client = await get_keep_client_async()
+    if not wait:
+        return keep_client.start_sync_job("refresh")
+    return await run_blocking(keep_client.refresh_from_server)
+
+
+@mcp.tool
+async def get_sync_job(job_id: Optional[str] = None) -> Dict[str, Any]:
+    """Check on a background sync or refresh started with wait=False.
+    
+    Args:
+        job_id: Job ID returned by sync_changes/refresh_notes (default:
+            the most recent job)
+    
+    Returns:
+        Job status ("running", "succeeded" or "failed"), elapsed time,
+        notes received so far, and the sync result once finished
+    """
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.get_sync_job, job_id)
 
 
 # ============================================================================
@@ -504,7 +1030,7 @@ def refresh_notes() -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool
-def get_note_media(note_id: str) -> Dict[str, Any]:
+async def get_note_media(note_id: str) -> Dict[str, Any]:
     """Get all media attachments from a note (read-only).
     
     Returns metadata for images, drawings, and audio clips attached to a note.
@@ -515,12 +1041,12 @@ def get_note_media(note_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary with media metadata including type, dimensions, and extracted text
     """
-    keep_client = get_keep_client()
-    return keep_client.get_note_media(note_id)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.get_note_media, note_id)
 
 
 @mcp.tool
-def get_media_link(note_id: str, blob_id: str) -> Dict[str, Any]:
+async def get_media_link(note_id: str, blob_id: str) -> Dict[str, Any]:
     """Get download URL for a media blob (read-only).
     
     Returns canonical URL for downloading the media file. Note that URLs
@@ -533,8 +1059,8 @@ def get_media_link(note_id: str, blob_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary with download URL and media metadata
     """
-    keep_client = get_keep_client()
-    return keep_client.get_media_link(note_id, blob_id)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.get_media_link, note_id, blob_id)
 
 
 # ============================================================================
@@ -542,7 +1068,7 @@ def get_media_link(note_id: str, blob_id: str) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool
-def trash_note(note_id: str) -> Dict[str, Any]:
+async def trash_note(note_id: str) -> Dict[str, Any]:
     """Move note to trash (requires sync, recoverable operation).
     
     This is a RECOVERABLE operation - trashed notes can be restored using
@@ -554,12 +1080,12 @@ def trash_note(note_id: str) -> Dict[str, Any]:
     Returns:
         Preview response showing old and new trashed status
     """
-    keep_client = get_keep_client()
-    return keep_client.trash_note(note_id)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.trash_note, note_id)
 
 
 @mcp.tool
-def untrash_note(note_id: str) -> Dict[str, Any]:
+async def untrash_note(note_id: str) -> Dict[str, Any]:
     """Restore note from trash (requires sync, recoverable operation).
     
     This RESTORES a trashed note back to active status. Changes are made
@@ -571,10 +1097,55 @@ def untrash_note(note_id: str) -> Dict[str, Any]:
     Returns:
         Preview response showing old and new trashed status
     """
-    keep_client = get_keep_client()
-    return keep_client.untrash_note(note_id)
+    keep_client = await get_keep_client_async()
+    return await run_blocking(keep_client.untrash_note, note_id)
+
+
+# ============================================================================
+# SERVER STATUS
+# ============================================================================
+
+@mcp.tool
+async def server_status() -> Dict[str, Any]:
+    """Get Keep Client readiness, warm-up timing, auto-sync and network health.
+    
+    Does not trigger initialization. Useful to check whether the first
+    tool call will have to wait for authentication and the initial sync.
+    
+    Returns:
+        Dictionary with readiness, in-flight state, warm-up duration,
+        remaining cool-down of a remembered login failure, access token
+        expiry and background refreshes, unsynced journal records, auto-sync statistics (when enabled), and the circuit breaker state
+        and retry counters for Google Keep calls
+    """
+    initializing = _init_done is not None and not _init_done.is_set()
+    
+    warmup_seconds = None
+    if _init_started_at is not None:
+        end = _init_finished_at if _init_finished_at is not None else time.monotonic()
+        warmup_seconds = round(end - _init_started_at, 3)
+    
+    failure_cooldown = _cached_failure_remaining()
+    
+    return {
+        "ready": _keep_client is not None,
+        "initializing": initializing,
+        "eager_init": EAGER_INIT,
+        "warmup_seconds": warmup_seconds,
+        "last_error": str(_init_error) if _init_error is not None else None,
+        "failure_cooldown_seconds": round(failure_cooldown, 3) if failure_cooldown is not None else None,
+        "auto_sync": _keep_client.auto_sync_status() if _keep_client is not None else {"enabled": AUTO_SYNC},
+        "google_keep_calls": _resilience.status(),
+        "access_token": _keep_client.token_status() if _keep_client is not None else None,
+        "journal": _keep_client.journal_status() if _keep_client is not None else None
+    }
 
 
 if __name__ == "__main__":
     logger.info("Starting wlater MCP server...")
-    mcp.run()
+    if EAGER_INIT:
+        start_warmup()
+    try:
+        mcp.run()
+    finally:
+        shutdown_keep_client()
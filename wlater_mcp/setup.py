@@ -1,7 +1,8 @@
 """Interactive setup script for wlater MCP server credentials.
 
 Guides users through credential storage using either automated selenium
-authentication or manual credential entry.
+authentication or manual credential entry. With --encrypted the master
+token is stored in an encrypted file instead of the OS keyring.
 """
 
 import sys
@@ -9,7 +10,9 @@ import os
 from pathlib import Path
 
 from wlater_mcp.credentials import (
+    TOKEN_KEY_ENV_VAR,
     store_credentials,
+    generate_token_key,
     validate_master_token,
     validate_android_id,
     generate_android_id,
@@ -25,6 +28,9 @@ def run_setup():
     print("=" * 60)
     print()
     
+    # Store the token in an encrypted file for machines without a keyring
+    encrypted = "--encrypted" in sys.argv[1:]
+    
     # Check if credentials already exist
     try:
         email, token, android_id = load_credentials()
@@ -42,17 +48,20 @@ def run_setup():
         print()
         print("Proceeding with reconfiguration...")
         print()
-    except (FileNotFoundError, ValueError, KeyError):
+    except (FileNotFoundError, ValueError, KeyError, TimeoutError):
         # No existing credentials, continue with setup
         pass
     
     print("This setup will store your Google Keep credentials securely.")
-    print("Master token will be stored in your OS keyring.")
+    if encrypted:
+        print("Master token will be stored encrypted in ~/.wlater_token.")
+    else:
+        print("Master token will be stored in your OS keyring.")
     print("Non-sensitive config will be saved to ~/.wlater")
     print()
     
     # Check if 'token' argument was passed for automated mode
-    if len(sys.argv) > 1 and sys.argv[1] == 'token':
+    if 'token' in sys.argv[1:]:
         # Automated mode - try to import selenium
         try:
             from wlater_mcp.selenium_auth import run_selenium_auth
@@ -144,18 +153,37 @@ def run_setup():
         print("❌ Invalid android_id. Must be 16 hexadecimal characters")
         return
     
+    # Reuse the key from the environment so existing MCP configs keep working
+    token_key = None
+    if encrypted:
+        try:
+            token_key = os.environ.get(TOKEN_KEY_ENV_VAR) or generate_token_key()
+        except ImportError as e:
+            print(f"❌ {e}")
+            return
+    
     # Store credentials
     try:
-        store_credentials(email, token, android_id)
+        store_credentials(email, token, android_id, token_key=token_key)
         print()
         print("=" * 60)
         print("✓ Setup complete!")
         print("=" * 60)
         print()
-        print(f"✓ Master token stored in OS keyring")
+        if encrypted:
+            print(f"✓ Master token stored encrypted in ~/.wlater_token")
+        else:
+            print(f"✓ Master token stored in OS keyring")
         print(f"✓ Config saved to ~/.wlater")
         print()
         
+        if encrypted:
+            print("The server needs the key to decrypt the token. Add it to the")
+            print('"env" block of the wlater entry in your mcp.json:')
+            print()
+            print(f'     "env": {{"{TOKEN_KEY_ENV_VAR}": "{token_key}"}}')
+            print()
+        
         print("Next steps:")
         print("  1. Add wlater-mcp to your mcp.json:")
         print()
@@ -0,0 +1,122 @@
+"""On-disk snapshot of the Google Keep node tree.
+
+Stores the serialized gkeepapi state (``Keep.dump()``) after each successful
+sync so the next process start can restore it and only fetch the server
+delta since the stored version instead of the whole account.
+
+File layout: a single JSON header line followed by the state JSON. The
+header carries the format version, account email, save time and a SHA-256
+checksum of the state body used to detect truncated or corrupted files.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger("wlater")
+
+STATE_FORMAT_VERSION = 1
+
+# Snapshots older than this are treated as stale and trigger a full sync
+MAX_STATE_AGE_SECONDS = 7 * 24 * 60 * 60
+
+
+def get_state_path() -> Path:
+    """Return path to the .wlater_state snapshot file in user's home directory."""
+    return Path.home() / ".wlater_state"
+
+
+def save_state(email: str, state: Dict[str, Any]) -> None:
+    """Write a state snapshot atomically.
+
+    Args:
+        email: Account the state belongs to
+        state: Serialized state from gkeepapi ``Keep.dump()``
+    """
+    body = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    header = {
+        "format_version": STATE_FORMAT_VERSION,
+        "email": email,
+        "saved_at": time.time(),
+        "sha256": hashlib.sha256(body).hexdigest()
+    }
+
+    state_path = get_state_path()
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+
+    # Note contents are private, keep the snapshot readable by the owner only
+    fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(str(tmp_path), str(state_path))
+
+
+def load_state(
+    email: str,
+    max_age: float = MAX_STATE_AGE_SECONDS
+) -> Optional[Dict[str, Any]]:
+    """Load a state snapshot if it is present, intact and fresh.
+
+    Args:
+        email: Account the state must belong to
+        max_age: Maximum snapshot age in seconds
+
+    Returns:
+        Serialized state for gkeepapi ``Keep.restore()``, or None if the
+        snapshot is missing, unreadable, corrupted, stale or belongs to a
+        different account
+    """
+    state_path = get_state_path()
+
+    if not state_path.exists():
+        return None
+
+    try:
+        with open(state_path, "rb") as f:
+            header = json.loads(f.readline())
+            body = f.read()
+
+        if header.get("format_version") != STATE_FORMAT_VERSION:
+            logger.info("Ignoring state snapshot with unsupported format version")
+            return None
+
+        if header.get("email") != email:
+            logger.info("Ignoring state snapshot for a different account")
+            return None
+
+        if hashlib.sha256(body).hexdigest() != header.get("sha256"):
+            logger.warning("State snapshot checksum mismatch, falling back to full sync")
+            return None
+
+        age = time.time() - float(header.get("saved_at", 0))
+        if age > max_age:
+            logger.info(f"State snapshot is stale ({int(age)}s old), falling back to full sync")
+            return None
+
+        state = json.loads(body)
+
+        if not isinstance(state, dict) or not {"keep_version", "labels", "nodes"} <= state.keys():
+            logger.warning("State snapshot is missing required fields, falling back to full sync")
+            return None
+
+        return state
+    except Exception as e:
+        logger.warning(f"Failed to read state snapshot: {e}")
+        return None
+
+
+def clear_state() -> None:
+    """Delete the state snapshot if it exists."""
+    try:
+        get_state_path().unlink()
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,402 @@
+"""Cache of the short-lived Google Keep OAuth access token.
+
+Authenticating exchanges the master token for an OAuth access token with a
+network round trip to Google. The access token stays valid for about an
+hour, so it is cached and reused by the next process start while it is
+still valid. A background refresher renews it shortly before it expires,
+so no tool call has to wait for a token exchange mid-session.
+
+The token is stored wherever setup put the master token: in the OS keyring,
+or encrypted in ~/.wlater_oauth with the WLATER_TOKEN_KEY key when setup
+used --encrypted. When the master token comes from WLATER_MASTER_TOKEN
+instead, there is no secret store to use and the access token is only
+kept in memory.
+
+The cached token is bound to the account, device ID and a hash of the
+master token; replacing the credentials invalidates it. The master token
+itself is never written.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import gkeepapi
+
+try:
+    import gpsoauth
+except ImportError:
+    raise ImportError(
+        "gpsoauth is required (installed with gkeepapi). Install it with: pip install gpsoauth"
+    )
+
+try:
+    from keyring.errors import PasswordDeleteError
+except ImportError:
+    raise ImportError(
+        "keyring is required. Install it with: pip install keyring"
+    )
+
+from wlater_mcp.credentials import (
+    DEFAULT_KEYRING_TIMEOUT_SECONDS,
+    TOKEN_ENV_VAR,
+    TOKEN_KEY_ENV_VAR,
+    _import_fernet,
+    call_keyring,
+    get_config_path
+)
+
+
+logger = logging.getLogger("wlater")
+
+TOKEN_FORMAT_VERSION = 1
+
+# Keyring service the access token is stored under (account: the email)
+KEYRING_SERVICE_NAME = "google-keep-oauth"
+
+# Renew the access token this long before it expires, and don't reuse a
+# cached one with less time left
+REFRESH_MARGIN_SECONDS = 300.0
+
+# Wait this long before retrying a failed background refresh
+REFRESH_RETRY_SECONDS = 60.0
+
+# Identity gkeepapi presents to Google when exchanging the master token
+KEEP_APP = "com.google.android.keep"
+KEEP_CLIENT_SIG = "38918a453d07199354f8b19af05ec6562ced5788"
+
+
+def get_token_cache_path() -> Path:
+    """Return path to the encrypted .wlater_oauth token cache in user's home directory."""
+    return Path.home() / ".wlater_oauth"
+
+
+def get_token_store() -> Optional[str]:
+    """Return where the access token is cached, matching the master token's store.
+
+    Returns:
+        "keyring", "encrypted_file", or None if the token must not be
+        written anywhere (master token from the environment, no setup, or
+        no key for the encrypted file)
+    """
+    if os.environ.get(TOKEN_ENV_VAR, "").strip():
+        return None
+
+    try:
+        config = json.loads(get_config_path().read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(config, dict):
+        return None
+    if config.get("token_store") == "encrypted_file":
+        return "encrypted_file" if os.environ.get(TOKEN_KEY_ENV_VAR, "").strip() else None
+    return "keyring"
+
+
+def _fernet() -> Any:
+    """Return the cipher for the encrypted token cache."""
+    key = os.environ.get(TOKEN_KEY_ENV_VAR, "").strip()
+    return _import_fernet()(key.encode("utf-8"))
+
+
+def _credentials_key(email: str, master_token: str, device_id: str, scopes: str) -> str:
+    """Hash identifying the credentials a cached token was issued for."""
+    material = "\n".join((email, master_token, device_id, scopes))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _read_cached(email: str, store: str, keyring_timeout: float) -> Optional[str]:
+    """Return the serialized cache entry from the given store, or None."""
+    if store == "keyring":
+        return call_keyring("get_password", KEYRING_SERVICE_NAME, email, timeout=keyring_timeout)
+
+    try:
+        encrypted = get_token_cache_path().read_bytes()
+    except FileNotFoundError:
+        return None
+    try:
+        return _fernet().decrypt(encrypted).decode("utf-8")
+    except Exception:
+        raise ValueError(f"{TOKEN_KEY_ENV_VAR} is not the key it was encrypted with")
+
+
+def load_token(
+    email: str,
+    master_token: str,
+    device_id: str,
+    scopes: str,
+    keyring_timeout: float = DEFAULT_KEYRING_TIMEOUT_SECONDS
+) -> Optional[Tuple[str, float]]:
+    """Return a cached access token if it is still valid for these credentials.
+
+    Args:
+        email: Account the token was issued for
+        master_token: Master token it was exchanged from
+        device_id: Android ID used for the exchange
+        scopes: OAuth scopes requested
+        keyring_timeout: Seconds to wait for the OS keyring backend
+
+    Returns:
+        Tuple of (access token, expiry as epoch seconds), or None if there
+        is no usable cached token
+    """
+    store = get_token_store()
+    if store is None:
+        return None
+
+    try:
+        raw = _read_cached(email, store, keyring_timeout)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable token cache: {e}")
+        return None
+
+    if (not isinstance(data, dict)
+            or data.get("format_version") != TOKEN_FORMAT_VERSION
+            or data.get("key") != _credentials_key(email, master_token, device_id, scopes)):
+        return None
+
+    token = data.get("auth_token")
+    expires_at = data.get("expires_at")
+    if not isinstance(token, str) or not isinstance(expires_at, (int, float)):
+        return None
+    if expires_at - REFRESH_MARGIN_SECONDS <= time.time():
+        return None
+
+    return (token, float(expires_at))
+
+
+def save_token(
+    email: str,
+    master_token: str,
+    device_id: str,
+    scopes: str,
+    auth_token: str,
+    expires_at: float,
+    keyring_timeout: float = DEFAULT_KEYRING_TIMEOUT_SECONDS
+) -> None:
+    """Store an access token in the keyring or the encrypted token cache.
+
+    Does nothing when get_token_store() finds no secret store to use.
+
+    Args:
+        email: Account the token was issued for
+        master_token: Master token it was exchanged from (only its hash is stored)
+        device_id: Android ID used for the exchange
+        scopes: OAuth scopes requested
+        auth_token: Access token
+        expires_at: Expiry as epoch seconds
+        keyring_timeout: Seconds to wait for the OS keyring backend
+
+    Raises:
+        TimeoutError: If the keyring does not answer in time
+    """
+    store = get_token_store()
+    if store is None:
+        return
+
+    data = json.dumps({
+        "format_version": TOKEN_FORMAT_VERSION,
+        "key": _credentials_key(email, master_token, device_id, scopes),
+        "auth_token": auth_token,
+        "expires_at": expires_at
+    })
+
+    if store == "keyring":
+        call_keyring("set_password", KEYRING_SERVICE_NAME, email, data, timeout=keyring_timeout)
+        # Don't leave a token file from an earlier encrypted setup behind
+        clear_token()
+        return
+
+    cache_path = get_token_cache_path()
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+
+    fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(_fernet().encrypt(data.encode("utf-8")))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(str(tmp_path), str(cache_path))
+
+
+def clear_token(email: Optional[str] = None, keyring_timeout: float = DEFAULT_KEYRING_TIMEOUT_SECONDS) -> None:
+    """Delete the cached access token.
+
+    Args:
+        email: Also remove this account's token from the keyring
+        keyring_timeout: Seconds to wait for the OS keyring backend
+    """
+    try:
+        get_token_cache_path().unlink()
+    except FileNotFoundError:
+        pass
+
+    if email is not None:
+        try:
+            call_keyring("delete_password", KEYRING_SERVICE_NAME, email, timeout=keyring_timeout)
+        except PasswordDeleteError:
+            pass
+
+
+class CachingAuth(gkeepapi.APIAuth):
+    """gkeepapi authentication that reuses and persists the access token.
+
+    load() takes a still-valid token from the cache instead of contacting
+    Google. refresh() performs the token exchange itself (rather than
+    through gkeepapi) to learn the token's expiry, and stores the result.
+    """
+
+    def __init__(self, scopes: str, keyring_timeout: float = DEFAULT_KEYRING_TIMEOUT_SECONDS):
+        super().__init__(scopes)
+        # Expiry of the current access token (epoch seconds), None if unknown
+        self.expires_at: Optional[float] = None
+        self._keyring_timeout = keyring_timeout
+        self._refresh_lock = threading.Lock()
+
+    def load(self, email: str, master_token: str, device_id: str, reuse_cached: bool = True) -> bool:
+        """Authenticate, reusing a cached access token when possible.
+
+        Args:
+            email: The account to use
+            master_token: The master token
+            device_id: Android ID for this client
+            reuse_cached: Use a valid cached token instead of exchanging
+
+        Raises:
+            LoginException: If the token exchange fails
+        """
+        self._email = email
+        self._device_id = device_id
+        self._master_token = master_token
+
+        if reuse_cached:
+            cached = load_token(email, master_token, device_id, self._scopes, self._keyring_timeout)
+            if cached is not None:
+                self._auth_token, self.expires_at = cached
+                logger.info(f"Reusing cached access token ({(self.expires_at - time.time()) / 60:.0f} min left)")
+                return True
+
+        self.refresh()
+        return True
+
+    def refresh(self) -> str:
+        """Exchange the master token for a new access token and cache it.
+
+        Returns:
+            The access token
+
+        Raises:
+            LoginException: If Google did not return a token
+        """
+        with self._refresh_lock:
+            res = gpsoauth.perform_oauth(
+                self._email,
+                self._master_token,
+                self._device_id,
+                service=self._scopes,
+                app=KEEP_APP,
+                client_sig=KEEP_CLIENT_SIG,
+            )
+            if "Auth" not in res:
+                raise gkeepapi.exception.LoginException(res.get("Error"))
+
+            self._auth_token = auth_token = res["Auth"]
+            try:
+                self.expires_at = expires_at = float(res["Expiry"])
+            except (KeyError, TypeError, ValueError):
+                self.expires_at = expires_at = None
+
+        # Caching is best-effort and may wait on the keyring; the new token
+        # is already in use
+        if expires_at is not None:
+            try:
+                save_token(
+                    self._email, self._master_token, self._device_id, self._scopes,
+                    auth_token, expires_at, self._keyring_timeout
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache access token: {e}")
+
+        return auth_token
+
+
+class TokenRefresher:
+    """Renew an access token in the background before it expires.
+
+    Runs on a daemon thread that sleeps until REFRESH_MARGIN_SECONDS before
+    the token's expiry, then calls the refresh callback. Failed refreshes
+    are retried after REFRESH_RETRY_SECONDS; if they keep failing, the
+    token expires and the next request refreshes it on demand as before.
+    """
+
+    def __init__(self, auth: CachingAuth, refresh: Callable[[], Any]):
+        """Create an idle refresher; call start() to begin.
+
+        Args:
+            auth: Authentication whose expires_at is watched
+            refresh: Callable that refreshes auth and raises on failure
+        """
+        self._auth = auth
+        self._refresh = refresh
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._refreshes = 0
+        self._failures = 0
+        self._last_error: Optional[str] = None
+
+    def start(self) -> None:
+        """Start the background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="wlater-token-refresh", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Background loop: sleep until the token is due, then refresh it."""
+        # Space attempts out even if a fresh token is already due
+        not_before = 0.0
+        while True:
+            expires_at = self._auth.expires_at
+            if expires_at is None:
+                # Expiry unknown: leave it to on-demand refreshes
+                return
+
+            due = max(expires_at - REFRESH_MARGIN_SECONDS, not_before)
+            if self._stop.wait(max(0.0, due - time.time())):
+                return
+
+            not_before = time.time() + REFRESH_RETRY_SECONDS
+            try:
+                self._refresh()
+                self._refreshes += 1
+                logger.info("Refreshed access token in the background")
+            except Exception as e:
+                self._failures += 1
+                self._last_error = str(e)
+                logger.warning(f"Background token refresh failed, retrying in {REFRESH_RETRY_SECONDS:g}s: {e}")
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def status(self) -> Dict[str, Any]:
+        """Return token expiry and refresh statistics."""
+        expires_at = self._auth.expires_at
+        return {
+            "expires_in_seconds": round(expires_at - time.time(), 3) if expires_at is not None else None,
+            "background_refreshes": self._refreshes,
+            "failures": self._failures,
+            "last_error": self._last_error
+        }